@@ -0,0 +1,228 @@
+"""
+Batch entry point: generate interview questions for a directory of resumes.
+
+Usage:
+    python batch.py test/ --workers 4 --output data/batch/results.jsonl
+    python batch.py "resumes/**/*.pdf" --workers 8
+
+Resumes are submitted to the job service (src/service/server.py), which
+bounds how many run at once. ``--workers`` caps how many jobs this batch
+keeps in flight; a service started in-process for the batch (when none is
+running) gets that many workers, while a running service keeps its own
+`service.workers`, which then caps the real concurrency. A full queue is
+waited out rather than treated as a failure.
+
+One JSONL record is appended per candidate as soon as it finishes.
+Re-running with the same output file skips resumes that already have a
+record, so an interrupted drive can simply be restarted. Each resume
+gets a stable job ID, so a job still queued or running in the service
+is picked up again instead of being submitted twice.
+"""
+
+import argparse
+import asyncio
+import glob
+import hashlib
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Set
+
+from config.settings import settings
+from src.service.client import JobServiceClient, get_service_client
+
+
+DEFAULT_OUTPUT = "data/batch/results.jsonl"
+
+
+# -------------------------------
+# INPUT DISCOVERY
+# -------------------------------
+def discover_resumes(source: str) -> List[Path]:
+    """Expand a directory or glob pattern into supported resume files."""
+    formats = {f".{ext.lower()}" for ext in settings.get("resume.supported_formats", [])}
+
+    path = Path(source)
+    if path.is_dir():
+        candidates = path.rglob("*")
+    else:
+        candidates = (Path(p) for p in glob.glob(source, recursive=True))
+
+    return sorted(
+        p.resolve() for p in candidates
+        if p.is_file() and p.suffix.lower() in formats
+    )
+
+
+def load_completed(output_path: Path, retry_failed: bool) -> Set[str]:
+    """Resume paths that already have a record in the output file."""
+    done = set()
+    if not output_path.exists():
+        return done
+
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Partial line from an interrupted run
+                continue
+
+            if retry_failed and record.get("status") != "completed":
+                continue
+            done.add(record["resume_path"])
+
+    return done
+
+
+# -------------------------------
+# RUN
+# -------------------------------
+def batch_run_id(output_path: Path, resume_path: Path) -> str:
+    """Run ID that is the same every time this batch processes this resume."""
+    key = f"{output_path.resolve()}\n{resume_path}".encode("utf-8")
+    return "batch-" + hashlib.sha256(key).hexdigest()[:16]
+
+
+def to_record(resume_path: Path, result: Dict, elapsed: float) -> Dict:
+    candidate = dict(result.get("candidate_info") or {})
+    candidate.pop("raw_text", None)
+
+    return {
+        "resume_path": str(resume_path),
+        "run_id": result.get("run_id", ""),
+        "status": result.get("status"),
+        "error": result.get("error", ""),
+        "elapsed_seconds": round(elapsed, 3),
+        "candidate_info": candidate,
+        "questions": result.get("questions", []),
+    }
+
+
+def effective_workers(client: JobServiceClient, workers: int) -> int:
+    """Resumes that actually run at once: the service's worker pool caps ``workers``."""
+    service_workers = client.health().get("workers", workers)
+    if service_workers < workers:
+        print(
+            f"The job service runs {service_workers} jobs at once; the other "
+            f"{workers - service_workers} of --workers {workers} wait in its queue"
+        )
+    return min(workers, service_workers)
+
+
+def run_job(client: JobServiceClient, resume_path: Path, job_id: str) -> Dict:
+    """Submit one resume (waiting while the queue is full) and wait for its result."""
+    job = client.submit_with_backoff(lambda: client.submit_path(str(resume_path), job_id=job_id))
+    result = client.wait(job["job_id"])
+    return {**result, "run_id": result["job_id"]}
+
+
+async def run_batch(
+    client: JobServiceClient,
+    resumes: List[Path],
+    output_path: Path,
+    workers: int,
+) -> List[Dict]:
+    loop = asyncio.get_running_loop()
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch")
+
+    async def process(resume_path: Path) -> Dict:
+        start = time.perf_counter()
+        try:
+            result = await loop.run_in_executor(
+                pool, run_job, client, resume_path, batch_run_id(output_path, resume_path)
+            )
+        except Exception as e:
+            result = {"status": "failed", "error": str(e)}
+        return to_record(resume_path, result, time.perf_counter() - start)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    records = []
+
+    with open(output_path, "a+", encoding="utf-8") as out:
+        # Make sure a truncated last line from an interrupted run is terminated
+        if out.tell() > 0:
+            out.seek(out.tell() - 1)
+            if out.read(1) != "\n":
+                out.write("\n")
+
+        tasks = [asyncio.create_task(process(p)) for p in resumes]
+        for finished in asyncio.as_completed(tasks):
+            record = await finished
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            records.append(record)
+
+            print(
+                f"[{len(records)}/{len(resumes)}] {record['status']:<9} "
+                f"{record['elapsed_seconds']:>7.2f}s  {record['resume_path']}"
+            )
+
+    pool.shutdown()
+    return records
+
+
+# -------------------------------
+# SUMMARY
+# -------------------------------
+def print_summary(records: List[Dict], skipped: int, wall_seconds: float) -> None:
+    latencies = sorted(r["elapsed_seconds"] for r in records)
+    completed = sum(1 for r in records if r["status"] == "completed")
+
+    print("\n===== BATCH SUMMARY =====")
+    print(f"Processed:  {len(records)} ({completed} completed, {len(records) - completed} failed)")
+    print(f"Skipped:    {skipped} (already in output)")
+    print(f"Wall time:  {wall_seconds:.2f}s")
+
+    if not latencies:
+        return
+
+    p95 = latencies[min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))]
+    print(f"Throughput: {len(records) / wall_seconds * 60:.1f} resumes/min")
+    print(
+        f"Latency:    p50={statistics.median(latencies):.2f}s "
+        f"p95={p95:.2f}s max={latencies[-1]:.2f}s"
+    )
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate interview questions for many resumes")
+    parser.add_argument("source", help="Directory or glob pattern of resumes")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="JSONL output file")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="Jobs kept in flight")
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Re-run resumes whose previous record failed",
+    )
+    args = parser.parse_args(argv)
+
+    resumes = discover_resumes(args.source)
+    if not resumes:
+        print(f"No supported resumes found for: {args.source}")
+        return 1
+
+    output_path = Path(args.output)
+    done = load_completed(output_path, args.retry_failed)
+    pending = [p for p in resumes if str(p) not in done]
+    skipped = len(resumes) - len(pending)
+
+    print(f"Found {len(resumes)} resumes, {len(pending)} to process, {skipped} skipped")
+
+    start = time.perf_counter()
+    records = []
+    if pending:
+        workers = max(1, args.workers)
+        client = get_service_client(workers=workers)
+        print(f"Running up to {effective_workers(client, workers)} resumes at once")
+        records = asyncio.run(run_batch(client, pending, output_path, workers))
+
+    print_summary(records, skipped, time.perf_counter() - start)
+    return 0 if all(r["status"] == "completed" for r in records) else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
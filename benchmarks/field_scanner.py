@@ -0,0 +1,132 @@
+"""
+Micro-benchmark: single-pass field scanner vs the previous per-field regexes.
+
+Usage:
+    python -m benchmarks.field_scanner [resume_dir] [--repeat N]
+"""
+
+import argparse
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.parsers.field_scanner import scan_fields
+from src.parsers.pdf_backends import extract_pdf_text, get_pdf_backend
+
+
+def legacy_fields(text: str) -> dict:
+    """The per-call extraction ResumeParser used before the scanner."""
+    email = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    phone = re.search(r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
+    linkedin = re.search(r'linkedin\.com/in/[\w-]+', text, re.IGNORECASE)
+    github = re.search(r'(https?://)?(www\.)?github\.com/[A-Za-z0-9_-]+', text, re.IGNORECASE)
+    github_url = None
+    if github:
+        github_url = github.group() if github.group().startswith("http") else f"https://{github.group()}"
+
+    portfolio = None
+    for url in re.findall(r'(https?://[^\s]+)', text):
+        if not any(b in url.lower() for b in ["linkedin.com", "github.com"]):
+            portfolio = url
+            break
+
+    month_map = {
+        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+    }
+    pattern = re.compile(
+        r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+(\d{4})\s*[-–]\s*'
+        r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+(\d{4})',
+        re.IGNORECASE
+    )
+    calculated = 0
+    for m1, y1, m2, y2 in pattern.findall(text):
+        start = datetime(int(y1), month_map[m1.lower()], 1)
+        end = datetime(int(y2), month_map[m2.lower()], 1)
+        calculated += max((end.year - start.year) * 12 + (end.month - start.month), 0)
+
+    mention = re.search(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience', text, re.IGNORECASE)
+    mentioned = int(mention.group(1)) * 12 if mention else 0
+    valid = [m for m in [calculated, mentioned] if m > 0]
+    years, months = divmod(min(valid), 12) if valid else (0, 0)
+
+    keywords = [
+        "bachelor", "master", "phd", "mba", "b.tech", "m.tech",
+        "b.sc", "m.sc", "university", "college", "degree"
+    ]
+    lines = [l.strip() for l in text.split("\n") if l.strip()]
+
+    return {
+        "name": lines[0] if lines else None,
+        "email": email[0] if email else None,
+        "phone": phone.group() if phone else None,
+        "linkedin_url": f"https://{linkedin.group()}" if linkedin else None,
+        "github_url": github_url,
+        "portfolio_url": portfolio,
+        "experience": f"{years} years {months} months",
+        "education": [
+            line.strip() for line in text.split("\n")
+            if any(k in line.lower() for k in keywords)
+        ],
+    }
+
+
+def load_texts(resume_dir: Path):
+    backend = get_pdf_backend()
+    texts = {}
+    for path in sorted(resume_dir.iterdir()):
+        if path.suffix.lower() == ".pdf":
+            text = extract_pdf_text(path, backend)
+        elif path.suffix.lower() == ".txt":
+            text = path.read_text(encoding="utf-8")
+        else:
+            continue
+        if text.strip():
+            texts[path.name] = text
+    return texts
+
+
+def time_per_call(func, text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark deterministic field extraction")
+    parser.add_argument("resume_dir", nargs="?", default="test")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    texts = load_texts(Path(args.resume_dir))
+    if not texts:
+        print(f"No extractable resumes in {args.resume_dir}")
+        return
+
+    print(f"{'file':<45} {'legacy us':>10} {'scanner us':>11} {'speedup':>8}  diff")
+    total_legacy = total_scanner = 0.0
+
+    for name, text in texts.items():
+        legacy = time_per_call(legacy_fields, text, args.repeat)
+        scanner = time_per_call(scan_fields, text, args.repeat)
+        total_legacy += legacy
+        total_scanner += scanner
+
+        old, new = legacy_fields(text), scan_fields(text)
+        diff = ", ".join(k for k in old if old[k] != new[k]) or "-"
+
+        print(
+            f"{name[:45]:<45} {legacy * 1e6:>10.1f} {scanner * 1e6:>11.1f} "
+            f"{legacy / scanner:>7.2f}x  {diff}"
+        )
+
+    print(
+        f"{'TOTAL':<45} {total_legacy * 1e6:>10.1f} {total_scanner * 1e6:>11.1f} "
+        f"{total_legacy / total_scanner:>7.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
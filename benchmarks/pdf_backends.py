@@ -0,0 +1,52 @@
+"""
+Compare PDF extraction backends on the bundled resumes.
+
+Usage:
+    python -m benchmarks.pdf_backends [pdf_dir] [--repeat N] [--threshold PAGES]
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from src.parsers.pdf_backends import available_backends, extract_pdf_text, get_pdf_backend
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction backends")
+    parser.add_argument("pdf_dir", nargs="?", default="test")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=int, default=8, help="Parallel page threshold")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    pdfs = sorted(Path(args.pdf_dir).glob("*.pdf"))
+    if not pdfs:
+        print(f"No PDFs found in {args.pdf_dir}")
+        return
+
+    print(f"{'backend':<12} {'file':<45} {'pages':>5} {'chars':>7} {'median ms':>10}")
+    for name in available_backends():
+        backend = get_pdf_backend(name)
+        totals = []
+
+        for pdf in pdfs:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                text = extract_pdf_text(pdf, backend, args.threshold, args.workers)
+                timings.append(time.perf_counter() - start)
+
+            median = statistics.median(timings)
+            totals.append(median)
+            print(
+                f"{name:<12} {pdf.name[:45]:<45} {backend.page_count(pdf):>5} "
+                f"{len(text):>7} {median * 1000:>10.1f}"
+            )
+
+        print(f"{name:<12} {'TOTAL':<45} {'':>5} {'':>7} {sum(totals) * 1000:>10.1f}\n")
+
+
+if __name__ == "__main__":
+    main()
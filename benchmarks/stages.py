@@ -0,0 +1,267 @@
+"""
+Stage-level benchmark over the bundled resumes, with a regression gate.
+
+Each stage is timed over the whole corpus per iteration. The fastest
+iteration (least disturbed by other load) is compared against a stored
+baseline, and the run fails when any stage is slower by more than the
+threshold. LLM calls go to the
+offline fake provider (no latency) so only our own code is measured.
+
+Usage:
+    python -m benchmarks.stages [resume_dir] [--repeat N] [--threshold 0.25]
+    python -m benchmarks.stages --update-baseline
+
+Baselines are machine-specific: refresh them with --update-baseline on
+the machine that runs the comparison, and commit the refreshed
+benchmarks/baseline.json together with any change that is meant to
+alter a benchmarked stage (parsing, skills, prompts, question parsing
+or the agent run), so the gate keeps comparing like with like.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from config.settings import settings
+
+
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+DEFAULT_OUTPUT = "data/benchmarks/stages.json"
+
+
+def use_offline_llm() -> None:
+    """
+    Route LLM calls to the instant fake provider and turn off everything
+    that reuses or persists results.
+
+    Otherwise repeated agent runs short-circuit (parse and question
+    caches, near-duplicate reuse) instead of running the full pipeline,
+    and the fake questions land in the results store, checkpoints and,
+    from there, the question bank.
+    """
+    settings.config["llm"]["provider"] = "fake"
+    settings.config["llm"]["fake"] = {"mode": "canned", "latency_seconds": 0, "tokens_per_second": None}
+    settings.config.setdefault("cache", {})
+    settings.config["cache"]["parse"] = {"enabled": False}
+    settings.config["cache"]["questions"] = {"enabled": False}
+    settings.config["cache"]["near_duplicates"] = {"enabled": False}
+    settings.config.setdefault("output", {})["save_interviews"] = False
+    settings.config["checkpoint"] = {"enabled": False}
+    settings.config.setdefault("question_bank", {})["include_generated"] = False
+
+
+def time_stage(func: Callable[[], None], repeat: int, warmup: int = 1) -> Dict[str, float]:
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    p95 = samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))]
+    return {
+        "median_ms": round(statistics.median(samples) * 1e3, 4),
+        "p95_ms": round(p95 * 1e3, 4),
+        "min_ms": round(samples[0] * 1e3, 4),
+        "repeat": repeat,
+    }
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Time a fixed pure-Python workload, as a machine-speed reference."""
+    def workload():
+        total = 0
+        for i in range(200_000):
+            total += i % 7
+        "".join(str(i) for i in range(20_000)).split("1")
+
+    return time_stage(workload, repeat)["min_ms"]
+
+
+def run_stages(resume_dir: Path, repeat: int, agent_repeat: int) -> Dict:
+    # Imported after use_offline_llm() so components pick up the fake provider
+    from src.agent.interview_agent import InterviewAgent
+    from src.parsers.document import load_document
+    from src.parsers.section_segmenter import segment_sections
+
+    agent = InterviewAgent()
+    parser = agent.resume_parser
+    generator = agent.question_generator
+
+    formats = {f".{ext.lower()}" for ext in settings.get("resume.supported_formats", [])}
+    paths, texts = [], []
+    for path in sorted(resume_dir.iterdir()):
+        if path.suffix.lower() not in formats:
+            continue
+        try:
+            text = parser._extract_text(load_document(path))
+        except Exception:
+            # Image-only PDFs need OCR, which is not enabled
+            continue
+        if text.strip():
+            paths.append(path)
+            texts.append(text)
+
+    if not paths:
+        raise SystemExit(f"No extractable resumes in {resume_dir}")
+
+    profiles = [
+        {**parser._extract_fields(text), "skills": parser.skill_matcher.find(text)}
+        for text in texts
+    ]
+    difficulty = generator._determine_difficulty(0)
+    prompts = [
+        generator._create_question_prompt(p, "Software Engineer", difficulty, generator.max_questions)
+        for p in profiles
+    ]
+    responses = [generator.llm.invoke(prompt).content for prompt in prompts]
+
+    stages: Dict[str, Callable[[], None]] = {
+        "extract_text": lambda: [parser._extract_text(load_document(p)) for p in paths],
+        "regex_fields": lambda: [parser._extract_fields(t) for t in texts],
+        "segment_sections": lambda: [segment_sections(t) for t in texts],
+        "match_skills": lambda: [parser.skill_matcher.find(t) for t in texts],
+        "question_prompt": lambda: [
+            generator._create_question_prompt(p, "Software Engineer", difficulty, generator.max_questions)
+            for p in profiles
+        ],
+        "parse_questions": lambda: [generator._parse_questions(r) for r in responses],
+        "agent_run": lambda: [agent.run(str(p)) for p in paths],
+    }
+
+    results = {}
+    for name, func in stages.items():
+        # Calibrate next to each stage: shared machines drift during a run
+        calibration = calibrate()
+        results[name] = time_stage(func, agent_repeat if name == "agent_run" else repeat)
+        results[name]["per_resume_ms"] = round(results[name]["median_ms"] / len(paths), 4)
+        results[name]["calibration_ms"] = calibration
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "resumes": [p.name for p in paths],
+        },
+        "stages": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float, min_delta_ms: float) -> List[str]:
+    """
+    Stages whose best time regressed beyond both the relative and absolute limits.
+
+    Baseline timings are first scaled by the ratio of the calibration
+    timings taken next to the stage, so a uniformly slower machine is not
+    a regression.
+    """
+    regressions = []
+
+    for name, stats in current["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base:
+            continue
+
+        expected = base["min_ms"] * machine_scale(stats, base)
+        delta = stats["min_ms"] - expected
+        if delta > min_delta_ms and stats["min_ms"] > expected * (1 + threshold):
+            regressions.append(
+                f"{name}: {expected:.3f} ms -> {stats['min_ms']:.3f} ms "
+                f"(+{delta / expected * 100:.0f}%)"
+            )
+    return regressions
+
+
+def machine_scale(stats: Dict, base: Dict) -> float:
+    cal, base_cal = stats.get("calibration_ms"), base.get("calibration_ms")
+    return cal / base_cal if cal and base_cal else 1.0
+
+
+def print_report(current: Dict, baseline: Dict) -> None:
+    print(
+        f"{'stage':<18} {'median ms':>10} {'p95 ms':>10} {'min ms':>10} "
+        f"{'baseline':>10} {'change':>8}"
+    )
+    for name, stats in current["stages"].items():
+        # Baseline column is scaled to this run's machine speed
+        base = baseline.get("stages", {}).get(name)
+        expected = base["min_ms"] * machine_scale(stats, base) if base else float("nan")
+        change = ""
+        if base and base["min_ms"]:
+            change = f"{(stats['min_ms'] / expected - 1) * 100:+.0f}%"
+        print(
+            f"{name:<18} {stats['median_ms']:>10.3f} {stats['p95_ms']:>10.3f} "
+            f"{stats['min_ms']:>10.3f} {expected:>10.3f} {change:>8}"
+        )
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pipeline stages against a baseline")
+    parser.add_argument("resume_dir", nargs="?", default="test")
+    parser.add_argument("--repeat", type=int, default=20, help="Iterations per stage")
+    parser.add_argument("--agent-repeat", type=int, default=3, help="Iterations of the full agent run")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="JSON results file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.5,
+        help="Ignore slowdowns smaller than this (timer noise on fast stages)",
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="Store results as the baseline")
+    args = parser.parse_args(argv)
+
+    use_offline_llm()
+    logging.disable(logging.WARNING)
+    try:
+        current = run_stages(Path(args.resume_dir), args.repeat, args.agent_repeat)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(current, indent=2), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline updated: {baseline_path}")
+
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+
+    print_report(current, baseline)
+    print(f"\nResults written to {output_path}")
+
+    if not baseline:
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+        return 0
+
+    regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f"\nREGRESSIONS (>{args.threshold * 100:.0f}% slower than baseline):")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Cold-start benchmark: import, construction and first-run time in fresh interpreters.
+
+Each sample is a new Python process, so nothing is warm in sys.modules.
+Results use the same JSON layout and regression gate as benchmarks.stages.
+
+Usage:
+    python -m benchmarks.startup [--samples N] [--resume test/Uday\\ CSA\\ Resume.pdf]
+    python -m benchmarks.startup --update-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.stages import calibrate, compare, print_report
+
+
+DEFAULT_BASELINE = "benchmarks/startup_baseline.json"
+DEFAULT_OUTPUT = "data/benchmarks/startup.json"
+DEFAULT_RESUME = "test/Uday CSA Resume.pdf"
+
+MARKER = "STARTUP_RESULT "
+
+CHILD = """
+import json, logging, sys, time
+t0 = time.perf_counter()
+import src.agent.interview_agent as agent_module
+t1 = time.perf_counter()
+
+from benchmarks.stages import use_offline_llm
+use_offline_llm()
+logging.disable(logging.WARNING)
+
+agent = agent_module.InterviewAgent()
+t2 = time.perf_counter()
+agent.run(sys.argv[1])
+t3 = time.perf_counter()
+
+print({marker!r} + json.dumps({{
+    "import_agent": (t1 - t0) * 1e3,
+    "construct_agent": (t2 - t1) * 1e3,
+    "first_run": (t3 - t2) * 1e3,
+    "modules_loaded": len(sys.modules),
+}}))
+""".format(marker=MARKER)
+
+
+def sample(resume: str) -> Dict[str, float]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD, resume],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.getcwd()},
+    )
+    wall = (time.perf_counter() - start) * 1e3
+
+    line = next(l for l in reversed(proc.stdout.splitlines()) if l.startswith(MARKER))
+    result = json.loads(line[len(MARKER):])
+    result["process_total"] = wall
+    return result
+
+
+def run_samples(resume: str, samples: int) -> Dict:
+    calibration = calibrate()
+    runs = [sample(resume) for _ in range(samples)]
+
+    stages = {}
+    for name in ("import_agent", "construct_agent", "first_run", "process_total"):
+        values = sorted(r[name] for r in runs)
+        stages[name] = {
+            "median_ms": round(statistics.median(values), 3),
+            "p95_ms": round(values[min(len(values) - 1, int(round(0.95 * (len(values) - 1))))], 3),
+            "min_ms": round(values[0], 3),
+            "repeat": samples,
+            "calibration_ms": calibration,
+        }
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "resume": resume,
+            "modules_loaded_after_import": runs[0]["modules_loaded"],
+        },
+        "stages": stages,
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold start against a baseline")
+    parser.add_argument("--samples", type=int, default=5, help="Fresh interpreters to time")
+    parser.add_argument("--resume", default=DEFAULT_RESUME, help="Resume for the first run")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="JSON results file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument("--min-delta-ms", type=float, default=20.0)
+    parser.add_argument("--update-baseline", action="store_true", help="Store results as the baseline")
+    args = parser.parse_args(argv)
+
+    current = run_samples(args.resume, args.samples)
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(current, indent=2), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline updated: {baseline_path}")
+
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+
+    print_report(current, baseline)
+    print(f"\nResults written to {output_path}")
+
+    if not baseline:
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+        return 0
+
+    regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f"\nREGRESSIONS (>{args.threshold * 100:.0f}% slower than baseline):")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
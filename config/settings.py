@@ -2,14 +2,10 @@
 Configuration loader and settings manager.
 """
 import os
-import yaml
 from pathlib import Path
 from typing import Dict, Any
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
 
 class Settings:
     """Centralized settings manager for the interview agent."""
@@ -25,11 +21,23 @@ class Settings:
             config_path = Path(__file__).parent / "config.yaml"
         
         self.config_path = Path(config_path)
-        self.config = self._load_config()
-        self._validate_config()
+        self._config = None
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration, loaded (with .env) on first access rather than at import."""
+        if self._config is None:
+            # Load environment variables
+            load_dotenv()
+            config = self._load_config()
+            self._validate_config(config)
+            self._config = config
+        return self._config
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
+        import yaml
+        
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
         
@@ -51,11 +59,11 @@ class Settings:
             return os.getenv(var_name, "")
         return config
     
-    def _validate_config(self):
+    def _validate_config(self, config: Dict[str, Any]):
         """Validate required configuration fields."""
         required_sections = ['llm', 'interview', 'logging']
         for section in required_sections:
-            if section not in self.config:
+            if section not in config:
                 raise ValueError(f"Missing required config section: {section}")
     
     def get(self, key: str, default=None):
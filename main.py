@@ -1,9 +1,10 @@
 import streamlit as st
 import json
-from pathlib import Path
-import tempfile
+import hashlib
+import time
 
-from src.agent.interview_agent import InterviewAgent
+from src.service.client import ServiceBusyError, get_service_client
+from src.storage.results_store import get_results_store
 
 # -------------------------------
 # PAGE CONFIG
@@ -20,14 +21,16 @@ st.divider()
 
 
 # -------------------------------
-# AGENT INIT (CACHE)
+# JOB SERVICE CLIENT (CACHE)
 # -------------------------------
 @st.cache_resource
-def load_agent():
-    return InterviewAgent()
+def load_client():
+    # Every session shares the service's bounded worker pool; one is
+    # started in this process when none is running
+    return get_service_client()
 
 
-agent = load_agent()
+client = load_client()
 
 
 # -------------------------------
@@ -42,33 +45,120 @@ uploaded_file = st.file_uploader(
 # -------------------------------
 # RUN BUTTON
 # -------------------------------
+def render_question(index: int, q: dict):
+    with st.expander(f"{index}. {q['type'].capitalize()} Question", expanded=False):
+        st.write("**Question:**")
+        st.write(q["question"])
+        st.write("**Evaluating:**")
+        st.write(q["evaluating"])
+
+
+def saved_result(data: bytes):
+    """Latest completed result stored for a resume with this content."""
+    store = get_results_store()
+    if store is None:
+        return None
+
+    saved = store.latest_for_resume(hashlib.sha256(data).hexdigest())
+    if saved is None:
+        return None
+
+    # Replay the stored run as the events a live run would produce
+    result = {**saved, "status": "completed", "error": ""}
+    return result, iter([("question", q) for q in saved["questions"]] + [("completed", result)])
+
+
+def job_events(data: bytes, filename: str, status):
+    """Submit the resume to the job service and yield progress as agent.stream() events."""
+    job = client.submit_bytes(data, filename)
+    parsed = provisional = False
+
+    def show(update):
+        if update["status"] == "queued":
+            status.caption(f"⏳ Waiting in queue (position {update.get('position', 0) + 1})")
+        else:
+            status.empty()
+
+    while True:
+        update = client.status(job["job_id"], since=len(job.get("questions", [])) if parsed else 0)
+        show(update)
+
+        if update["candidate_info"] and not parsed:
+            parsed = True
+            job = {**update, "questions": []}
+            yield "resume_parsed", {"status": "resume_parsed", **job}
+
+        if parsed and update.get("provisional_questions") and not provisional:
+            provisional = True
+            yield "provisional", update["provisional_questions"]
+
+        if parsed:
+            for question in update["questions"]:
+                job["questions"].append(question)
+                yield "question", question
+
+        if update["status"] in ("completed", "failed"):
+            yield "completed", client.result(job["job_id"])
+            return
+
+        time.sleep(client.poll_seconds)
+
+
 if uploaded_file:
+    reuse = get_results_store() is not None and st.checkbox(
+        "Reuse saved results for the same resume", value=True
+    )
+
     if st.button("🚀 Generate Interview Questions"):
         with st.spinner("Processing resume..."):
-            # Save uploaded file to temp location
-            suffix = Path(uploaded_file.name).suffix
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                tmp.write(uploaded_file.read())
-                resume_path = tmp.name
-
-            # Run agent
-            result = agent.run(resume_path)
+            data = uploaded_file.read()
+            reused = saved_result(data) if reuse else None
+
+            if reused:
+                result, events = reused
+                st.info(f"♻️ Showing results saved on {result['saved_at']} (run {result['run_id']})")
+            else:
+                # Queued on the job service (questions render as they are generated)
+                try:
+                    events = job_events(data, uploaded_file.name, st.empty())
+                    event, result = next(events)
+                except ServiceBusyError:
+                    st.error("🚦 The server is busy right now. Please try again in a moment.")
+                    st.stop()
 
         # -------------------------------
         # ERROR HANDLING
         # -------------------------------
-        if result["status"] != "completed":
+        if result["status"] == "failed":
             st.error("❌ Failed to process resume")
             st.write(result.get("error"))
             st.stop()
 
         candidate = result["candidate_info"]
-        questions = result["questions"]
 
         # -------------------------------
         # CANDIDATE SUMMARY
         # -------------------------------
         st.success("✅ Resume processed successfully")
+        if candidate.get("degraded"):
+            st.warning(
+                "⚠️ The language model was unavailable; showing fallback values for: "
+                + ", ".join(candidate["degraded"])
+            )
+
+        duplicate = candidate.get("near_duplicate")
+        if duplicate:
+            st.info(
+                f"♻️ Nearly identical to an earlier resume (similarity {duplicate['similarity']:.0%}, "
+                f"run {duplicate['run_id']}); its role, skills and questions were reused."
+            )
+
+        truncated = (candidate.get("limits") or {}).get("truncated")
+        if truncated:
+            st.warning(
+                "✂️ The resume exceeded processing limits and was shortened ("
+                + ", ".join(truncated) + "); later content was not used."
+            )
 
         st.subheader("👤 Candidate Summary")
         col1, col2 = st.columns(2)
@@ -90,16 +180,40 @@ if uploaded_file:
         st.divider()
 
         # -------------------------------
-        # QUESTIONS
+        # QUESTIONS (PROGRESSIVE)
         # -------------------------------
         st.subheader("📝 Generated Interview Questions")
 
-        for i, q in enumerate(questions, 1):
-            with st.expander(f"{i}. {q['type'].capitalize()} Question", expanded=False):
-                st.write("**Question:**")
-                st.write(q["question"])
-                st.write("**Evaluating:**")
-                st.write(q["evaluating"])
+        progress = st.empty()
+        progress.caption("⏳ Generating questions...")
+
+        # Question bank set shown until the first generated question arrives (hybrid mode)
+        provisional = None
+
+        questions = []
+        for event, payload in events:
+            if event == "provisional" and not questions:
+                provisional = st.empty()
+                with provisional.container():
+                    st.caption("📚 Questions from the question bank, shown while personalized ones are generated")
+                    for i, q in enumerate(payload, 1):
+                        render_question(i, q)
+            elif event == "question":
+                if provisional is not None:
+                    provisional.empty()
+                    provisional = None
+                questions.append(payload)
+                render_question(len(questions), payload)
+                progress.caption(f"⏳ Generating questions... ({len(questions)} so far)")
+            elif event == "completed":
+                result = payload
+
+        progress.empty()
+
+        if result["status"] != "completed":
+            st.error("❌ Failed to generate questions")
+            st.write(result.get("error"))
+            st.stop()
 
         st.divider()
 
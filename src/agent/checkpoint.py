@@ -0,0 +1,81 @@
+"""
+Checkpointer for the agent graph: saves state after every node, keyed by run ID.
+"""
+
+import asyncio
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+from config.settings import settings
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(
+    name="checkpoint",
+    log_dir="logs/interview_agent",
+)
+
+CHECKPOINT_BACKENDS = ("sqlite", "memory")
+
+
+def build_checkpointer() -> Optional[Any]:
+    """
+    Checkpointer from the `checkpoint` config section (None when disabled).
+
+    sqlite persists across restarts and needs langgraph-checkpoint-sqlite;
+    without it, and for the memory backend, state lives in this process only.
+    """
+    if not settings.get("checkpoint.enabled", False):
+        return None
+
+    backend = settings.get("checkpoint.backend", "sqlite").lower()
+    if backend not in CHECKPOINT_BACKENDS:
+        raise ValueError(
+            f"Unsupported checkpoint backend: {backend} (available: {', '.join(CHECKPOINT_BACKENDS)})"
+        )
+
+    if backend == "sqlite":
+        try:
+            return _sqlite_saver(settings.get("checkpoint.path", "data/checkpoints/agent.sqlite"))
+        except ImportError:
+            logger.warning(
+                "langgraph-checkpoint-sqlite is not installed; checkpoints are kept in memory only"
+            )
+
+    from langgraph.checkpoint.memory import MemorySaver
+    return MemorySaver()
+
+
+def _sqlite_saver(path: str) -> Any:
+    from langgraph.checkpoint.sqlite import SqliteSaver
+
+    class ThreadedSqliteSaver(SqliteSaver):
+        """SqliteSaver whose async methods run the sync ones in a worker thread."""
+
+        async def aget_tuple(self, config):
+            return await asyncio.to_thread(self.get_tuple, config)
+
+        async def alist(self, config, *, filter=None, before=None, limit=None):
+            items = await asyncio.to_thread(
+                lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+            )
+            for item in items:
+                yield item
+
+        async def aput(self, config, checkpoint, metadata, new_versions):
+            return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+        async def aput_writes(self, config, writes, task_id, task_path=""):
+            return await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+        async def adelete_thread(self, thread_id):
+            return await asyncio.to_thread(self.delete_thread, thread_id)
+
+    db_path = Path(path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # One connection shared by all threads; the saver serializes access
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return ThreadedSqliteSaver(conn)
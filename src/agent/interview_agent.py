@@ -1,11 +1,18 @@
 from src.utils.logger import setup_logger
-from typing import TypedDict, Annotated, List, Dict
-from langgraph.graph import StateGraph, END
-from langchain_groq import ChatGroq
-from src.parsers.resume_parser import ResumeParser
+from typing import TypedDict, Annotated, Any, Iterator, List, Dict, Optional, Tuple
+import asyncio
+import threading
+import time
+from src.agent.checkpoint import build_checkpointer
+from src.parsers.document import ResumeDocument, ResumeSource, load_document
+from src.parsers.resume_parser import PriorProfile, ResumeParser
 from src.generators.question_generator import QuestionGenerator
+from src.storage.duplicate_index import get_duplicate_index
+from src.storage.results_store import get_results_store
 from config.settings import settings
+from src.utils.tracing import record_span, serve_metrics, span, start_run
 import operator
+from pathlib import Path
 
 logger = setup_logger(
     name="interview_agent",
@@ -13,11 +20,18 @@ logger = setup_logger(
 )
 
 class InterviewState(TypedDict):
-    resume_path: str
+    resume_path: str  # file path, or the display name of in-memory content
+    resume_data: Optional[bytes]  # in-memory content; dropped once parsed
+    resume_hash: str
     candidate_info: Dict
     questions: List[Dict[str, str]]
     status: str
     error: str
+    parse_cache: Dict
+    question_cache: Dict
+    run_id: str
+    llm_provider: str  # provider the questions were generated with
+    timings: Dict
 
 
 class InterviewAgent:
@@ -29,24 +43,72 @@ class InterviewAgent:
     def __init__(self):
         self.resume_parser = ResumeParser()
         self.question_generator = QuestionGenerator()
-        self.graph = self._build_graph()
+        self._graph = None
+        self._graph_lock = threading.Lock()
+        self.checkpointer = None
+
+        metrics_port = settings.get("tracing.metrics_port")
+        if metrics_port:
+            serve_metrics(int(metrics_port))
 
     # =========================
     # GRAPH
     # =========================
 
+    @property
+    def graph(self):
+        """Compiled graph, built on first run (langgraph is slow to import)."""
+        with self._graph_lock:
+            if self._graph is None:
+                self._graph = self._build_graph()
+        return self._graph
+
+    def warm_up(self) -> threading.Thread:
+        """
+        Build the graph and LLM clients in a background thread, so the
+        first run does not pay for those imports (e.g. while a UI waits
+        for an upload).
+        """
+        thread = threading.Thread(target=self._warm_up, name="agent-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def _warm_up(self) -> None:
+        try:
+            self.graph
+            self.resume_parser.llm
+            self.question_generator.llm
+        except Exception as e:
+            logger.warning(f"Agent warm-up failed: {e}")
+
     def _build_graph(self):
+        from langchain_core.runnables import RunnableLambda
+        from langgraph.graph import StateGraph, END
+
         workflow = StateGraph(InterviewState)
 
-        workflow.add_node("parse_resume", self._parse_resume_node)
-        workflow.add_node("generate_questions", self._generate_questions_node)
+        # Each node has a sync and an async implementation so the same graph
+        # serves both run() and arun()
+        workflow.add_node(
+            "parse_resume",
+            RunnableLambda(self._parse_resume_node, afunc=self._aparse_resume_node),
+        )
+        workflow.add_node(
+            "generate_questions",
+            RunnableLambda(
+                self._generate_questions_node,
+                afunc=self._agenerate_questions_node,
+            ),
+        )
 
         workflow.set_entry_point("parse_resume")
 
         workflow.add_edge("parse_resume", "generate_questions")
         workflow.add_edge("generate_questions", END)
 
-        return workflow.compile()
+        # State is saved after every node, keyed by run ID (thread_id)
+        self.checkpointer = build_checkpointer()
+        return workflow.compile(checkpointer=self.checkpointer)
 
     # =========================
     # NODES
@@ -55,38 +117,334 @@ class InterviewAgent:
     def _parse_resume_node(self, state: InterviewState) -> InterviewState:
         logger.info("Node: Parsing resume")
 
-        try:
-            candidate_info = self.resume_parser.parse(state["resume_path"])
+        with span("node.parse_resume") as s:
+            try:
+                document = self._load_resume(state)
+                candidate_info, cache_hit = self.resume_parser.parse_cached(
+                    document, prior_profile=self._near_duplicate_lookup(state)
+                )
+                self._apply_parse_result(state, candidate_info, cache_hit)
 
-            # HARD STOP if OCR + PDF extraction failed
-            if not candidate_info.get("raw_text"):
+            except Exception as e:
+                logger.error(f"Resume parsing failed: {e}")
                 state["status"] = "failed"
-                state["error"] = "PDF not accessible or text extraction failed"
-                return state
+                state["error"] = str(e)
 
-            state["candidate_info"] = candidate_info
-            state["status"] = "resume_parsed"
+            self._finish_node_span(s, state, state["parse_cache"])
 
-        except Exception as e:
-            logger.error(f"Resume parsing failed: {e}")
-            state["status"] = "failed"
-            state["error"] = str(e)
+        return state
+
+    async def _aparse_resume_node(self, state: InterviewState) -> InterviewState:
+        logger.info("Node: Parsing resume")
+
+        with span("node.parse_resume") as s:
+            try:
+                document = await asyncio.to_thread(self._load_resume, state)
+                candidate_info, cache_hit = await self.resume_parser.aparse_cached(
+                    document, prior_profile=self._near_duplicate_lookup(state)
+                )
+                self._apply_parse_result(state, candidate_info, cache_hit)
+
+            except Exception as e:
+                logger.error(f"Resume parsing failed: {e}")
+                state["status"] = "failed"
+                state["error"] = str(e)
+
+            self._finish_node_span(s, state, state["parse_cache"])
 
         return state
 
+    def _load_resume(self, state: InterviewState) -> ResumeDocument:
+        """Resume content from memory or disk (bytes are not kept in later checkpoints)."""
+        data = state.get("resume_data")
+        document = load_document(
+            data if data is not None else state["resume_path"],
+            state["resume_path"],
+            max_bytes=self.resume_parser.governor.max_file_bytes,
+        )
+        state["resume_data"] = None
+        state["resume_hash"] = document.sha256
+        return document
+
+    def _near_duplicate_lookup(self, state: InterviewState) -> Optional[PriorProfile]:
+        """
+        Lookup of earlier runs whose resume text is nearly the same
+        (`cache.near_duplicates`), or None when the index is off.
+
+        On a match the earlier run's questions are put in the state, and
+        its profile is returned for the parser to adapt.
+        """
+        index, store = get_duplicate_index(), get_results_store()
+        if index is None or store is None:
+            return None
+
+        def lookup(text: str) -> Optional[Dict]:
+            with span("dedup.lookup") as s:
+                matches = index.query(text, limit=3)
+                s.set(candidates=len(matches))
+
+                for run_id, similarity in matches:
+                    prior = store.get(run_id)
+                    if prior is None or prior["status"] != "completed" or not prior["questions"]:
+                        continue
+
+                    similarity = round(similarity, 3)
+                    s.set(match=run_id, similarity=similarity)
+                    logger.info(f"Near-duplicate of run {run_id} (similarity {similarity}); reusing its results")
+
+                    state["questions"] = list(prior["questions"])
+                    state["question_cache"] = {
+                        "hit": True,
+                        "match": "near_duplicate",
+                        "similarity": similarity,
+                        "run_id": run_id,
+                    }
+                    return {
+                        **prior["candidate_info"],
+                        "near_duplicate": {"run_id": run_id, "similarity": similarity},
+                    }
+            return None
+
+        return lookup
+
+    @staticmethod
+    def _reuses_questions(state: InterviewState) -> bool:
+        """Whether parsing matched an earlier run whose questions are reused."""
+        return state["question_cache"].get("match") == "near_duplicate"
+
+    def _apply_parse_result(
+        self,
+        state: InterviewState,
+        candidate_info: Dict,
+        cache_hit: bool,
+    ) -> None:
+        cache_stats = self.resume_parser.cache_stats()
+        state["parse_cache"] = {"hit": cache_hit, **cache_stats}
+        if cache_stats:
+            logger.info(
+                f"Parse cache {'hit' if cache_hit else 'miss'} "
+                f"(hits={cache_stats['hits']}, misses={cache_stats['misses']}, "
+                f"llm_calls_saved={cache_stats['hits'] * self.resume_parser.llm_calls_per_parse}, "
+                f"seconds_saved={cache_stats['seconds_saved']})"
+            )
+
+        # HARD STOP if OCR + PDF extraction failed
+        if not candidate_info.get("raw_text"):
+            state["status"] = "failed"
+            state["error"] = "PDF not accessible or text extraction failed"
+            return
+
+        state["candidate_info"] = candidate_info
+        state["status"] = "resume_parsed"
+
     def _generate_questions_node(self, state: InterviewState) -> InterviewState:
         logger.info("Node: Generating questions")
 
-        try:
-            candidate_info = state["candidate_info"]
-            role = candidate_info.get("job_role", "General Candidate")
+        if state["status"] == "failed":
+            # Nothing to generate from; keep the parse error (stream() skips this node too)
+            return state
+
+        with span("node.generate_questions") as s:
+            try:
+                if self._reuses_questions(state):
+                    state["status"] = "completed"
+                    self._finish_node_span(s, state, state["question_cache"])
+                    return state
+
+                candidate_info = state["candidate_info"]
+                role = candidate_info.get("job_role", "General Candidate")
+
+                questions, cache_outcome = self.question_generator.generate_questions_cached(
+                    candidate_info=candidate_info,
+                    role=role
+                )
+
+                state["questions"] = questions
+                state["question_cache"] = cache_outcome
+                state["status"] = "completed"
+
+            except Exception as e:
+                logger.error(f"Question generation failed: {e}")
+                state["status"] = "failed"
+                state["error"] = str(e)
+
+            self._finish_node_span(s, state, state["question_cache"])
+
+        return state
+
+    async def _agenerate_questions_node(self, state: InterviewState) -> InterviewState:
+        logger.info("Node: Generating questions")
+
+        if state["status"] == "failed":
+            # Nothing to generate from; keep the parse error (stream() skips this node too)
+            return state
+
+        with span("node.generate_questions") as s:
+            try:
+                if self._reuses_questions(state):
+                    state["status"] = "completed"
+                    self._finish_node_span(s, state, state["question_cache"])
+                    return state
+
+                candidate_info = state["candidate_info"]
+                role = candidate_info.get("job_role", "General Candidate")
+
+                questions, cache_outcome = await self.question_generator.agenerate_questions_cached(
+                    candidate_info=candidate_info,
+                    role=role
+                )
+
+                state["questions"] = questions
+                state["question_cache"] = cache_outcome
+                state["status"] = "completed"
+
+            except Exception as e:
+                logger.error(f"Question generation failed: {e}")
+                state["status"] = "failed"
+                state["error"] = str(e)
+
+            self._finish_node_span(s, state, state["question_cache"])
+
+        return state
+
+    def _finish_node_span(self, node_span, state: InterviewState, cache_outcome: Dict) -> None:
+        """Tag a node span with its outcome and cache result."""
+        node_span.status, attributes = self._node_outcome(state, cache_outcome)
+        node_span.set(**attributes)
+
+    @staticmethod
+    def _node_outcome(state: InterviewState, cache_outcome: Dict) -> Tuple[str, Dict]:
+        status = "error" if state["status"] == "failed" else "ok"
+        if not cache_outcome:
+            return status, {}
+
+        match = cache_outcome.get("match") or ("hit" if cache_outcome.get("hit") else "miss")
+        return status, {"cache": match}
+
+    # =========================
+    # PUBLIC API
+    # =========================
+
+    def run(self, resume: ResumeSource, run_id: Optional[str] = None, name: Optional[str] = None) -> Dict:
+        """
+        Run the pipeline.
+
+        ``resume`` is a file path, the file's content (bytes) or a binary
+        file-like object; ``name`` labels in-memory content (e.g. the
+        uploaded file name). The format is detected from the content.
+
+        With checkpointing enabled, the state is saved under ``run_id``
+        (generated when not given). If a checkpoint for ``run_id`` stopped
+        part-way (e.g. a crash), the run continues from the last
+        completed node instead of starting over.
+        """
+        with start_run(run_id) as trace:
+            logger.info("Starting Interview Question Generator Agent")
+            graph, config = self.graph, self._thread_config(trace.run_id)
+            pending = graph.get_state(config).next if self.checkpointer is not None else ()
+            final_state = graph.invoke(self._graph_input(pending, resume, trace.run_id, name), config)
+            self._save_result(final_state)
+            trace.status = final_state["status"]
 
-            questions = self.question_generator.generate_questions(
-                candidate_info=candidate_info,
-                role=role
+        final_state["timings"] = trace.breakdown()
+        return final_state
+
+    async def arun(self, resume: ResumeSource, run_id: Optional[str] = None, name: Optional[str] = None) -> Dict:
+        """
+        Async variant of run().
+
+        Many runs can be awaited concurrently (e.g. with asyncio.gather)
+        on a single event loop sharing one agent instance.
+        """
+        with start_run(run_id) as trace:
+            logger.info("Starting Interview Question Generator Agent (async)")
+            graph, config = self.graph, self._thread_config(trace.run_id)
+            pending = (await graph.aget_state(config)).next if self.checkpointer is not None else ()
+            final_state = await graph.ainvoke(self._graph_input(pending, resume, trace.run_id, name), config)
+            await asyncio.to_thread(self._save_result, final_state)
+            trace.status = final_state["status"]
+
+        final_state["timings"] = trace.breakdown()
+        return final_state
+
+    def stream(
+        self,
+        resume: ResumeSource,
+        run_id: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Run the pipeline, yielding progress events as they happen.
+
+        The nodes run outside the graph, but their results are
+        checkpointed the same way, so the run can be regenerated later.
+        Like run(), a ``run_id`` whose checkpoint stopped after parsing
+        (e.g. a crashed job) continues from the parsed profile.
+
+        Events:
+            ("resume_parsed", state)   candidate profile is available
+            ("provisional", questions) question bank set to show until the
+                                       generated questions arrive (hybrid mode)
+            ("question", question)     one generated question
+            ("completed", state)       final state (also for failures)
+        """
+        with start_run(run_id) as trace:
+            logger.info("Starting Interview Question Generator Agent (streaming)")
+            state = self._checkpointed_profile(trace.run_id)
+            if state is None:
+                state = self._parse_resume_node(self._initial_state(resume, trace.run_id, name))
+                self._save_checkpoint(state, "parse_resume")
+
+            if state["status"] != "failed":
+                yield "resume_parsed", state
+                provisional = self._provisional_questions(state)
+                if provisional:
+                    yield "provisional", provisional
+                yield from self._stream_questions(state)
+                self._save_checkpoint(state, "generate_questions")
+
+            self._save_result(state)
+            trace.status = state["status"]
+
+        state["timings"] = trace.breakdown()
+        yield "completed", state
+
+    def _provisional_questions(self, state: InterviewState) -> List[Dict]:
+        """Bank questions for the parsed profile in hybrid mode (none when questions are reused)."""
+        if self.question_generator.bank_mode != "hybrid" or self._reuses_questions(state):
+            return []
+
+        candidate_info = state["candidate_info"]
+        try:
+            return self.question_generator.bank_questions(
+                candidate_info, candidate_info.get("job_role", "General Candidate")
             )
+        except Exception as e:
+            logger.warning(f"Could not select provisional questions from the question bank: {e}")
+            return []
+
+    def _stream_questions(self, state: InterviewState) -> Iterator[Tuple[str, Any]]:
+        logger.info("Node: Generating questions (streaming)")
+        candidate_info = state["candidate_info"]
+
+        # Timed by hand: a span cannot stay open across yields to the caller,
+        # so this also includes the time the caller spends per question
+        start = time.perf_counter()
+
+        try:
+            if self._reuses_questions(state):
+                questions, state["questions"] = state["questions"], []
+            else:
+                questions = self.question_generator.stream_questions(
+                    candidate_info=candidate_info,
+                    role=candidate_info.get("job_role", "General Candidate"),
+                    cache_outcome=state["question_cache"],
+                )
+
+            for question in questions:
+                state["questions"].append(question)
+                yield "question", question
 
-            state["questions"] = questions
             state["status"] = "completed"
 
         except Exception as e:
@@ -94,23 +452,229 @@ class InterviewAgent:
             state["status"] = "failed"
             state["error"] = str(e)
 
-        return state
+        status, attributes = self._node_outcome(state, state["question_cache"])
+        record_span(
+            "node.generate_questions",
+            (time.perf_counter() - start) * 1e3,
+            status=status,
+            **attributes,
+        )
 
     # =========================
-    # PUBLIC API
+    # CHECKPOINTS & REGENERATION
     # =========================
 
-    def run(self, resume_path: str) -> Dict:
-        logger.info("Starting Interview Question Generator Agent")
+    def regenerate(
+        self,
+        run_id: str,
+        question_type: Optional[str] = None,
+        index: Optional[int] = None,
+        num_questions: Optional[int] = None,
+    ) -> Dict:
+        """
+        Regenerate questions of a checkpointed run from its saved profile.
+
+        The resume is not parsed again. Only the affected entries of the
+        stored set are replaced, and the result is checkpointed.
+
+        Args:
+            run_id: Run whose checkpoint to use
+            question_type: Replace every question of this type
+                (``num_questions`` of them, default the current count)
+            index: Replace only the question at this position (0-based)
+            num_questions: With neither of the above, the size of the new set
+
+        Returns:
+            Updated state
+        """
+        graph, config = self.graph, self._thread_config(run_id)
+        if self.checkpointer is None:
+            raise RuntimeError("Regeneration needs checkpointing (checkpoint.enabled)")
+
+        state = dict(graph.get_state(config).values)
+        if not state.get("candidate_info"):
+            raise KeyError(f"No parsed profile checkpointed for run: {run_id}")
+
+        with start_run(run_id) as trace:
+            logger.info(f"Regenerating questions for run {run_id}")
+
+            with span("node.regenerate_questions") as s:
+                s.set(question_type=question_type, index=index)
+                state["questions"] = self._regenerated_questions(
+                    state, question_type, index, num_questions
+                )
+                state["status"] = "completed"
+                state["error"] = ""
+
+            graph.update_state(
+                config,
+                {"questions": state["questions"], "status": "completed", "error": ""},
+                as_node="generate_questions",
+            )
+            self._save_result(state)
+
+        state["timings"] = trace.breakdown()
+        return state
+
+    def _regenerated_questions(
+        self,
+        state: Dict,
+        question_type: Optional[str],
+        index: Optional[int],
+        num_questions: Optional[int],
+    ) -> List[Dict[str, str]]:
+        candidate_info = state["candidate_info"]
+        role = candidate_info.get("job_role", "General Candidate")
+        questions = list(state.get("questions") or [])
+
+        if index is not None:
+            if not 0 <= index < len(questions):
+                raise IndexError(f"Question index {index} out of range (0-{len(questions) - 1})")
 
-        initial_state: InterviewState = {
+            replacement = self.question_generator.regenerate_questions(
+                candidate_info,
+                role,
+                question_type=questions[index]["type"],
+                num_questions=1,
+                exclude=[q["question"] for q in questions],
+            )
+            return questions[:index] + replacement[:1] + questions[index + 1:]
+
+        if question_type is not None:
+            positions = [i for i, q in enumerate(questions) if q["type"] == question_type]
+            replacement = self.question_generator.regenerate_questions(
+                candidate_info,
+                role,
+                question_type=question_type,
+                num_questions=num_questions or len(positions) or 1,
+                exclude=[questions[i]["question"] for i in positions],
+            )
+
+            # The new block takes the place of the old one
+            kept = [q for q in questions if q["type"] != question_type]
+            insert_at = positions[0] if positions else len(kept)
+            return kept[:insert_at] + replacement + kept[insert_at:]
+
+        return self.question_generator.regenerate_questions(
+            candidate_info, role, num_questions=num_questions
+        )
+
+    @staticmethod
+    def _thread_config(run_id: str) -> Dict:
+        return {"configurable": {"thread_id": run_id}}
+
+    def _graph_input(
+        self,
+        pending: Tuple[str, ...],
+        resume: ResumeSource,
+        run_id: str,
+        name: Optional[str] = None,
+    ) -> Optional[InterviewState]:
+        """Initial state, or None to continue a checkpoint with nodes still pending."""
+        if pending:
+            logger.info(f"Resuming run {run_id} from checkpoint before: {', '.join(pending)}")
+            return None
+        return self._initial_state(resume, run_id, name)
+
+    def _checkpointed_profile(self, run_id: str) -> Optional[InterviewState]:
+        """State of a checkpoint still waiting for question generation, if any."""
+        # Builds the graph first: the checkpointer is created with it
+        graph = self.graph
+        if self.checkpointer is None:
+            return None
+
+        snapshot = graph.get_state(self._thread_config(run_id))
+        if "generate_questions" not in snapshot.next:
+            # Parsing is the first node, so anything else starts over
+            return None
+
+        logger.info(f"Resuming run {run_id} from checkpoint before: {', '.join(snapshot.next)}")
+        state = dict(snapshot.values)
+        state["questions"] = []
+        return state
+
+    def _save_checkpoint(self, state: InterviewState, as_node: str) -> None:
+        """Checkpoint state produced outside the graph (streaming runs)."""
+        graph = self.graph
+        if self.checkpointer is not None:
+            graph.update_state(self._thread_config(state["run_id"]), dict(state), as_node=as_node)
+
+    def _save_result(self, state: InterviewState) -> None:
+        """Store the run in the results store (`output.save_interviews`) and the question bank."""
+        self._remember_questions(state)
+
+        store = get_results_store()
+        if store is None:
+            return
+
+        try:
+            with span("store.save"):
+                store.save(state, resume_hash=state.get("resume_hash") or None)
+        except Exception as e:
+            # The run's result is still returned; only the history misses it
+            logger.warning(f"Could not save results for run {state.get('run_id')}: {e}")
+            return
+
+        self._index_result(state)
+
+    def _remember_questions(self, state: InterviewState) -> None:
+        """Add a completed run's generated questions to the offline question bank."""
+        if state.get("status") != "completed" or (state.get("candidate_info") or {}).get("near_duplicate"):
+            return
+
+        try:
+            added = self.question_generator.remember(
+                state["candidate_info"], state["questions"], state.get("llm_provider")
+            )
+        except Exception as e:
+            logger.warning(f"Could not add run {state.get('run_id')} to the question bank: {e}")
+            return
+        if added:
+            logger.info(f"Added {added} questions to the question bank")
+
+    def _index_result(self, state: InterviewState) -> None:
+        """Add a completed run's resume text to the near-duplicate index."""
+        index = get_duplicate_index()
+        candidate_info = state.get("candidate_info") or {}
+        if (
+            index is None
+            or state.get("status") != "completed"
+            or not candidate_info.get("raw_text")
+            # Fallback profiles should not be reused; reused ones are indexed already
+            or candidate_info.get("degraded")
+            or candidate_info.get("near_duplicate")
+        ):
+            return
+
+        try:
+            with span("dedup.index"):
+                index.add(state["run_id"], candidate_info["raw_text"])
+        except Exception as e:
+            logger.warning(f"Could not index run {state.get('run_id')} for near-duplicate lookup: {e}")
+
+    def _initial_state(self, resume: ResumeSource, run_id: str = "", name: Optional[str] = None) -> InterviewState:
+        if isinstance(resume, (str, Path)):
+            resume_path, resume_data = str(resume), None
+        else:
+            if not isinstance(resume, (bytes, bytearray, memoryview)):
+                # File-like objects are read now: the state must be serializable.
+                # One byte past the size limit is enough for parsing to reject it.
+                max_bytes = self.resume_parser.governor.max_file_bytes
+                name = name or getattr(resume, "name", "")
+                resume = resume.read() if max_bytes is None else resume.read(max_bytes + 1)
+            resume_path, resume_data = name or "<upload>", bytes(resume)
+
+        return {
             "resume_path": resume_path,
+            "resume_data": resume_data,
+            "resume_hash": "",
             "candidate_info": {},
             "questions": [],
             "status": "initialized",
             "error": "",
+            "parse_cache": {},
+            "question_cache": {},
+            "run_id": run_id,
+            "llm_provider": str(settings.get("llm.provider", "groq")).lower(),
+            "timings": {},
         }
-
-        final_state = self.graph.invoke(initial_state)
-
-        return final_state
\ No newline at end of file
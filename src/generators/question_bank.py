@@ -0,0 +1,365 @@
+"""
+Offline question bank: vetted and previously generated questions ranked with BM25.
+
+Each question is indexed by type, difficulty and the words of its role,
+skills and text. An inverted index maps every word to the questions
+containing it, so ranking a candidate's role and skills only touches
+questions that share a word with them, and a tailored set is selected
+in milliseconds without an LLM call.
+"""
+
+import heapq
+import math
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from config.settings import settings
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(
+    name="question_bank",
+    log_dir="logs/question_generator_agent",
+)
+
+# fallback: LLM questions, bank when the LLM fails; instant: bank only;
+# hybrid: bank set first while streaming, replaced by the LLM questions
+BANK_MODES = ("fallback", "instant", "hybrid")
+
+# Role and skill words count this many times in a question's document,
+# so a match on the profile outranks a passing mention in the question text
+PROFILE_WEIGHT = 3
+
+# Runs from these providers are never indexed: their questions are not real
+OFFLINE_PROVIDERS = frozenset({"fake"})
+
+# Score multipliers for questions tagged with a difficulty
+DIFFICULTY_MATCH_BOOST = 1.25
+DIFFICULTY_MISMATCH_PENALTY = 0.5
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+# The field scanner's experience estimate, e.g. "3 years 6 months"
+_EXPERIENCE = re.compile(r"(\d+)\s*years?(?:\s+(\d+)\s*months?)?")
+_STOPWORDS = frozenset(
+    "a an and are as at be by do for from how in is it of on or the to what when which who "
+    "why with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def experience_years(candidate_info: Dict) -> Optional[float]:
+    """
+    Years of experience of a profile, or None when unknown.
+
+    Uses ``experience_years`` when a caller provides it, otherwise the
+    parser's ``experience`` estimate ("N years M months", "0 years 0
+    months" when nothing was found).
+    """
+    years = candidate_info.get("experience_years")
+    if years is not None:
+        return float(years)
+
+    match = _EXPERIENCE.search(candidate_info.get("experience") or "")
+    if not match:
+        return None
+    years = int(match.group(1)) + int(match.group(2) or 0) / 12
+    return years or None
+
+
+def difficulty_level(experience_years: float) -> str:
+    """Difficulty level for years of experience (`interview.difficulty_levels`)."""
+    difficulty_levels = settings.get('interview.difficulty_levels', {})
+
+    for level, (min_exp, max_exp) in difficulty_levels.items():
+        if min_exp <= experience_years < max_exp:
+            return level
+
+    return 'mid'
+
+
+class QuestionBank:
+    """In-memory BM25 index of interview questions (thread-safe)."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+        self._entries: List[Dict] = []
+        self._lengths: List[int] = []
+        self._total_length = 0
+        # word -> {question index: term frequency}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._generic: Dict[str, List[int]] = {}
+        self._seen: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_yaml(cls, path: str, **kwargs) -> "QuestionBank":
+        """Bank of the vetted questions in a YAML file (see config/question_bank.yaml)."""
+        import yaml
+
+        bank = cls(**kwargs)
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+
+        for item in data.get("questions") or []:
+            bank.add(
+                item["type"],
+                item["question"],
+                item.get("evaluating", ""),
+                roles=item.get("roles") or [],
+                skills=item.get("skills") or [],
+                difficulty=item.get("difficulty") or [],
+                source="vetted",
+            )
+        return bank
+
+    # =========================
+    # INDEX
+    # =========================
+
+    def add(
+        self,
+        q_type: str,
+        question: str,
+        evaluating: str = "",
+        roles: Iterable[str] = (),
+        skills: Iterable[str] = (),
+        difficulty: Iterable[str] = (),
+        source: str = "generated",
+    ) -> bool:
+        """Index a question; False if the same question text is already in the bank."""
+        key = " ".join(tokenize(question))
+        roles, skills = list(roles), list(skills)
+
+        profile_terms = tokenize(" ".join(roles + skills))
+        terms = Counter(tokenize(f"{question} {evaluating}"))
+        for term in profile_terms:
+            terms[term] += PROFILE_WEIGHT
+
+        with self._lock:
+            if not key or key in self._seen:
+                return False
+
+            index = len(self._entries)
+            self._seen.add(key)
+            self._entries.append({
+                "type": q_type,
+                "question": question,
+                "evaluating": evaluating,
+                "difficulty": {d.lower() for d in difficulty},
+                "source": source,
+            })
+            length = sum(terms.values())
+            self._lengths.append(length)
+            self._total_length += length
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[index] = tf
+
+            if not profile_terms:
+                self._generic.setdefault(q_type, []).append(index)
+        return True
+
+    def add_questions(
+        self,
+        questions: List[Dict[str, str]],
+        role: str,
+        skills: Iterable[str],
+        difficulty: Optional[str] = None,
+    ) -> int:
+        """Index a generated question set for the profile it was made for. Returns how many were new."""
+        skills = list(skills)
+        return sum(
+            self.add(
+                q["type"],
+                q["question"],
+                q.get("evaluating", ""),
+                roles=[role] if role else [],
+                skills=skills,
+                difficulty=[difficulty] if difficulty else [],
+            )
+            for q in questions
+            if q.get("question")
+        )
+
+    # =========================
+    # LOOKUP
+    # =========================
+
+    def select(
+        self,
+        role: str,
+        skills: Iterable[str],
+        quotas: List[Tuple[str, int]],
+        difficulty: Optional[str] = None,
+        exclude: Iterable[str] = (),
+    ) -> List[Dict[str, str]]:
+        """
+        Best questions for a profile, ``count`` per ``(type, count)`` in
+        ``quotas`` (in that order). Types short of matches are filled with
+        generic questions, so a type may still get fewer than asked.
+        """
+        start = time.perf_counter()
+        excluded = {" ".join(tokenize(text)) for text in exclude}
+        query = set(tokenize(" ".join([role or "", *skills])))
+
+        with self._lock:
+            scores = self._scores(query, difficulty)
+            by_type: Dict[str, List[int]] = {}
+            for i in scores:
+                by_type.setdefault(self._entries[i]["type"], []).append(i)
+
+            selected = []
+            for q_type, count in quotas:
+                # Only the best count (+ excluded) per type are needed, not a full sort
+                picks = heapq.nsmallest(
+                    count + len(excluded), by_type.get(q_type, []), key=lambda i: (-scores[i], i)
+                )
+                picks += [i for i in self._generic.get(q_type, []) if i not in scores]
+
+                chosen = 0
+                for i in picks:
+                    if chosen >= count:
+                        break
+                    entry = self._entries[i]
+                    if " ".join(tokenize(entry["question"])) in excluded:
+                        continue
+                    selected.append(self._question(entry))
+                    chosen += 1
+
+        logger.info(
+            f"Question bank selected {len(selected)} of {sum(c for _, c in quotas)} questions "
+            f"in {(time.perf_counter() - start) * 1e3:.2f} ms ({len(self._entries)} indexed)"
+        )
+        return selected
+
+    def _scores(self, query: Set[str], difficulty: Optional[str]) -> Dict[int, float]:
+        """BM25 score of every question sharing a word with the query (caller holds the lock)."""
+        n = len(self._entries)
+        if not n:
+            return {}
+
+        avg_length = self._total_length / n
+        scores: Dict[int, float] = {}
+        for term in query:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for i, tf in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[i] / avg_length)
+                scores[i] = scores.get(i, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        if difficulty:
+            for i in scores:
+                levels = self._entries[i]["difficulty"]
+                if levels:
+                    scores[i] *= DIFFICULTY_MATCH_BOOST if difficulty in levels else DIFFICULTY_MISMATCH_PENALTY
+        return scores
+
+    @staticmethod
+    def _question(entry: Dict) -> Dict[str, str]:
+        return {
+            "type": entry["type"],
+            "question": entry["question"],
+            "evaluating": entry["evaluating"],
+            "source": "bank",
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# =========================
+# CONFIGURED BANK
+# =========================
+
+_bank: Optional[QuestionBank] = None
+_bank_lock = threading.Lock()
+
+
+def get_question_bank() -> Optional[QuestionBank]:
+    """
+    Shared bank built on first use, or None when `question_bank.enabled` is off.
+
+    Holds the vetted questions of `question_bank.path` and, with
+    `question_bank.include_generated`, the questions of completed runs in
+    the results store. New runs are added as they complete.
+    """
+    global _bank
+
+    if not settings.get("question_bank.enabled", False):
+        return None
+
+    with _bank_lock:
+        if _bank is None:
+            _bank = _build_bank()
+        return _bank
+
+
+def _build_bank() -> QuestionBank:
+    start = time.perf_counter()
+    kwargs = {
+        "k1": settings.get("question_bank.bm25.k1", 1.2),
+        "b": settings.get("question_bank.bm25.b", 0.75),
+    }
+
+    path = settings.get("question_bank.path", "config/question_bank.yaml")
+    if path and Path(path).exists():
+        bank = QuestionBank.from_yaml(path, **kwargs)
+    else:
+        logger.warning(f"Question bank file not found: {path}")
+        bank = QuestionBank(**kwargs)
+    vetted = len(bank)
+
+    if settings.get("question_bank.include_generated", True):
+        from src.storage.results_store import get_results_store
+
+        store = get_results_store()
+        if store is not None:
+            for result in store.iter_results(status="completed"):
+                add_result(bank, result["candidate_info"], result["questions"], result["llm_provider"])
+
+    logger.info(
+        f"Question bank built with {vetted} vetted and {len(bank) - vetted} generated questions "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+    return bank
+
+
+def add_result(
+    bank: QuestionBank,
+    candidate_info: Dict,
+    questions: List[Dict[str, str]],
+    provider: Optional[str],
+) -> int:
+    """
+    Index the LLM-generated questions of a run (bank and fallback questions are skipped).
+
+    Only runs from a real LLM provider are indexed: runs from the fake
+    provider (benchmarks, offline testing) and older results that did
+    not record their provider are left out. Questions are tagged with a
+    difficulty only when the profile's experience is known.
+    """
+    if not provider or provider.lower() in OFFLINE_PROVIDERS:
+        return 0
+
+    generated = [q for q in questions if not q.get("source")]
+    if not generated or candidate_info.get("degraded"):
+        return 0
+
+    years = experience_years(candidate_info)
+    return bank.add_questions(
+        generated,
+        candidate_info.get("job_role", ""),
+        candidate_info.get("skills") or [],
+        difficulty_level(years) if years is not None else None,
+    )
@@ -0,0 +1,135 @@
+"""
+Question-set cache keyed on a normalized candidate profile fingerprint.
+"""
+
+import re
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from src.utils.cache import LRUCache
+
+
+_NON_WORD = re.compile(r"[^\w+#./ ]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_term(term: str) -> str:
+    """Lowercase, drop stray punctuation and collapse whitespace."""
+    term = _NON_WORD.sub(" ", term.lower())
+    return _SPACES.sub(" ", term).strip(" ./")
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class QuestionCache:
+    """
+    Reuses generated question sets for equivalent candidate profiles.
+
+    Profiles are bucketed on (canonical role, difficulty, question types,
+    question count). Within a bucket an exact match needs the same
+    normalized skill set; with ``similarity_threshold`` set, the entry
+    with the highest skill Jaccard similarity at or above it is reused.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: Optional[float] = None,
+        similarity_threshold: Optional[float] = None,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self._entries = LRUCache(max_entries, ttl_seconds)
+        self._buckets: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self.stats = {"exact_hits": 0, "similar_hits": 0, "misses": 0}
+
+    def fingerprint(
+        self,
+        role: str,
+        difficulty: str,
+        skills: Iterable[str],
+        question_types: Iterable[str],
+        num_questions: int,
+    ) -> Tuple[str, FrozenSet[str]]:
+        """Return (bucket, normalized skills) for a profile."""
+        bucket = "|".join([
+            normalize_term(role or ""),
+            difficulty,
+            ",".join(normalize_term(t) for t in question_types),
+            str(num_questions),
+        ])
+        normalized = frozenset(filter(None, (normalize_term(s) for s in skills)))
+        return bucket, normalized
+
+    def _key(self, bucket: str, skills: FrozenSet[str]) -> str:
+        return bucket + "|" + ",".join(sorted(skills))
+
+    def get(
+        self,
+        bucket: str,
+        skills: FrozenSet[str],
+    ) -> Tuple[Optional[List[Dict[str, str]]], Dict]:
+        """
+        Look up a question set.
+
+        Returns:
+            (questions or None, outcome) where outcome describes the match
+        """
+        entry = self._entries.get(self._key(bucket, skills))
+        if entry is not None:
+            self._count("exact_hits")
+            return self._copy(entry[1]), {"hit": True, "match": "exact", "similarity": 1.0}
+
+        if self.similarity_threshold is not None:
+            best, best_score = None, 0.0
+            for key in self._bucket_keys(bucket):
+                candidate = self._entries.get(key)
+                if candidate is None:
+                    self._discard(bucket, key)
+                    continue
+
+                score = jaccard(skills, candidate[0])
+                if score >= self.similarity_threshold and score > best_score:
+                    best, best_score = candidate, score
+
+            if best is not None:
+                self._count("similar_hits")
+                return self._copy(best[1]), {
+                    "hit": True,
+                    "match": "similar",
+                    "similarity": round(best_score, 3),
+                }
+
+        self._count("misses")
+        return None, {"hit": False, "match": None, "similarity": 0.0}
+
+    def set(self, bucket: str, skills: FrozenSet[str], questions: List[Dict[str, str]]) -> None:
+        key = self._key(bucket, skills)
+        self._entries.set(key, (skills, self._copy(questions)))
+        with self._lock:
+            self._buckets.setdefault(bucket, set()).add(key)
+
+    def _bucket_keys(self, bucket: str) -> List[str]:
+        with self._lock:
+            return list(self._buckets.get(bucket, ()))
+
+    def _discard(self, bucket: str, key: str) -> None:
+        # Entry was evicted or expired from the LRU
+        with self._lock:
+            keys = self._buckets.get(bucket)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._buckets[bucket]
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    @staticmethod
+    def _copy(questions: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        return [dict(q) for q in questions]
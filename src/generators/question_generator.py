@@ -1,41 +1,374 @@
 from src.utils.logger import setup_logger
-from typing import List, Dict
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
+from typing import AsyncIterator, Iterator, List, Dict, Optional, Tuple
+import asyncio
+import contextvars
+import json
+import queue
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, closing
+from types import SimpleNamespace
 from config.settings import settings
+from src.generators.question_bank import (
+    BANK_MODES,
+    QuestionBank,
+    add_result,
+    difficulty_level,
+    experience_years,
+    get_question_bank,
+)
+from src.generators.question_cache import QuestionCache
+from src.llm.client import get_llm
+from src.llm.resilience import pop_call_stats
+from src.utils.tokens import log_prompt_tokens
+from src.utils.tracing import metrics, record_span, span
 
 logger = setup_logger(
     name="question_generator",
     log_dir="logs/question_generator_agent",
 )
 
+# single: one LLM call for all types; per_type: one concurrent call per type
+GENERATION_MODES = ("single", "per_type")
+
+# text: numbered "N. [Type]" blocks; json: compact JSON objects (text parsing as fallback)
+OUTPUT_FORMATS = ("text", "json")
+
+TEXT_FORMAT_RULES = """FORMAT (STRICT):
+1. [Technical]
+   Question: <question text>
+   Evaluating: <skill or competency>
+
+2. [Behavioral]
+   Question: <question text>
+   Evaluating: <skill or competency>"""
+
+JSON_FORMAT_RULES = """FORMAT (STRICT):
+Return ONLY compact JSON (no markdown, no other text) matching:
+{{"questions":[{{"type":"<one of: {types}>","question":"<question text>","evaluating":"<skill or competency>"}}]}}"""
+
+# Marks the end of one part's questions in a fan-out stream
+_PART_DONE = object()
+
+_QUESTION_WORD = re.compile(r"\w+")
+
+class IncrementalQuestionParser:
+    """
+    Line-oriented question parser that can be fed streamed text.
+
+    A question is emitted as soon as its ``Evaluating:`` line is complete
+    (or when the next question block / end of input is reached).
+    """
+
+    format = "text"
+
+    def __init__(self):
+        self._buffer = ""
+        self._current: Optional[Dict[str, str]] = None
+        # Blocks completed with and without question text
+        self.valid = 0
+        self.invalid = 0
+
+    def feed(self, chunk: str) -> List[Dict[str, str]]:
+        """Consume a chunk of text and return any questions it completed."""
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split("\n")
+
+        completed = []
+        for line in lines:
+            question = self._consume_line(line)
+            if question:
+                completed.append(question)
+        return completed
+
+    def close(self) -> List[Dict[str, str]]:
+        """Flush the trailing partial line and any open question."""
+        completed = []
+
+        if self._buffer:
+            question = self._consume_line(self._buffer)
+            self._buffer = ""
+            if question:
+                completed.append(question)
+
+        if self._current:
+            completed.append(self._finish(self._current))
+            self._current = None
+
+        return completed
+
+    def _finish(self, block: Dict[str, str]) -> Dict[str, str]:
+        if block["question"]:
+            self.valid += 1
+        else:
+            self.invalid += 1
+        return block
+
+    def _consume_line(self, raw_line: str) -> Optional[Dict[str, str]]:
+        line = raw_line.strip()
+
+        if not line:
+            return None
+
+        # 1. New question block
+        if line[0].isdigit() and "[" in line and "]" in line:
+            finished = self._finish(self._current) if self._current else None
+
+            q_type = line[line.find("[") + 1 : line.find("]")].lower()
+
+            self._current = {
+                "type": q_type,
+                "question": "",
+                "evaluating": "",
+            }
+            return finished
+
+        current = self._current
+        if not current:
+            return None
+
+        # 2. Question text (support multiple formats)
+        if line.lower().startswith("question:"):
+            current["question"] = line.split(":", 1)[1].strip()
+
+        elif line.lower().startswith("q:"):
+            current["question"] = line.split(":", 1)[1].strip()
+
+        # 3. Evaluating line completes the block once the question is known
+        elif line.lower().startswith("evaluating:"):
+            current["evaluating"] = line.split(":", 1)[1].strip()
+            if current["question"]:
+                self._current = None
+                return self._finish(current)
+
+        # 4. Fallback: plain sentence line
+        elif not current["question"] and len(line) > 10:
+            current["question"] = line
+
+        return None
+
+
+class JSONQuestionParser:
+    """
+    Streaming parser for the JSON output format, with the same interface
+    as IncrementalQuestionParser.
+
+    Each chunk is scanned once for structural characters only. Every
+    leaf object (one with no object inside it) is decoded and validated
+    against the question schema as soon as its closing brace arrives, so
+    a wrapper object, code fences or prose around the JSON do not
+    matter. If a whole response yields no valid question, it is parsed
+    again as text.
+    """
+
+    format = "json"
+
+    _STRUCTURE = re.compile(r'[{}"\\]')
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._buffer = ""
+        self._pos = 0
+        self._in_string = False
+        # Buffer offsets of the open objects, and whether each contains an object
+        self._open: List[List] = []
+        self.valid = 0
+        self.invalid = 0
+        self.fell_back = False
+
+    def feed(self, chunk: str) -> List[Dict[str, str]]:
+        """Consume a chunk of text and return any questions it completed."""
+        self._chunks.append(chunk)
+        self._buffer += chunk
+
+        completed = []
+        for match in self._STRUCTURE.finditer(self._buffer, self._pos):
+            char, at = match.group(), match.start()
+            if at < self._pos:
+                # Character escaped by a preceding backslash
+                continue
+
+            if char == "\\":
+                if at + 1 >= len(self._buffer):
+                    # Escaped character is in the next chunk
+                    self._pos = at
+                    break
+                self._pos = at + 2
+                continue
+
+            self._pos = at + 1
+            if char == '"':
+                # Quotes in prose around the JSON are not strings
+                if self._open:
+                    self._in_string = not self._in_string
+            elif self._in_string:
+                continue
+            elif char == "{":
+                if self._open:
+                    self._open[-1][1] = True
+                self._open.append([at, False])
+            elif self._open:
+                start, nested = self._open.pop()
+                if not nested:
+                    question = self._decode(self._buffer[start:at + 1])
+                    if question:
+                        completed.append(question)
+        else:
+            self._pos = len(self._buffer)
+
+        if not self._open:
+            # Nothing before this point can belong to an object still to come
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        return completed
+
+    def close(self) -> List[Dict[str, str]]:
+        """Count a truncated last object; fall back to the text format if nothing was valid."""
+        if self._open and not self._open[-1][1]:
+            self.invalid += 1
+        self._open = []
+
+        if self.valid or not "".join(self._chunks).strip():
+            return []
+
+        self.fell_back = True
+        text_parser = IncrementalQuestionParser()
+        questions = text_parser.feed("".join(self._chunks)) + text_parser.close()
+        self.valid += text_parser.valid
+        return questions
+
+    def _decode(self, text: str) -> Optional[Dict[str, str]]:
+        try:
+            question = self._validate(json.loads(text))
+        except json.JSONDecodeError:
+            question = None
+
+        if question is None:
+            self.invalid += 1
+        else:
+            self.valid += 1
+        return question
+
+    @staticmethod
+    def _validate(item: object) -> Optional[Dict[str, str]]:
+        """Question fields of a schema-conforming object (type and question required)."""
+        if not isinstance(item, dict):
+            return None
+
+        q_type, question = item.get("type"), item.get("question")
+        evaluating = item.get("evaluating", "")
+        if not (isinstance(q_type, str) and isinstance(question, str) and isinstance(evaluating, str)):
+            return None
+        if not (q_type.strip() and question.strip()):
+            return None
+
+        return {
+            "type": q_type.strip().lower(),
+            "question": question.strip(),
+            "evaluating": evaluating.strip(),
+        }
+
+
+class _StreamSpan:
+    """Times a streamed completion, which spans generator yields."""
+
+    def __init__(self, prompt: str, **attributes):
+        self.prompt = prompt
+        self.attributes = attributes
+        self.start = time.perf_counter()
+        self.first_question_ms = None
+        self.text = []
+        # Stats of an earlier call in this context must not leak into this span
+        pop_call_stats()
+
+    def feed(self, chunk: str) -> None:
+        self.text.append(chunk)
+
+    def first_question(self) -> None:
+        if self.first_question_ms is None:
+            self.first_question_ms = round((time.perf_counter() - self.start) * 1e3, 3)
+
+    def finish(self, status: str = "ok") -> None:
+        response = SimpleNamespace(content="".join(self.text))
+        record_span(
+            "llm.questions",
+            (time.perf_counter() - self.start) * 1e3,
+            status=status,
+            streamed=True,
+            first_question_ms=self.first_question_ms,
+            **self.attributes,
+            **pop_call_stats(),
+            **log_prompt_tokens(logger, "questions", [self.prompt], response),
+        )
+
+
 class QuestionGenerator:
     """Generate interview questions based on candidate profile."""
     
     def __init__(self):
         """Initialize question generator."""
-        self.llm = self._initialize_llm()
+        self._llm = None
         self.question_types = settings.get('interview.question_types')
         self.min_questions = settings.get('interview.min_questions',5)
         self.max_questions = settings.get('interview.max_questions',15)
+        self.generation_mode = settings.get('interview.generation_mode', 'single')
+        if self.generation_mode not in GENERATION_MODES:
+            raise ValueError(
+                f"Unsupported generation mode: {self.generation_mode} "
+                f"(available: {', '.join(GENERATION_MODES)})"
+            )
+        # Follow-up calls for questions missing from a short or repetitive response
+        self.top_up_rounds = settings.get('interview.top_up.max_rounds', 1)
+        self.duplicate_threshold = settings.get('interview.top_up.similarity_threshold', 0.9)
+        self.output_format = settings.get('interview.output_format', 'text')
+        if self.output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unsupported output format: {self.output_format} "
+                f"(available: {', '.join(OUTPUT_FORMATS)})"
+            )
+        # Provider-side JSON mode, passed with every question call in json format
+        self._llm_kwargs = {}
+        if self.output_format == 'json' and settings.get('interview.json_response_format', True):
+            self._llm_kwargs = {'response_format': {'type': 'json_object'}}
+        self.bank_mode = settings.get('question_bank.mode', 'fallback')
+        if self.bank_mode not in BANK_MODES:
+            raise ValueError(
+                f"Unsupported question bank mode: {self.bank_mode} "
+                f"(available: {', '.join(BANK_MODES)})"
+            )
+        self.cache = self._initialize_cache()
+    
+    @property
+    def llm(self):
+        """LLM client, created when the first question set is generated."""
+        if self._llm is None:
+            self._llm = self._initialize_llm()
+        return self._llm
+
+    @llm.setter
+    def llm(self, llm) -> None:
+        self._llm = llm
     
     def _initialize_llm(self):
-        """Initialize LLM based on configuration."""
-        provider = settings.get('llm.provider', 'groq')
+        """Shared LLM client for the configured provider."""
+        return get_llm()
+
+    @property
+    def question_bank(self) -> Optional[QuestionBank]:
+        """Shared offline question bank, or None when `question_bank.enabled` is off."""
+        return get_question_bank()
+
+    def _initialize_cache(self) -> Optional[QuestionCache]:
+        """Build the question-set cache from the `cache.questions` config section."""
+        if not settings.get('cache.questions.enabled', False):
+            return None
         
-        if provider == 'groq':
-            api_key = settings.groq_api_key
-            if not api_key:
-                raise ValueError("GROQ_API_KEY not found in environment variables")
-            
-            return ChatGroq(
-                api_key=api_key,
-                model=settings.get('llm.model', 'mixtral-8x7b-32768'),
-                temperature=settings.get('llm.temperature', 0.7),
-                max_tokens=settings.get('llm.max_tokens', 2048)
-            )
-        else:
-            raise ValueError(f"Unsupported LLM provider: {provider}")
+        return QuestionCache(
+            max_entries=settings.get('cache.questions.max_entries', 512),
+            ttl_seconds=settings.get('cache.questions.ttl_seconds'),
+            similarity_threshold=settings.get('cache.questions.similarity_threshold'),
+        )
 
     def generate_questions(
         self,
@@ -54,6 +387,308 @@ class QuestionGenerator:
         Returns:
             List of question dictionaries with type and text
         """
+        return self.generate_questions_cached(candidate_info, role, num_questions)[0]
+    
+    def generate_questions_cached(
+        self,
+        candidate_info: Dict,
+        role: str,
+        num_questions: int = None
+    ) -> Tuple[List[Dict[str, str]], Dict]:
+        """
+        Generate questions, reusing sets cached for equivalent profiles.
+        
+        Returns:
+            (questions, cache outcome) - the outcome is empty when the
+            question cache is disabled
+        """
+        if self.bank_mode == 'instant':
+            return self._instant_questions(candidate_info, role, num_questions)
+        
+        parts, num_questions, fingerprint = self._prepare_prompt(
+            candidate_info, role, num_questions
+        )
+        
+        cached, outcome = self._cache_lookup(fingerprint)
+        if cached is not None:
+            return cached, outcome
+        
+        # Generate questions
+        results = self._generate_parts(parts)
+        return self._merge_parts(parts, results, role, num_questions, fingerprint), outcome
+    
+    def regenerate_questions(
+        self,
+        candidate_info: Dict,
+        role: str,
+        question_type: str = None,
+        num_questions: int = None,
+        exclude: List[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Generate a fresh set, bypassing the cache lookup.
+        
+        Args:
+            candidate_info: Saved candidate profile
+            role: Role being applied for
+            question_type: Only generate questions of this type
+            num_questions: Count (for one type: not clamped to min/max)
+            exclude: Existing questions the model should not repeat
+            
+        Returns:
+            List of question dictionaries with type and text
+        """
+        if question_type is None:
+            if self.bank_mode == 'instant':
+                return self.bank_questions(candidate_info, role, num_questions, exclude=exclude)
+            
+            parts, num_questions, fingerprint = self._prepare_prompt(
+                candidate_info, role, num_questions, exclude
+            )
+            # A replaced full set becomes the cached set for this profile
+            return self._merge_parts(parts, self._generate_parts(parts), role, num_questions, fingerprint)
+        
+        if question_type not in self.question_types:
+            raise ValueError(
+                f"Unknown question type: {question_type} (available: {', '.join(self.question_types)})"
+            )
+        
+        if self.bank_mode == 'instant':
+            return self.bank_questions(candidate_info, role, num_questions, question_type, exclude)
+        
+        difficulty = self._candidate_difficulty(candidate_info)
+        part = self._build_part(
+            candidate_info, role, difficulty, [question_type], question_type, max(1, num_questions or 1), exclude
+        )
+        questions = self._generate_part(part)
+        return questions if part['ok'] else self._part_fallback(part, role)
+    
+    async def agenerate_questions(
+        self,
+        candidate_info: Dict,
+        role: str,
+        num_questions: int = None
+    ) -> List[Dict[str, str]]:
+        """Async variant of generate_questions built on ``ainvoke``."""
+        return (await self.agenerate_questions_cached(candidate_info, role, num_questions))[0]
+    
+    async def agenerate_questions_cached(
+        self,
+        candidate_info: Dict,
+        role: str,
+        num_questions: int = None
+    ) -> Tuple[List[Dict[str, str]], Dict]:
+        """Async variant of generate_questions_cached."""
+        if self.bank_mode == 'instant':
+            return self._instant_questions(candidate_info, role, num_questions)
+        
+        parts, num_questions, fingerprint = self._prepare_prompt(
+            candidate_info, role, num_questions
+        )
+        
+        cached, outcome = self._cache_lookup(fingerprint)
+        if cached is not None:
+            return cached, outcome
+        
+        results = await asyncio.gather(*(self._agenerate_part(part) for part in parts))
+        return self._merge_parts(parts, results, role, num_questions, fingerprint), outcome
+    
+    def stream_questions(
+        self,
+        candidate_info: Dict,
+        role: str,
+        num_questions: int = None,
+        cache_outcome: Optional[Dict] = None
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Stream questions as the LLM produces them.
+
+        Yields each question dict as soon as it is complete, so the first
+        question is available long before the full completion. A cached
+        set is yielded immediately; ``cache_outcome``, if given, is
+        updated with the lookup result. In per_type mode all types are
+        streamed concurrently and yielded in type order. In the bank's
+        instant mode the bank set is yielded without calling the LLM.
+        """
+        if self.bank_mode == 'instant':
+            questions, outcome = self._instant_questions(candidate_info, role, num_questions)
+            if cache_outcome is not None:
+                cache_outcome.update(outcome)
+            yield from questions
+            return
+        
+        parts, num_questions, fingerprint = self._prepare_prompt(
+            candidate_info, role, num_questions
+        )
+        
+        cached, outcome = self._cache_lookup(fingerprint)
+        if cache_outcome is not None:
+            cache_outcome.update(outcome)
+        if cached is not None:
+            yield from cached
+            return
+        
+        if len(parts) == 1:
+            stream = self._stream_part(parts[0], role)
+        else:
+            stream = self._stream_fan_out(parts, role)
+        
+        questions = []
+        for question in stream:
+            questions.append(question)
+            yield question
+        
+        logger.info(f"Streamed {len(questions)} questions")
+        if self._parts_complete(parts):
+            self._cache_store(fingerprint, questions)
+    
+    async def astream_questions(
+        self,
+        candidate_info: Dict,
+        role: str,
+        num_questions: int = None,
+        cache_outcome: Optional[Dict] = None
+    ) -> AsyncIterator[Dict[str, str]]:
+        """Async variant of stream_questions built on ``astream``."""
+        if self.bank_mode == 'instant':
+            questions, outcome = self._instant_questions(candidate_info, role, num_questions)
+            if cache_outcome is not None:
+                cache_outcome.update(outcome)
+            for question in questions:
+                yield question
+            return
+        
+        parts, num_questions, fingerprint = self._prepare_prompt(
+            candidate_info, role, num_questions
+        )
+        
+        cached, outcome = self._cache_lookup(fingerprint)
+        if cache_outcome is not None:
+            cache_outcome.update(outcome)
+        if cached is not None:
+            for question in cached:
+                yield question
+            return
+        
+        if len(parts) == 1:
+            stream = self._astream_part(parts[0], role)
+        else:
+            stream = self._astream_fan_out(parts, role)
+        
+        questions = []
+        async for question in stream:
+            questions.append(question)
+            yield question
+        
+        logger.info(f"Streamed {len(questions)} questions")
+        if self._parts_complete(parts):
+            self._cache_store(fingerprint, questions)
+    
+    # =========================
+    # QUESTION BANK
+    # =========================
+    
+    def bank_questions(
+        self,
+        candidate_info: Dict,
+        role: str,
+        num_questions: int = None,
+        question_type: str = None,
+        exclude: List[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Question set from the offline bank, without an LLM call.
+        
+        Uses the same counts and type split as generation (one type: not
+        clamped to min/max). Types the bank cannot fill get the generic
+        fallback questions. Each question has ``"source": "bank"`` (or
+        ``"fallback"``).
+        """
+        if question_type is not None:
+            quotas = [(question_type, max(1, num_questions or 1))]
+        else:
+            if num_questions is None:
+                num_questions = self.max_questions
+            num_questions = max(self.min_questions, min(num_questions, self.max_questions))
+            quotas = self._type_counts(num_questions)
+        
+        difficulty = self._candidate_difficulty(candidate_info)
+        return self._bank_set(candidate_info, role, difficulty, quotas, exclude)
+    
+    def remember(
+        self,
+        candidate_info: Dict,
+        questions: List[Dict[str, str]],
+        provider: Optional[str]
+    ) -> int:
+        """
+        Add a completed run's generated questions to the bank (only from a
+        real LLM provider). Returns how many were new.
+        """
+        bank = self.question_bank
+        if bank is None:
+            return 0
+        return add_result(bank, candidate_info, questions, provider)
+    
+    def _instant_questions(
+        self,
+        candidate_info: Dict,
+        role: str,
+        num_questions: int = None
+    ) -> Tuple[List[Dict[str, str]], Dict]:
+        questions = self.bank_questions(candidate_info, role, num_questions)
+        logger.info(f"Served {len(questions)} questions from the question bank for role: {role}")
+        return questions, {'hit': True, 'match': 'bank'}
+    
+    def _bank_set(
+        self,
+        candidate_info: Dict,
+        role: str,
+        difficulty: str,
+        quotas: List[Tuple[str, int]],
+        exclude: List[str] = None
+    ) -> List[Dict[str, str]]:
+        """Bank questions per ``(type, count)`` quota, topped up from the generic fallback set."""
+        bank = self.question_bank
+        selected = []
+        if bank is not None:
+            with span('question_bank.select', role=role, difficulty=difficulty) as s:
+                selected = bank.select(
+                    role, candidate_info.get('skills') or [], quotas, difficulty, exclude or []
+                )
+                s.set(questions=len(selected))
+        
+        fallback = self._get_fallback_questions(role, self.max_questions)
+        questions = []
+        for q_type, count in quotas:
+            of_type = [q for q in selected if q['type'] == q_type]
+            of_type += [q for q in fallback if q['type'] == q_type][:count - len(of_type)]
+            questions.extend(of_type)
+        
+        metrics.increment(
+            'question_bank_selections_total',
+            outcome='full' if len(questions) >= sum(count for _, count in quotas) else 'partial',
+        )
+        return questions
+    
+    # =========================
+    # PROMPT PARTS
+    # =========================
+    
+    def _prepare_prompt(
+        self,
+        candidate_info: Dict,
+        role: str,
+        num_questions: int = None,
+        exclude: List[str] = None
+    ) -> Tuple[List[Dict], int, Tuple]:
+        """
+        Clamp the question count and build the prompt parts and profile fingerprint.
+        
+        A part is one LLM call: {"type", "count", "prompt", "ok", ...}.
+        Single mode has one part covering all types (type None); per_type
+        mode has one part per question type, in type order.
+        """
         if num_questions is None:
             num_questions = self.max_questions
         
@@ -62,51 +697,512 @@ class QuestionGenerator:
         logger.info(f"Generating {num_questions} questions for role: {role}")
         
         # Determine difficulty level based on experience
-        experience_years = candidate_info.get('experience_years', 0)
-        difficulty = self._determine_difficulty(experience_years)
+        difficulty = self._candidate_difficulty(candidate_info)
+        
+        # Create prompts
+        if self.generation_mode == 'per_type':
+            plan = [([q_type], q_type, count) for q_type, count in self._type_counts(num_questions)]
+        else:
+            plan = [(self.question_types, None, num_questions)]
+        
+        parts = [
+            self._build_part(candidate_info, role, difficulty, types, q_type, count, exclude)
+            for types, q_type, count in plan
+        ]
+        
+        fingerprint = None
+        if self.cache is not None:
+            fingerprint = self.cache.fingerprint(
+                role,
+                difficulty,
+                candidate_info.get('skills', []),
+                self.question_types,
+                num_questions,
+            )
+        return parts, num_questions, fingerprint
+    
+    def _build_part(
+        self,
+        candidate_info: Dict,
+        role: str,
+        difficulty: str,
+        question_types: List[str],
+        q_type: Optional[str],
+        count: int,
+        exclude: List[str] = None
+    ) -> Dict:
+        return {
+            'type': q_type,
+            'count': count,
+            'prompt': self._create_question_prompt(
+                candidate_info, role, difficulty, count, question_types=question_types, exclude=exclude
+            ),
+            'ok': False,
+            # For top-up prompts: what the part was built from, and how many questions it still lacks
+            'profile': (candidate_info, role, difficulty),
+            'exclude': list(exclude or []),
+            'missing': 0,
+        }
+    
+    def _type_counts(self, num_questions: int) -> List[Tuple[str, int]]:
+        """Spread the questions evenly over the types; earlier types get the remainder."""
+        per_type, remainder = divmod(num_questions, len(self.question_types))
+        counts = [
+            (q_type, per_type + (1 if i < remainder else 0))
+            for i, q_type in enumerate(self.question_types)
+        ]
+        return [(q_type, count) for q_type, count in counts if count]
+    
+    def _generate_parts(self, parts: List[Dict]) -> List[Optional[List[Dict[str, str]]]]:
+        """Run the parts' LLM calls (concurrently when there are several)."""
+        if len(parts) == 1:
+            return [self._generate_part(parts[0])]
+        
+        with ThreadPoolExecutor(max_workers=len(parts), thread_name_prefix="question-part") as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, self._generate_part, part)
+                for part in parts
+            ]
+            return [future.result() for future in futures]
+    
+    def _generate_part(self, part: Dict) -> Optional[List[Dict[str, str]]]:
+        """Questions for one part (topped up when short), or None if its call failed or gave none."""
+        try:
+            with span('llm.questions', **self._part_attributes(part)) as s:
+                response = self.llm.invoke(part['prompt'], **self._llm_kwargs)
+                s.set(**log_prompt_tokens(logger, "questions", [part['prompt']], response))
+            accepted = self._accept(part, self._parse_part(part, response.content))
+        
+        except Exception as e:
+            logger.error(f"Error generating questions{self._part_label(part)}: {e}")
+            return None
+        
+        self._top_up(part, accepted)
+        part['ok'] = bool(accepted)
+        return accepted if accepted else None
+    
+    async def _agenerate_part(self, part: Dict) -> Optional[List[Dict[str, str]]]:
+        try:
+            with span('llm.questions', **self._part_attributes(part)) as s:
+                response = await self.llm.ainvoke(part['prompt'], **self._llm_kwargs)
+                s.set(**log_prompt_tokens(logger, "questions", [part['prompt']], response))
+            accepted = self._accept(part, self._parse_part(part, response.content))
+        
+        except Exception as e:
+            logger.error(f"Error generating questions{self._part_label(part)}: {e}")
+            return None
+        
+        await self._atop_up(part, accepted)
+        part['ok'] = bool(accepted)
+        return accepted if accepted else None
+    
+    def _merge_parts(
+        self,
+        parts: List[Dict],
+        results: List[Optional[List[Dict[str, str]]]],
+        role: str,
+        num_questions: int,
+        fingerprint: Optional[Tuple]
+    ) -> List[Dict[str, str]]:
+        """Concatenate part results in type order, filling failed parts from the fallback set."""
+        if not any(part['ok'] for part in parts):
+            # Return fallback questions
+            return [q for part in parts for q in self._part_fallback(part, role)]
         
-        # Create prompt
+        questions = []
+        for part, result in zip(parts, results):
+            questions.extend(result if part['ok'] else self._part_fallback(part, role))
+        
+        logger.info(f"Generated {len(questions)} questions")
+        if self._parts_complete(parts):
+            self._cache_store(fingerprint, questions)
+        return questions
+    
+    def _stream_part(self, part: Dict, role: str) -> Iterator[Dict[str, str]]:
+        parser = self._question_parser()
+        accepted = []
+        stream_span = _StreamSpan(part['prompt'], **self._part_attributes(part))
+
+        try:
+            with closing(self.llm.stream(part['prompt'], **self._llm_kwargs)) as chunks:
+                for chunk in chunks:
+                    stream_span.feed(chunk.content)
+                    for question in parser.feed(chunk.content):
+                        if self._admit(part, self._label(part, question), accepted):
+                            stream_span.first_question()
+                            yield question
+                    if self._part_full(part, len(accepted)):
+                        # Stop paying for output beyond this part's count
+                        break
+
+            for question in parser.close():
+                if self._admit(part, self._label(part, question), accepted):
+                    yield question
+
+            self._record_parse(parser)
+            part['ok'] = True
+            stream_span.finish()
+
+        except Exception as e:
+            logger.error(f"Error streaming questions{self._part_label(part)}: {e}")
+            stream_span.finish(status="error")
+            if not accepted:
+                yield from self._part_fallback(part, role)
+                return
+
+        # Salvage a truncated or partly unparseable response with a small follow-up call
+        yield from self._top_up(part, accepted)
+    
+    async def _astream_part(self, part: Dict, role: str) -> AsyncIterator[Dict[str, str]]:
+        parser = self._question_parser()
+        accepted = []
+        stream_span = _StreamSpan(part['prompt'], **self._part_attributes(part))
+
+        try:
+            async with aclosing(self.llm.astream(part['prompt'], **self._llm_kwargs)) as chunks:
+                async for chunk in chunks:
+                    stream_span.feed(chunk.content)
+                    for question in parser.feed(chunk.content):
+                        if self._admit(part, self._label(part, question), accepted):
+                            stream_span.first_question()
+                            yield question
+                    if self._part_full(part, len(accepted)):
+                        break
+
+            for question in parser.close():
+                if self._admit(part, self._label(part, question), accepted):
+                    yield question
+
+            self._record_parse(parser)
+            part['ok'] = True
+            stream_span.finish()
+
+        except Exception as e:
+            logger.error(f"Error streaming questions{self._part_label(part)}: {e}")
+            stream_span.finish(status="error")
+            if not accepted:
+                for question in self._part_fallback(part, role):
+                    yield question
+                return
+
+        for question in await self._atop_up(part, accepted):
+            yield question
+    
+    def _stream_fan_out(self, parts: List[Dict], role: str) -> Iterator[Dict[str, str]]:
+        """Stream all parts concurrently; yield each part's questions in type order."""
+        queues = [queue.SimpleQueue() for _ in parts]
+
+        def pump(part: Dict, out: queue.SimpleQueue) -> None:
+            try:
+                for question in self._stream_part(part, role):
+                    out.put(question)
+            finally:
+                out.put(_PART_DONE)
+
+        pool = ThreadPoolExecutor(max_workers=len(parts), thread_name_prefix="question-part")
+        try:
+            for part, out in zip(parts, queues):
+                pool.submit(contextvars.copy_context().run, pump, part, out)
+
+            for out in queues:
+                for question in iter(out.get, _PART_DONE):
+                    yield question
+        finally:
+            # Do not block a consumer that stops early on the remaining streams
+            pool.shutdown(wait=False)
+    
+    async def _astream_fan_out(self, parts: List[Dict], role: str) -> AsyncIterator[Dict[str, str]]:
+        queues = [asyncio.Queue() for _ in parts]
+
+        async def pump(part: Dict, out: asyncio.Queue) -> None:
+            try:
+                async for question in self._astream_part(part, role):
+                    out.put_nowait(question)
+            finally:
+                out.put_nowait(_PART_DONE)
+
+        tasks = [asyncio.create_task(pump(part, out)) for part, out in zip(parts, queues)]
+        try:
+            for out in queues:
+                while (question := await out.get()) is not _PART_DONE:
+                    yield question
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _parse_part(self, part: Dict, response_text: str) -> List[Dict[str, str]]:
+        return [self._label(part, q) for q in self._parse_questions(response_text)]
+    
+    def _label(self, part: Dict, question: Dict[str, str]) -> Dict[str, str]:
+        # Per-type calls know their type; the model's label spelling may differ
+        if part['type'] is not None:
+            question['type'] = part['type']
+        else:
+            q_type = question['type'].replace('-', '_').replace(' ', '_')
+            if q_type in self.question_types:
+                question['type'] = q_type
+        return question
+    
+    def _part_full(self, part: Dict, accepted: int) -> bool:
+        return accepted >= part['count']
+    
+    def _parts_complete(self, parts: List[Dict]) -> bool:
+        """Whether every part's call succeeded with its full count (worth caching)."""
+        return all(part['ok'] and not part['missing'] for part in parts)
+    
+    # =========================
+    # SHORTFALL TOP-UP
+    # =========================
+    
+    def _accept(self, part: Dict, questions: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        accepted = []
+        for question in questions:
+            self._admit(part, question, accepted)
+        return accepted
+    
+    def _admit(self, part: Dict, question: Dict[str, str], accepted: List[Dict[str, str]]) -> bool:
+        """
+        Append a parsed question to ``accepted`` unless the part is full,
+        or the question is empty or a near-duplicate of one already
+        accepted (of the same type) or excluded.
+        """
+        if self._part_full(part, len(accepted)):
+            return False
+        
+        if not question.get('question'):
+            reason = 'empty'
+        elif self._is_near_duplicate(question, accepted, part['exclude']):
+            reason = 'duplicate'
+        else:
+            accepted.append(question)
+            return True
+        
+        metrics.increment('questions_dropped_total', format=self.output_format, reason=reason)
+        logger.info(f"Dropped {reason} {question.get('type')} question{self._part_label(part)}")
+        return False
+    
+    def _is_near_duplicate(
+        self,
+        question: Dict[str, str],
+        accepted: List[Dict[str, str]],
+        exclude: List[str]
+    ) -> bool:
+        words = self._question_words(question['question'])
+        others = [q['question'] for q in accepted if q['type'] == question['type']] + exclude
+        
+        for other in others:
+            other_words = self._question_words(other)
+            union = len(words | other_words)
+            if union and len(words & other_words) / union >= self.duplicate_threshold:
+                return True
+        return False
+    
+    @staticmethod
+    def _question_words(text: str) -> set:
+        return set(_QUESTION_WORD.findall(text.lower()))
+    
+    def _missing(self, part: Dict, accepted: List[Dict[str, str]]) -> List[Tuple[str, int]]:
+        """Question types short of their share of the part's count, with how many are missing."""
+        total_missing = part['count'] - len(accepted)
+        if total_missing <= 0:
+            return []
+        if part['type'] is not None:
+            return [(part['type'], total_missing)]
+        
+        missing = []
+        for q_type, quota in self._type_counts(part['count']):
+            have = sum(1 for q in accepted if q['type'] == q_type)
+            count = min(quota - have, total_missing - sum(n for _, n in missing))
+            if count > 0:
+                missing.append((q_type, count))
+        return missing
+    
+    def _top_up_prompt(self, part: Dict, missing: List[Tuple[str, int]], accepted: List[Dict[str, str]]) -> str:
+        candidate_info, role, difficulty = part['profile']
         prompt = self._create_question_prompt(
             candidate_info,
             role,
             difficulty,
-            num_questions
+            sum(count for _, count in missing),
+            question_types=[q_type for q_type, _ in missing],
+            exclude=[q['question'] for q in accepted] + part['exclude'],
         )
+        if len(missing) > 1:
+            prompt += "\nCOUNT PER TYPE: " + ", ".join(f"{count} {q_type}" for q_type, count in missing) + "\n"
+        return prompt
+    
+    def _admit_top_up(
+        self,
+        part: Dict,
+        missing: List[Tuple[str, int]],
+        response_text: str,
+        accepted: List[Dict[str, str]]
+    ) -> List[Dict[str, str]]:
+        """Accept follow-up questions of the missing types, up to the missing counts where possible."""
+        wanted = dict(missing)
+        added, leftover = [], []
+        for question in self._parse_part(part, response_text):
+            if len(wanted) == 1:
+                # Asked for one type only, so the model's label does not matter
+                question['type'] = next(iter(wanted))
+            if question['type'] not in wanted:
+                continue
+            if wanted[question['type']] <= 0:
+                leftover.append(question)
+            elif self._admit(part, question, accepted):
+                wanted[question['type']] -= 1
+                added.append(question)
         
-        # Generate questions
-        try:
-            response = self.llm.invoke(prompt)
-            questions = self._parse_questions(response.content)
+        # The model may not split the count as asked; other requested types fill the rest
+        for question in leftover:
+            if self._admit(part, question, accepted):
+                added.append(question)
+        return added
+    
+    def _top_up(self, part: Dict, accepted: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Ask for only the questions a part is still missing, with the
+        accepted ones listed as exclusions, for up to
+        `interview.top_up.max_rounds` follow-up calls.
+        
+        Extends ``accepted`` and returns the questions it added.
+        """
+        added, rounds = [], 0
+        for _ in range(self.top_up_rounds):
+            missing = self._missing(part, accepted)
+            if not missing:
+                break
             
-            logger.info(f"Generated {len(questions)} questions")
-            return questions
+            rounds += 1
+            prompt = self._top_up_prompt(part, missing, accepted)
+            try:
+                requested = sum(count for _, count in missing)
+                with span('llm.questions_top_up', requested=requested, **self._part_attributes(part)) as s:
+                    response = self.llm.invoke(prompt, **self._llm_kwargs)
+                    s.set(**log_prompt_tokens(logger, "questions_top_up", [prompt], response))
+                    new = self._admit_top_up(part, missing, response.content, accepted)
+                    s.set(accepted=len(new))
+            except Exception as e:
+                logger.warning(f"Question top-up failed{self._part_label(part)}: {e}")
+                break
             
-        except Exception as e:
-            logger.error(f"Error generating questions: {e}")
-            # Return fallback questions
-            return self._get_fallback_questions(role, num_questions)
+            added.extend(new)
+            if not new:
+                break
+        
+        self._record_top_up(part, accepted, added, rounds)
+        return added
     
-    def _determine_difficulty(self, experience_years: int) -> str:
-        """Determine difficulty level based on experience."""
-        difficulty_levels = settings.get('interview.difficulty_levels', {})
+    async def _atop_up(self, part: Dict, accepted: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        added, rounds = [], 0
+        for _ in range(self.top_up_rounds):
+            missing = self._missing(part, accepted)
+            if not missing:
+                break
+            
+            rounds += 1
+            prompt = self._top_up_prompt(part, missing, accepted)
+            try:
+                requested = sum(count for _, count in missing)
+                with span('llm.questions_top_up', requested=requested, **self._part_attributes(part)) as s:
+                    response = await self.llm.ainvoke(prompt, **self._llm_kwargs)
+                    s.set(**log_prompt_tokens(logger, "questions_top_up", [prompt], response))
+                    new = self._admit_top_up(part, missing, response.content, accepted)
+                    s.set(accepted=len(new))
+            except Exception as e:
+                logger.warning(f"Question top-up failed{self._part_label(part)}: {e}")
+                break
+            
+            added.extend(new)
+            if not new:
+                break
         
-        for level, (min_exp, max_exp) in difficulty_levels.items():
-            if min_exp <= experience_years < max_exp:
-                return level
+        self._record_top_up(part, accepted, added, rounds)
+        return added
+    
+    def _record_top_up(
+        self,
+        part: Dict,
+        accepted: List[Dict[str, str]],
+        added: List[Dict[str, str]],
+        rounds: int
+    ) -> None:
+        part['missing'] = max(part['count'] - len(accepted), 0)
+        if not rounds:
+            return
         
-        return 'mid'
+        metrics.increment(
+            'question_top_ups_total',
+            format=self.output_format,
+            outcome='short' if part['missing'] else 'filled',
+        )
+        log = logger.warning if part['missing'] else logger.info
+        log(
+            f"Question top-up{self._part_label(part)}: added {len(added)}, "
+            f"{part['missing']} of {part['count']} still missing"
+        )
+    
+    def _part_fallback(self, part: Dict, role: str) -> List[Dict[str, str]]:
+        """Bank questions in place of a failed part, for the profile it was built from."""
+        candidate_info, _, difficulty = part['profile']
+        if part['type'] is None:
+            quotas = self._type_counts(part['count'])
+        else:
+            quotas = [(part['type'], part['count'])]
+        return self._bank_set(candidate_info, role, difficulty, quotas, part['exclude'])
+    
+    def _part_attributes(self, part: Dict) -> Dict:
+        return {'question_type': part['type']} if part['type'] else {}
+    
+    def _part_label(self, part: Dict) -> str:
+        return f" ({part['type']})" if part['type'] else ""
+    
+    def _cache_lookup(self, fingerprint: Optional[Tuple]) -> Tuple[Optional[List[Dict[str, str]]], Dict]:
+        if fingerprint is None:
+            return None, {}
+        
+        questions, outcome = self.cache.get(*fingerprint)
+        if questions is not None:
+            logger.info(
+                f"Question cache hit ({outcome['match']}, "
+                f"similarity={outcome['similarity']})"
+            )
+        return questions, outcome
+    
+    def _cache_store(self, fingerprint: Optional[Tuple], questions: List[Dict[str, str]]) -> None:
+        if fingerprint is not None and questions:
+            self.cache.set(*fingerprint, questions)
+    
+    def _determine_difficulty(self, experience_years: int) -> str:
+        """Determine difficulty level based on experience."""
+        return difficulty_level(experience_years)
+    
+    def _candidate_difficulty(self, candidate_info: Dict) -> str:
+        """Difficulty for a profile (junior when its experience is unknown)."""
+        return self._determine_difficulty(experience_years(candidate_info) or 0)
     
     def _create_question_prompt(
         self,
         candidate_info: Dict,
         role: str,
         difficulty: str,
-        num_questions: int
+        num_questions: int,
+        question_types: List[str] = None,
+        exclude: List[str] = None
     ) -> str:
-        """Create prompt for question generation."""
+        """Create prompt for question generation (for all types unless given)."""
+        question_types = question_types or self.question_types
         skills = ', '.join(candidate_info.get('skills', []))
-        experience = candidate_info.get('experience_years', 'unknown')
+        years = experience_years(candidate_info)
+        if years is not None:
+            experience = f"{round(years, 1):g} years"
+        else:
+            experience = candidate_info.get('experience') or 'unknown'
         education = ', '.join(candidate_info.get('education', []))
+        if self.output_format == 'json':
+            format_rules = JSON_FORMAT_RULES.format(types=', '.join(question_types))
+        else:
+            format_rules = TEXT_FORMAT_RULES
         
         prompt = f"""
 You are an expert interviewer specializing in the role of **{role}**.
@@ -118,13 +1214,13 @@ IMPORTANT RULES (MUST FOLLOW):
 
 Candidate Profile:
 - Role: {role}
-- Experience Level: {experience} years
+- Experience Level: {experience}
 - Skills: {skills}
 - Education: {education}
 - Difficulty Level: {difficulty}
 
 Question Types to Generate:
-{', '.join(self.question_types)}
+{', '.join(question_types)}
 
 STRUCTURE REQUIREMENTS:
 - Group questions by type (ALL technical together, ALL behavioral together, etc.)
@@ -145,14 +1241,7 @@ QUESTION TYPE GUIDELINES:
 - Experience-based:
   - Deep dive into candidate’s past roles, responsibilities, decisions
 
-FORMAT (STRICT):
-1. [Technical]
-   Question: <question text>
-   Evaluating: <skill or competency>
-
-2. [Behavioral]
-   Question: <question text>
-   Evaluating: <skill or competency>
+{format_rules}
 
 QUALITY BAR:
 - Questions must be realistic, job-relevant, and interview-ready
@@ -160,54 +1249,42 @@ QUALITY BAR:
 - NO coding / NO algorithms unless role demands it
 """
 
+        if exclude:
+            prompt += "\nDO NOT REPEAT OR REPHRASE THESE EXISTING QUESTIONS:\n"
+            prompt += "\n".join(f"- {question}" for question in exclude) + "\n"
+
         return prompt
     
     def _parse_questions(self, response_text: str) -> List[Dict[str, str]]:
-        questions = []
-        current = None
-
-        for raw_line in response_text.splitlines():
-            line = raw_line.strip()
-
-            if not line:
-                continue
-
-            # 1. New question block
-            if line[0].isdigit() and "[" in line and "]" in line:
-                if current:
-                    questions.append(current)
-
-                q_type = line[line.find("[") + 1 : line.find("]")].lower()
-
-                current = {
-                    "type": q_type,
-                    "question": "",
-                    "evaluating": "",
-                }
-                continue
-
-            if not current:
-                continue
-
-            # 2. Question text (support multiple formats)
-            if line.lower().startswith("question:"):
-                current["question"] = line.split(":", 1)[1].strip()
-
-            elif line.lower().startswith("q:"):
-                current["question"] = line.split(":", 1)[1].strip()
-
-            # 3. Evaluating line
-            elif line.lower().startswith("evaluating:"):
-                current["evaluating"] = line.split(":", 1)[1].strip()
-
-            # 4. Fallback: plain sentence line
-            elif not current["question"] and len(line) > 10:
-                current["question"] = line
-
-        if current:
-            questions.append(current)
-
+        parser = self._question_parser()
+        questions = parser.feed(response_text) + parser.close()
+        self._record_parse(parser)
         return questions
+    
+    def _question_parser(self):
+        """Incremental parser for the configured output format."""
+        return JSONQuestionParser() if self.output_format == 'json' else IncrementalQuestionParser()
+    
+    def _record_parse(self, parser) -> None:
+        """
+        Parse outcome metrics per output format: blocks that were valid or
+        not, and whether the response was parsed, needed the text fallback
+        or gave nothing.
+        """
+        if parser.invalid:
+            metrics.increment('question_blocks_total', parser.invalid, format=parser.format, outcome='invalid')
+        if parser.valid:
+            metrics.increment('question_blocks_total', parser.valid, format=parser.format, outcome='valid')
+        
+        if not parser.valid:
+            outcome = 'unparseable'
+        elif getattr(parser, 'fell_back', False):
+            outcome = 'fallback'
+        else:
+            outcome = 'ok'
+        metrics.increment('question_responses_total', format=parser.format, outcome=outcome)
+        if outcome != 'ok':
+            logger.warning(f"Question response {outcome} as {parser.format} ({parser.invalid} invalid blocks)")
 
     
     def _get_fallback_questions(self, role: str, num_questions: int) -> List[Dict[str, str]]:
@@ -240,4 +1317,4 @@ QUALITY BAR:
             },
         ]
         
-        return fallback[:num_questions]
\ No newline at end of file
+        return [dict(q, source='fallback') for q in fallback[:num_questions]]
\ No newline at end of file
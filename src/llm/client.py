@@ -0,0 +1,148 @@
+"""
+Shared LLM client factory with a pluggable provider registry.
+"""
+
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from config.settings import settings
+from src.llm.resilience import ResilientLLM
+
+
+LLMFactory = Callable[[Dict[str, Any]], Any]
+
+LLM_PROVIDERS: Dict[str, LLMFactory] = {}
+
+_clients: Dict[str, Any] = {}
+_http_client = None
+_lock = threading.RLock()
+
+
+def register_provider(name: str) -> Callable[[LLMFactory], LLMFactory]:
+    """Register a factory that builds a chat model from the `llm` config."""
+    def decorator(factory: LLMFactory) -> LLMFactory:
+        LLM_PROVIDERS[name.lower()] = factory
+        return factory
+    return decorator
+
+
+def llm_config(**overrides) -> Dict[str, Any]:
+    """The `llm` config section with per-call overrides applied."""
+    config = dict(settings.get("llm", {}) or {})
+    config.update({k: v for k, v in overrides.items() if v is not None})
+    return config
+
+
+def get_llm(**overrides) -> Any:
+    """
+    Return the shared chat model for the configured provider.
+
+    Components asking for the same configuration get the same instance,
+    so they also share its HTTP connection pools, latency history and
+    circuit breaker. Calls go through the `llm.resilience` policy.
+
+    Args:
+        overrides: Values replacing keys of the `llm` config (e.g. provider, model)
+
+    Returns:
+        A resilient LangChain chat model (invoke/ainvoke/stream/astream)
+    """
+    config = llm_config(**overrides)
+    key = json.dumps(config, sort_keys=True, default=str)
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = ResilientLLM(build_llm(config), config.get("resilience"))
+            _clients[key] = client
+        return client
+
+
+def build_llm(config: Dict[str, Any]) -> Any:
+    """Build a new (unshared) chat model from a full `llm` config dict."""
+    provider = str(config.get("provider", "groq")).lower()
+
+    factory = LLM_PROVIDERS.get(provider)
+    if factory is None:
+        raise ValueError(
+            f"Unsupported LLM provider: {provider} (available: {', '.join(LLM_PROVIDERS)})"
+        )
+    return factory(config)
+
+
+def reset_clients() -> None:
+    """Drop shared clients (e.g. after changing settings in tests or benchmarks)."""
+    global _http_client
+
+    with _lock:
+        _clients.clear()
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+def _shared_http_client(config: Dict[str, Any]):
+    """Process-wide pooled HTTP client for synchronous provider calls."""
+    global _http_client
+    import httpx
+
+    with _lock:
+        if _http_client is None:
+            http = config.get("http") or {}
+            _http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=http.get("max_connections", 20),
+                    max_keepalive_connections=http.get("max_keepalive_connections", 10),
+                ),
+                timeout=http.get("timeout", 60),
+            )
+        return _http_client
+
+
+# =========================
+# PROVIDERS
+# =========================
+
+@register_provider("groq")
+def _build_groq(config: Dict[str, Any]) -> Any:
+    from langchain_groq import ChatGroq
+
+    api_key = settings.groq_api_key
+    if not api_key:
+        raise ValueError("GROQ_API_KEY not found in environment variables")
+
+    # The async client is created by the (shared) model itself: an
+    # httpx.AsyncClient is bound to the event loop it first runs on.
+    return ChatGroq(
+        api_key=api_key,
+        model=config.get("model", "llama-3.3-70b-versatile"),
+        temperature=config.get("temperature", 0.7),
+        max_tokens=config.get("max_tokens", 2048),
+        http_client=_shared_http_client(config),
+        # Retries are handled by the resilience layer
+        max_retries=0,
+    )
+
+
+@register_provider("fake")
+def _build_fake(config: Dict[str, Any]) -> Any:
+    from src.llm.fake import FakeChatModel
+
+    fake = dict(config.get("fake") or {})
+
+    upstream: Optional[Any] = None
+    if fake.get("mode") == "record":
+        record_provider = fake.get("record_provider", "groq")
+        if record_provider == "fake":
+            raise ValueError("llm.fake.record_provider must be a real provider")
+        upstream = build_llm({**config, "provider": record_provider})
+
+    return FakeChatModel(
+        mode=fake.get("mode", "canned"),
+        latency_seconds=fake.get("latency_seconds", 0.0),
+        tokens_per_second=fake.get("tokens_per_second"),
+        responses=fake.get("responses") or [],
+        recording_path=fake.get("recording"),
+        upstream=upstream,
+    )
@@ -0,0 +1,268 @@
+"""
+Deterministic local stand-in for a chat model provider.
+
+Lets the whole pipeline run offline (tests, load tests, benchmarks) with
+controlled latency and token throughput.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+from src.utils.tokens import estimate_tokens
+
+
+FAKE_MODES = ("canned", "replay", "record")
+
+_WORD = re.compile(r"\S+\s*|\s+")
+
+
+def prompt_key(messages: List[BaseMessage]) -> str:
+    """Stable hash of a prompt, used to look up recorded responses."""
+    text = "\n".join(f"{m.type}:{m.content}" for m in messages)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _prompt_text(messages: List[BaseMessage]) -> str:
+    return "\n".join(str(m.content) for m in messages)
+
+
+# =========================
+# CANNED RESPONSES
+# =========================
+
+def _questions_response(prompt: str) -> str:
+    count = re.search(r"EXACTLY (\d+) questions", prompt)
+    role = re.search(r"role of \*\*(.+?)\*\*", prompt)
+    types = re.search(r"Question Types to Generate:\s*\n(.+)", prompt)
+
+    num_questions = int(count.group(1)) if count else 5
+    role = role.group(1) if role else "this role"
+    types = [t.strip() for t in types.group(1).split(",")] if types else ["technical"]
+
+    blocks, items = [], []
+    for i in range(num_questions):
+        q_type = types[i % len(types)]
+        label = q_type.replace("_", " ").title()
+        blocks.append(
+            f"{i + 1}. [{label}]\n"
+            f"   Question: {label} question {i + 1} for a {role}?\n"
+            f"   Evaluating: {label} competency {i + 1}\n"
+        )
+        items.append({
+            "type": q_type,
+            "question": f"{label} question {i + 1} for a {role}?",
+            "evaluating": f"{label} competency {i + 1}",
+        })
+
+    # The JSON output format (interview.output_format) asks for a "questions" object
+    if '{"questions"' in prompt:
+        return json.dumps({"questions": items}, separators=(",", ":"))
+    return "\n".join(blocks)
+
+
+def _skills_response(prompt: str) -> str:
+    # Hybrid prompts only ask for skills beyond the taxonomy matches
+    if "already found" in prompt:
+        return "NONE"
+    return "Communication, Problem Solving, Teamwork"
+
+
+# (marker, response) pairs tried in order after the configured rules;
+# a response may be a callable taking the prompt text
+DEFAULT_RESPONSES = [
+    ("PRIMARY job role", "Software Engineer"),
+    ("comma-separated list", _skills_response),
+    ("Generate EXACTLY", _questions_response),
+]
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model returning canned or recorded responses with simulated timing.
+
+    Modes:
+        canned: first configured rule whose ``match`` substring occurs in
+            the prompt, else a built-in response for the app's prompts
+        replay: responses from ``recording_path``, keyed by prompt hash
+        record: forward to ``upstream`` and append its responses to
+            ``recording_path`` (already recorded prompts are replayed)
+
+    Each call waits ``latency_seconds`` before the first token, then emits
+    tokens at ``tokens_per_second`` (None = instantly).
+    """
+
+    mode: str = "canned"
+    latency_seconds: float = 0.0
+    tokens_per_second: Optional[float] = None
+    responses: List[Dict[str, str]] = []
+    recording_path: Optional[str] = None
+    upstream: Optional[Any] = None
+
+    _recordings: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.mode not in FAKE_MODES:
+            raise ValueError(
+                f"Unsupported fake LLM mode: {self.mode} (available: {', '.join(FAKE_MODES)})"
+            )
+        if self.mode != "canned":
+            if not self.recording_path:
+                raise ValueError(f"Fake LLM mode '{self.mode}' requires a recording path")
+            self._recordings = self._load_recordings()
+        if self.mode == "record" and self.upstream is None:
+            raise ValueError("Fake LLM record mode requires an upstream model")
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    # =========================
+    # RESPONSES
+    # =========================
+
+    def _respond(self, messages: List[BaseMessage]) -> str:
+        key = prompt_key(messages)
+        if self.mode == "canned":
+            return self._canned(_prompt_text(messages))
+
+        recorded = self._recordings.get(key)
+        if recorded is not None:
+            return recorded
+        if self.mode == "replay":
+            raise KeyError(f"No recorded response for prompt {key[:12]}")
+
+        text = self.upstream.invoke(messages).content
+        self._record(key, text)
+        return text
+
+    async def _arespond(self, messages: List[BaseMessage]) -> str:
+        key = prompt_key(messages)
+        if self.mode != "record" or key in self._recordings:
+            return self._respond(messages)
+
+        text = (await self.upstream.ainvoke(messages)).content
+        await asyncio.to_thread(self._record, key, text)
+        return text
+
+    def _canned(self, prompt: str) -> str:
+        lowered = prompt.lower()
+        for rule in self.responses:
+            if str(rule.get("match", "")).lower() in lowered:
+                return str(rule.get("response", ""))
+
+        for marker, response in DEFAULT_RESPONSES:
+            if marker in prompt:
+                return response(prompt) if callable(response) else response
+        return "OK"
+
+    def _load_recordings(self) -> Dict[str, str]:
+        path = Path(self.recording_path)
+        recordings = {}
+        if not path.exists():
+            return recordings
+
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                recordings[record["key"]] = record["response"]
+        return recordings
+
+    def _record(self, key: str, text: str) -> None:
+        path = Path(self.recording_path)
+        with self._lock:
+            self._recordings[key] = text
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key, "response": text}) + "\n")
+
+    # =========================
+    # TIMING
+    # =========================
+
+    def _token_delay(self, text: str) -> float:
+        if not self.tokens_per_second:
+            return 0.0
+        return estimate_tokens(text) / self.tokens_per_second
+
+    def _message(self, messages: List[BaseMessage], text: str) -> AIMessage:
+        input_tokens = estimate_tokens(_prompt_text(messages))
+        output_tokens = estimate_tokens(text)
+        return AIMessage(
+            content=text,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        text = self._respond(messages)
+        time.sleep(self.latency_seconds + self._token_delay(text))
+        return ChatResult(generations=[ChatGeneration(message=self._message(messages, text))])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        text = await self._arespond(messages)
+        await asyncio.sleep(self.latency_seconds + self._token_delay(text))
+        return ChatResult(generations=[ChatGeneration(message=self._message(messages, text))])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        text = self._respond(messages)
+        time.sleep(self.latency_seconds)
+
+        for piece in _WORD.findall(text):
+            time.sleep(self._token_delay(piece))
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=piece))
+            if run_manager:
+                run_manager.on_llm_new_token(piece, chunk=chunk)
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        text = await self._arespond(messages)
+        await asyncio.sleep(self.latency_seconds)
+
+        for piece in _WORD.findall(text):
+            await asyncio.sleep(self._token_delay(piece))
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=piece))
+            if run_manager:
+                await run_manager.on_llm_new_token(piece, chunk=chunk)
+            yield chunk
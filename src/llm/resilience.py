@@ -0,0 +1,596 @@
+"""
+Resilience layer shared by every LLM call.
+
+``ResilientLLM`` wraps a chat model and adds, per call:
+
+- a timeout per attempt (for streams: on the wait for each next chunk)
+- retries with exponential backoff and full jitter
+- an optional hedged duplicate request once the first one is slower
+  than the recent p95 latency of the same call
+- a circuit breaker that fails fast while the provider keeps failing
+- an optional overall deadline (``call_deadline``) that caps attempts,
+  retries and backoff of every call made inside it
+
+What happened (attempts, retries, timeouts, hedging) is set as attributes
+on the span the call runs in, so it shows up in traces and metrics.
+"""
+
+import asyncio
+import contextvars
+import queue
+import random
+import threading
+import time
+from collections import deque
+from contextlib import aclosing, contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional
+
+from src.utils.logger import setup_logger
+from src.utils.tracing import current_span, current_stage, metrics
+
+
+logger = setup_logger(
+    name="llm_resilience",
+    log_dir="logs/llm",
+)
+
+# Client errors worth retrying: timeout, conflict, rate limit
+RETRYABLE_STATUS = (408, 409, 429)
+
+# Threads running synchronous calls, so they can be timed out and hedged
+_EXECUTOR_WORKERS = 32
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_last_call: ContextVar[Optional[Dict[str, Any]]] = ContextVar("last_llm_call", default=None)
+_deadline: ContextVar[Optional[float]] = ContextVar("llm_deadline", default=None)
+
+
+class LLMTimeoutError(TimeoutError):
+    """An LLM attempt took longer than the configured timeout."""
+
+
+class LLMDeadlineError(LLMTimeoutError):
+    """The deadline set with call_deadline() has passed; no attempt is made."""
+
+
+class CircuitOpenError(RuntimeError):
+    """The circuit breaker is open: the provider is failing, calls fail fast."""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Transient failures are retried; bad requests and open circuits are not."""
+    if isinstance(error, (CircuitOpenError, LLMDeadlineError, ValueError, TypeError, KeyError)):
+        return False
+
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int) and 400 <= status < 500:
+        return status in RETRYABLE_STATUS
+    return True
+
+
+def pop_call_stats() -> Dict[str, Any]:
+    """
+    Attributes of the last resilient call made in this context.
+
+    For streamed calls, whose span is recorded after the stream ends.
+    """
+    stats = _last_call.get()
+    _last_call.set(None)
+    return stats or {}
+
+
+@contextmanager
+def call_deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Give every LLM call in this block at most ``seconds`` from now, in total.
+
+    Nested deadlines keep the earlier one; None leaves calls uncapped.
+    """
+    if seconds is None:
+        yield
+        return
+
+    end = time.perf_counter() + max(seconds, 0)
+    current = _deadline.get()
+    token = _deadline.set(end if current is None else min(current, end))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def _remaining() -> Optional[float]:
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.perf_counter()
+
+
+def _thread_pool() -> ThreadPoolExecutor:
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_EXECUTOR_WORKERS, thread_name_prefix="llm-call")
+        return _executor
+
+
+def _submit(func, *args, **kwargs):
+    # Each worker runs in a copy of the caller's context (run ID, spans)
+    return _thread_pool().submit(contextvars.copy_context().run, func, *args, **kwargs)
+
+
+# =========================
+# CIRCUIT BREAKER
+# =========================
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed: calls pass; ``failure_threshold`` failures in a row open it
+    open: calls fail fast with CircuitOpenError for ``reset_seconds``
+    half_open: one trial call passes; success closes, failure reopens.
+        A trial that ends without a verdict (cancelled, or a stream
+        closed before its first chunk) is released for the next call.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> bool:
+        """Admit a call, or raise CircuitOpenError. True if it is the half-open trial."""
+        if not self.failure_threshold:
+            return False
+
+        with self._lock:
+            if self.state == "open":
+                remaining = self.reset_seconds - (time.monotonic() - self._opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"LLM circuit open after {self._failures} failures; retry in {remaining:.1f}s"
+                    )
+                self._transition("half_open")
+
+            if self.state == "half_open":
+                if self._trial_in_flight:
+                    raise CircuitOpenError("LLM circuit half-open; trial call in progress")
+                self._trial_in_flight = True
+                return True
+
+        return False
+
+    def release_trial(self) -> None:
+        """Let another call try after a trial that ended without success or failure."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            if self.state != "closed":
+                self._transition("closed")
+
+    def record_failure(self) -> None:
+        if not self.failure_threshold:
+            return
+
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                if self.state != "open":
+                    self._transition("open")
+
+    def _transition(self, state: str) -> None:
+        logger.warning(f"LLM circuit {self.state} -> {state}")
+        metrics.increment("circuit_transitions_total", state=state)
+        self.state = state
+
+
+# =========================
+# LATENCY TRACKING
+# =========================
+
+class LatencyTracker:
+    """Recent successful call latencies per call name, for hedge delays."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self.window)).append(seconds)
+
+    def quantile(self, key: str, q: float, min_samples: int) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+# =========================
+# RESILIENT CLIENT
+# =========================
+
+class _CallStats:
+    def __init__(self):
+        self.attempts = 0
+        self.timeouts = 0
+        self.hedged = 0
+        self.hedge_won = False
+
+    def attributes(self, circuit: str) -> Dict[str, Any]:
+        attributes = {
+            "attempts": self.attempts,
+            "retries": max(self.attempts - 1, 0),
+            "timeouts": self.timeouts,
+            "hedged": self.hedged,
+        }
+        if self.hedged:
+            attributes["hedge_won"] = self.hedge_won
+        if circuit != "closed":
+            attributes["circuit"] = circuit
+        return attributes
+
+
+class ResilientLLM:
+    """
+    Chat model wrapper applying the `llm.resilience` policy.
+
+    Exposes the same invoke/ainvoke/stream/astream calls as the wrapped
+    model; other attributes are passed through.
+    """
+
+    def __init__(self, llm: Any, config: Dict[str, Any] = None):
+        config = config or {}
+        hedge = config.get("hedge") or {}
+        breaker = config.get("circuit_breaker") or {}
+
+        self.llm = llm
+        self.timeout_seconds = config.get("timeout_seconds", 30)
+        self.max_attempts = max(1, config.get("max_attempts", 3))
+        self.backoff_base_seconds = config.get("backoff_base_seconds", 0.5)
+        self.backoff_max_seconds = config.get("backoff_max_seconds", 8)
+
+        self.hedge_enabled = hedge.get("enabled", False)
+        self.hedge_quantile = hedge.get("quantile", 0.95)
+        self.hedge_min_samples = hedge.get("min_samples", 20)
+        self.hedge_min_delay_seconds = hedge.get("min_delay_seconds", 0.25)
+
+        self.breaker = CircuitBreaker(
+            failure_threshold=breaker.get("failure_threshold", 5),
+            reset_seconds=breaker.get("reset_seconds", 30),
+        )
+        self.latencies = LatencyTracker()
+
+    def __getattr__(self, name: str) -> Any:
+        if "llm" not in self.__dict__:
+            raise AttributeError(name)
+        return getattr(self.__dict__["llm"], name)
+
+    # -------- Policy helpers --------
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: uniform in [0, min(max, base * 2^(attempt-1))]."""
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempt - 1))
+        remaining = _remaining()
+        if remaining is not None:
+            ceiling = max(min(ceiling, remaining), 0)
+        return random.uniform(0, ceiling)
+
+    def _attempt_timeout(self) -> float:
+        """Timeout for the next attempt, shortened to fit the call deadline."""
+        remaining = _remaining()
+        if remaining is None:
+            return self.timeout_seconds
+        if remaining <= 0:
+            raise LLMDeadlineError("LLM call deadline passed")
+        return min(self.timeout_seconds, remaining)
+
+    def _hedge_delay(self, key: str) -> Optional[float]:
+        if not self.hedge_enabled or self.breaker.state != "closed":
+            return None
+
+        delay = self.latencies.quantile(key, self.hedge_quantile, self.hedge_min_samples)
+        if delay is None:
+            return None
+        delay = max(delay, self.hedge_min_delay_seconds)
+        return delay if delay < self.timeout_seconds else None
+
+    def _record_error(self, error: Exception, trial: bool) -> None:
+        """Count transient failures against the breaker; a rejected request says nothing about the provider."""
+        if is_retryable(error):
+            self.breaker.record_failure()
+        elif trial:
+            self.breaker.release_trial()
+
+    def _should_retry(self, error: Exception, attempt: int, trial: bool) -> bool:
+        self._record_error(error, trial)
+        if attempt >= self.max_attempts or not is_retryable(error):
+            return False
+
+        remaining = _remaining()
+        if remaining is not None and remaining <= 0:
+            return False
+
+        logger.warning(
+            f"LLM call failed ({type(error).__name__}: {error}); "
+            f"retry {attempt}/{self.max_attempts - 1}"
+        )
+        return True
+
+    def _publish(self, stats: _CallStats) -> None:
+        attributes = stats.attributes(self.breaker.state)
+        span = current_span()
+        if span is not None:
+            span.set(**attributes)
+        _last_call.set(attributes)
+
+    def _stream_stopped(self, started: bool, trial: bool) -> None:
+        """A stream closed by its consumer or cancelled before it finished."""
+        if started:
+            # The provider was answering
+            self.breaker.record_success()
+        elif trial:
+            self.breaker.release_trial()
+
+    def _timeout_error(self, stats: _CallStats, timeout: float) -> LLMTimeoutError:
+        stats.timeouts += 1
+        return LLMTimeoutError(f"LLM call timed out after {timeout:.3g}s")
+
+    # -------- invoke --------
+
+    def invoke(self, input: Any, **kwargs) -> Any:
+        stats = _CallStats()
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                timeout = self._attempt_timeout()
+                trial = self.breaker.before_call()
+                stats.attempts = attempt
+                try:
+                    result = self._invoke_once(input, kwargs, stats, timeout)
+                except Exception as e:
+                    if not self._should_retry(e, attempt, trial):
+                        raise
+                    time.sleep(self._backoff(attempt))
+                except BaseException:
+                    # Interrupted: no verdict on the provider
+                    if trial:
+                        self.breaker.release_trial()
+                    raise
+                else:
+                    self.breaker.record_success()
+                    return result
+        finally:
+            self._publish(stats)
+
+    def _invoke_once(self, input: Any, kwargs: Dict, stats: _CallStats, timeout: float) -> Any:
+        key = current_stage() or "llm"
+        start = time.perf_counter()
+        deadline = start + timeout
+
+        primary = _submit(self.llm.invoke, input, **kwargs)
+        pending = {primary}
+
+        hedge_delay = self._hedge_delay(key)
+        if hedge_delay is not None:
+            done, _ = wait(pending, timeout=hedge_delay)
+            if not done:
+                stats.hedged = 1
+                pending.add(_submit(self.llm.invoke, input, **kwargs))
+
+        error = None
+        while pending:
+            done, pending = wait(
+                pending, timeout=max(deadline - time.perf_counter(), 0), return_when=FIRST_COMPLETED
+            )
+            if not done:
+                # Abandoned threads finish on their own (bounded by the HTTP timeout)
+                raise self._timeout_error(stats, timeout)
+
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    stats.hedge_won = future is not primary
+                    if future is primary:
+                        self.latencies.add(key, time.perf_counter() - start)
+                    return future.result()
+                error = future.exception()
+
+        raise error
+
+    async def ainvoke(self, input: Any, **kwargs) -> Any:
+        stats = _CallStats()
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                timeout = self._attempt_timeout()
+                trial = self.breaker.before_call()
+                stats.attempts = attempt
+                try:
+                    result = await self._ainvoke_once(input, kwargs, stats, timeout)
+                except Exception as e:
+                    if not self._should_retry(e, attempt, trial):
+                        raise
+                    await asyncio.sleep(self._backoff(attempt))
+                except BaseException:
+                    # Cancelled (e.g. a sibling part of a fan-out failed): no verdict on the provider
+                    if trial:
+                        self.breaker.release_trial()
+                    raise
+                else:
+                    self.breaker.record_success()
+                    return result
+        finally:
+            self._publish(stats)
+
+    async def _ainvoke_once(self, input: Any, kwargs: Dict, stats: _CallStats, timeout: float) -> Any:
+        key = current_stage() or "llm"
+        start = time.perf_counter()
+        deadline = start + timeout
+
+        primary = asyncio.ensure_future(self.llm.ainvoke(input, **kwargs))
+        tasks = [primary]
+        pending = {primary}
+
+        try:
+            hedge_delay = self._hedge_delay(key)
+            if hedge_delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+                if not done:
+                    stats.hedged = 1
+                    hedge = asyncio.ensure_future(self.llm.ainvoke(input, **kwargs))
+                    tasks.append(hedge)
+                    pending.add(hedge)
+
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(deadline - time.perf_counter(), 0), return_when=FIRST_COMPLETED
+                )
+                if not done:
+                    raise self._timeout_error(stats, timeout)
+
+                for task in done:
+                    if task.exception() is None:
+                        stats.hedge_won = task is not primary
+                        if task is primary:
+                            self.latencies.add(key, time.perf_counter() - start)
+                        return task.result()
+                    error = task.exception()
+
+            raise error
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    # -------- stream --------
+
+    def stream(self, input: Any, **kwargs) -> Iterator[Any]:
+        """Stream with retries until the first chunk arrives (later failures are raised)."""
+        stats = _CallStats()
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                self._attempt_timeout()
+                trial = self.breaker.before_call()
+                stats.attempts = attempt
+                started = False
+                try:
+                    for chunk in self._stream_once(input, kwargs, stats):
+                        started = True
+                        yield chunk
+                except Exception as e:
+                    if started:
+                        # Chunks were already handed out; a retry would repeat them
+                        self._record_error(e, trial)
+                        raise
+                    if not self._should_retry(e, attempt, trial):
+                        raise
+                    time.sleep(self._backoff(attempt))
+                except BaseException:
+                    self._stream_stopped(started, trial)
+                    raise
+                else:
+                    self.breaker.record_success()
+                    return
+        finally:
+            self._publish(stats)
+
+    def _stream_once(self, input: Any, kwargs: Dict, stats: _CallStats) -> Iterator[Any]:
+        # A worker thread drives the stream so each wait can time out
+        chunks: queue.SimpleQueue = queue.SimpleQueue()
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for chunk in self.llm.stream(input, **kwargs):
+                    if stop.is_set():
+                        return
+                    chunks.put(("chunk", chunk))
+                chunks.put(("done", None))
+            except Exception as e:
+                chunks.put(("error", e))
+
+        _submit(produce)
+        try:
+            while True:
+                timeout = self._attempt_timeout()
+                try:
+                    kind, value = chunks.get(timeout=timeout)
+                except queue.Empty:
+                    raise self._timeout_error(stats, timeout) from None
+
+                if kind == "done":
+                    return
+                if kind == "error":
+                    raise value
+                yield value
+        finally:
+            stop.set()
+
+    async def astream(self, input: Any, **kwargs) -> AsyncIterator[Any]:
+        """Async variant of stream()."""
+        stats = _CallStats()
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                self._attempt_timeout()
+                trial = self.breaker.before_call()
+                stats.attempts = attempt
+                started = False
+                try:
+                    # Closed explicitly: a consumer may stop part-way through
+                    async with aclosing(self._astream_once(input, kwargs, stats)) as chunks:
+                        async for chunk in chunks:
+                            started = True
+                            yield chunk
+                except Exception as e:
+                    if started:
+                        # Chunks were already handed out; a retry would repeat them
+                        self._record_error(e, trial)
+                        raise
+                    if not self._should_retry(e, attempt, trial):
+                        raise
+                    await asyncio.sleep(self._backoff(attempt))
+                except BaseException:
+                    self._stream_stopped(started, trial)
+                    raise
+                else:
+                    self.breaker.record_success()
+                    return
+        finally:
+            self._publish(stats)
+
+    async def _astream_once(self, input: Any, kwargs: Dict, stats: _CallStats) -> AsyncIterator[Any]:
+        iterator = self.llm.astream(input, **kwargs).__aiter__()
+        try:
+            while True:
+                timeout = self._attempt_timeout()
+                try:
+                    chunk = await asyncio.wait_for(iterator.__anext__(), timeout)
+                except StopAsyncIteration:
+                    return
+                except asyncio.TimeoutError:
+                    raise self._timeout_error(stats, timeout) from None
+                yield chunk
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
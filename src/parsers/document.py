@@ -0,0 +1,134 @@
+"""
+Resume input as bytes in memory, with the format detected from its content.
+"""
+
+import codecs
+import hashlib
+import io
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from src.parsers.governor import ResumeTooLargeError
+
+
+ResumeSource = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
+
+PDF_MAGIC = b"%PDF-"
+ZIP_MAGIC = b"PK\x03\x04"
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"  # legacy .doc
+
+# Bytes inspected when deciding whether unknown content is plain text
+TEXT_SNIFF_BYTES = 4096
+
+
+class ResumeDocument:
+    """Raw resume bytes plus the format detected from them."""
+
+    def __init__(self, data: bytes, name: str = "", format: Optional[str] = None):
+        self.data = data
+        self.name = name or "<upload>"
+        self.format = format or detect_format(data, name)
+        self._sha256: Optional[str] = None
+
+    @property
+    def sha256(self) -> str:
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.data).hexdigest()
+        return self._sha256
+
+    def stream(self) -> io.BytesIO:
+        # BytesIO over an immutable bytes object shares its buffer until written to
+        return io.BytesIO(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"ResumeDocument(name={self.name!r}, format={self.format!r}, bytes={len(self.data)})"
+
+
+def load_document(
+    source: ResumeSource,
+    name: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+) -> ResumeDocument:
+    """
+    Wrap a path, bytes or binary file-like object as a ResumeDocument.
+
+    Paths are read once; bytes are used as they are (bytearray and
+    memoryview are converted, since the document must not change).
+    With ``max_bytes``, larger files are rejected before they are read
+    (file-like objects are read at most one byte past the limit).
+
+    Raises:
+        FileNotFoundError: a path that does not exist
+        ResumeTooLargeError: content larger than ``max_bytes``
+        ValueError: content that is not a PDF, DOCX or UTF-8 text resume
+    """
+    if isinstance(source, ResumeDocument):
+        _check_size(len(source), source.name, max_bytes)
+        return source
+
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(f"Resume file not found: {path}")
+        _check_size(path.stat().st_size, str(path), max_bytes)
+        return ResumeDocument(path.read_bytes(), name or str(path))
+
+    if isinstance(source, (bytearray, memoryview)):
+        source = bytes(source)
+    elif not isinstance(source, bytes):
+        name = name or getattr(source, "name", "")
+        source = source.read() if max_bytes is None else source.read(max_bytes + 1)
+
+    _check_size(len(source), name or "upload", max_bytes)
+    return ResumeDocument(source, name or "")
+
+
+def _check_size(size: int, name: str, max_bytes: Optional[int]) -> None:
+    if max_bytes is not None and size > max_bytes:
+        raise ResumeTooLargeError(
+            f"Resume file too large: {name} is over {max_bytes / 1024 / 1024:.3g} MB"
+        )
+
+
+def detect_format(data: bytes, name: str = "") -> str:
+    """
+    Format from magic bytes: pdf, docx or txt.
+
+    The file name is only used in error messages.
+    """
+    head = data[:8]
+
+    if head.startswith(PDF_MAGIC):
+        return "pdf"
+
+    if head.startswith(ZIP_MAGIC):
+        try:
+            with zipfile.ZipFile(io.BytesIO(data)) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return "docx"
+        except zipfile.BadZipFile:
+            pass
+        raise ValueError(f"Unsupported file format: {name or 'upload'} is a ZIP archive but not a DOCX document")
+
+    if head.startswith(OLE_MAGIC):
+        raise ValueError(f"Unsupported file format: {name or 'upload'} is a legacy Word (.doc) file")
+
+    if _looks_like_text(data[:TEXT_SNIFF_BYTES]):
+        return "txt"
+
+    raise ValueError(f"Unsupported file format: {name or 'upload'} is not a PDF, DOCX or UTF-8 text file")
+
+
+def _looks_like_text(sample: bytes) -> bool:
+    if b"\x00" in sample:
+        return False
+    try:
+        # Incremental so a multi-byte character cut at the sample's end is not an error
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
@@ -0,0 +1,212 @@
+"""
+Single-pass scanner for the deterministic (non-LLM) resume fields.
+"""
+
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Optional
+
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4,
+    "may": 5, "jun": 6, "jul": 7, "aug": 8,
+    "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
+
+EDUCATION_KEYWORDS = [
+    "bachelor", "master", "phd", "mba", "b.tech", "m.tech",
+    "b.sc", "m.sc", "university", "college", "degree"
+]
+
+PORTFOLIO_BLACKLIST = ["linkedin.com", "github.com"]
+
+
+def _ci(word: str) -> str:
+    """Case-insensitive literal as explicit classes (re.IGNORECASE is slow in sre)."""
+    return "".join(
+        f"[{c.upper()}{c.lower()}]" if c.isalpha() else re.escape(c)
+        for c in word
+    )
+
+
+def _first_chars(words: List[str]) -> str:
+    return "".join(sorted({c for w in words for c in (w[0].lower(), w[0].upper())}))
+
+
+_MONTH = "(?:" + "|".join(_ci(m) for m in MONTHS) + ")"
+_EDUCATION = "(?:" + "|".join(_ci(k) for k in EDUCATION_KEYWORDS) + ")"
+
+# Each alternative ends in an empty named group, so ``match.lastgroup`` names
+# the field that matched. Alternatives are gated on their possible first
+# characters, and the whole pattern on the union of them, so positions that
+# cannot start any field are rejected with a single character-class test.
+#
+# Emails are anchored on "@" only; the local part is recovered backwards by
+# _email_at, which keeps every other character in the single forward pass.
+# Links are not consumed: PDF text often glues them to what follows, so the
+# scan resumes just after a link's first character. Phones are tried before
+# experience mentions so a glued "9876543210 5 years" keeps both.
+_ALTERNATIVES = [
+    r'https?://[^\s]+(?P<url>)',
+    r'(?=[Ll])' + _ci('linkedin.com/in/') + r'[\w-]+(?P<linkedin>)',
+    r'(?=[WwGg])(?:' + _ci('www.') + r')?' + _ci('github.com/') + r'[A-Za-z0-9_-]+(?P<github>)',
+    r'@(?P<at>)',
+    r'(?=[' + _first_chars(list(MONTHS)) + r'])'
+    r'(?P<m1>' + _MONTH + r')[A-Za-z]*\s+(?P<y1>\d{4})\s*[-–]\s*'
+    r'(?P<m2>' + _MONTH + r')[A-Za-z]*\s+(?P<y2>\d{4})(?P<date_range>)',
+    r'(?=[' + _first_chars(EDUCATION_KEYWORDS) + r'])' + _EDUCATION + r'(?P<education>)',
+    r'(?=[+(\d])(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}(?P<phone>)',
+    r'(?=\d)(?P<years>\d+)\+?\s*' + _ci('year') + r'[Ss]?\s+(?:' + _ci('of') + r'\s+)?'
+    + _ci('experience') + r'(?P<mention>)',
+]
+
+FIELD_PATTERN = re.compile(
+    r'(?=[h@+(\d'
+    + _first_chars(["linkedin", "www", "github"] + list(MONTHS) + EDUCATION_KEYWORDS)
+    + r'])(?:' + "|".join(_ALTERNATIVES) + r')'
+)
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+EMAIL_LOCAL_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-"
+)
+
+LINKEDIN_PATTERN = re.compile(_ci('linkedin.com/in/') + r'[\w-]+')
+GITHUB_PATTERN = re.compile(
+    r'(https?://)?(?:' + _ci('www.') + r')?' + _ci('github.com/') + r'[A-Za-z0-9_-]+'
+)
+
+
+class LineIndex:
+    """Lines of a text with their start offsets, built with one split."""
+
+    def __init__(self, text: str):
+        self.lines = text.split("\n")
+        self.starts = [0, *accumulate(len(line) + 1 for line in self.lines[:-1])]
+
+    def line_at(self, offset: int) -> int:
+        return bisect_right(self.starts, offset) - 1
+
+    def first_nonblank(self) -> Optional[str]:
+        for line in self.lines:
+            stripped = line.strip()
+            if stripped:
+                return stripped
+        return None
+
+
+def _email_at(text: str, at: int) -> Optional[str]:
+    """Return the email whose "@" is at offset ``at``, if any."""
+    start = at
+    while start > 0 and text[start - 1] in EMAIL_LOCAL_CHARS:
+        start -= 1
+
+    # Leftmost start with a word boundary, as a forward regex search would find
+    for pos in range(start, at):
+        match = EMAIL_PATTERN.match(text, pos)
+        if match:
+            return match.group()
+    return None
+
+
+def _github_url(url: str) -> str:
+    return url if url.startswith("http") else f"https://{url}"
+
+
+def scan_fields(text: str) -> Dict[str, any]:
+    """
+    Extract all deterministic fields in one pass over the text.
+
+    Args:
+        text: Raw resume text
+
+    Returns:
+        name, email, phone, linkedin_url, github_url, portfolio_url,
+        experience and education
+    """
+    index = LineIndex(text)
+
+    email = phone = linkedin = github = portfolio = None
+    mentioned_months = None
+    date_months = 0
+    education_lines = []
+
+    def mark_education(offset: int) -> None:
+        line = index.line_at(offset)
+        if not education_lines or education_lines[-1] < line:
+            education_lines.append(line)
+
+    search = FIELD_PATTERN.search
+    pos = 0
+
+    while True:
+        match = search(text, pos)
+        if match is None:
+            break
+
+        kind = match.lastgroup
+        pos = match.end()
+
+        if kind == "date_range":
+            m1, y1, m2, y2 = match.group("m1", "y1", "m2", "y2")
+            diff = (int(y2) - int(y1)) * 12 + (MONTHS[m2.lower()] - MONTHS[m1.lower()])
+            date_months += max(diff, 0)
+
+        elif kind == "education":
+            mark_education(match.start())
+
+        elif kind == "at":
+            if email is None:
+                email = _email_at(text, match.start())
+
+        elif kind == "phone":
+            if phone is None:
+                phone = match.group()
+
+        elif kind == "mention":
+            if mentioned_months is None:
+                mentioned_months = int(match.group("years")) * 12
+
+        else:
+            # url / linkedin / github: classify from the matched link text
+            link = match.group()
+            pos = match.start() + 1
+
+            if linkedin is None:
+                sub = LINKEDIN_PATTERN.search(link)
+                if sub:
+                    linkedin = f"https://{sub.group()}"
+
+            if github is None:
+                sub = GITHUB_PATTERN.search(link)
+                if sub:
+                    github = _github_url(sub.group())
+
+            if (
+                kind == "url"
+                and portfolio is None
+                and not any(b in link.lower() for b in PORTFOLIO_BLACKLIST)
+            ):
+                portfolio = link
+
+    return {
+        "name": index.first_nonblank(),
+        "email": email,
+        "phone": phone,
+        "linkedin_url": linkedin,
+        "github_url": github,
+        "portfolio_url": portfolio,
+        "experience": format_experience(date_months, mentioned_months or 0),
+        "education": [index.lines[i].strip() for i in education_lines],
+    }
+
+
+def format_experience(date_months: int, mentioned_months: int) -> str:
+    """Take the more conservative of the two non-zero estimates."""
+    valid = [m for m in [date_months, mentioned_months] if m > 0]
+    if not valid:
+        return "0 years 0 months"
+
+    years, months = divmod(min(valid), 12)
+    return f"{years} years {months} months"
@@ -0,0 +1,131 @@
+"""
+Resource limits for one parse: file size, PDF pages, text length and time.
+
+Oversize files are rejected before they are read; page and character
+caps truncate the extracted text instead of failing; the time budget
+stops extraction and caps the LLM calls. What was limited is reported
+in the parsed profile under ``limits``.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+from config.settings import settings
+
+
+# Truncation looks back this far for a line or word boundary to cut at
+TRUNCATE_LOOKBACK_CHARS = 200
+
+
+class ResumeTooLargeError(ValueError):
+    """The resume file is larger than `resume.max_file_size_mb`."""
+
+
+class ParseGovernor:
+    """Parse limits from the `resume` config section (None = unlimited)."""
+
+    def __init__(
+        self,
+        max_file_bytes: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        time_budget_seconds: Optional[float] = None,
+        supported_formats: Optional[List[str]] = None,
+    ):
+        self.max_file_bytes = max_file_bytes
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.time_budget_seconds = time_budget_seconds
+        self.supported_formats = [f.lower() for f in supported_formats] if supported_formats else None
+
+    @classmethod
+    def from_settings(cls) -> "ParseGovernor":
+        max_mb = settings.get("resume.max_file_size_mb")
+        return cls(
+            max_file_bytes=int(max_mb * 1024 * 1024) if max_mb else None,
+            max_pages=settings.get("resume.limits.max_pages"),
+            max_chars=settings.get("resume.limits.max_chars"),
+            time_budget_seconds=settings.get("resume.limits.time_budget_seconds"),
+            supported_formats=settings.get("resume.supported_formats"),
+        )
+
+    def fingerprint(self) -> str:
+        """Limits that change the parsed output (for cache keys)."""
+        return f"pages={self.max_pages}:chars={self.max_chars}"
+
+    def check_format(self, format: str) -> None:
+        if self.supported_formats and format not in self.supported_formats:
+            raise ValueError(
+                f"Unsupported file format: {format} (available: {', '.join(self.supported_formats)})"
+            )
+
+    def start(self, file_bytes: int) -> "ParseBudget":
+        return ParseBudget(self, file_bytes)
+
+
+class ParseBudget:
+    """Limits as they are spent during one parse, and what they cut."""
+
+    def __init__(self, governor: ParseGovernor, file_bytes: int):
+        self.governor = governor
+        self.file_bytes = file_bytes
+        self.started = time.perf_counter()
+        self.deadline = (
+            self.started + governor.time_budget_seconds if governor.time_budget_seconds else None
+        )
+        self.pages: Optional[int] = None
+        self.pages_total: Optional[int] = None
+        self.chars = 0
+        self.truncated: List[str] = []
+
+    @property
+    def max_pages(self) -> Optional[int]:
+        return self.governor.max_pages
+
+    @property
+    def max_chars(self) -> Optional[int]:
+        return self.governor.max_chars
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the time budget (None = no budget)."""
+        return None if self.deadline is None else max(self.deadline - time.perf_counter(), 0.0)
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def chars_exceeded(self, chars: int) -> bool:
+        return self.max_chars is not None and chars > self.max_chars
+
+    def note(self, reason: str) -> None:
+        if reason not in self.truncated:
+            self.truncated.append(reason)
+
+    def cap_text(self, text: str) -> str:
+        """Cut text to the character cap, at a line or word boundary when one is close."""
+        if not self.chars_exceeded(len(text)):
+            self.chars = len(text)
+            return text
+
+        limit = self.max_chars
+        cut = max(text.rfind("\n", 0, limit), text.rfind(" ", 0, limit))
+        if cut < limit - TRUNCATE_LOOKBACK_CHARS:
+            cut = limit
+
+        self.note("chars")
+        self.chars = cut
+        return text[:cut]
+
+    def report(self) -> Dict[str, any]:
+        """Limits applied and what they cut, for the parsed profile."""
+        return {
+            "file_bytes": self.file_bytes,
+            "max_file_bytes": self.governor.max_file_bytes,
+            "pages": self.pages,
+            "pages_total": self.pages_total,
+            "max_pages": self.max_pages,
+            "chars": self.chars,
+            "max_chars": self.max_chars,
+            "time_budget_seconds": self.governor.time_budget_seconds,
+            "elapsed_seconds": round(time.perf_counter() - self.started, 3),
+            "truncated": list(self.truncated),
+        }
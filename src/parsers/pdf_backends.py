@@ -0,0 +1,285 @@
+"""
+Pluggable PDF text extraction backends with page-parallel extraction.
+"""
+
+import atexit
+import io
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, ContextManager, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+
+# A PDF on disk, or its content already in memory
+PDFSource = Union[Path, bytes]
+
+
+def _open_binary(source: PDFSource) -> BinaryIO:
+    # BytesIO over bytes shares the buffer rather than copying it
+    return io.BytesIO(source) if isinstance(source, bytes) else open(source, "rb")
+
+
+class PDFBackend:
+    """
+    Base class for PDF text extractors.
+
+    Subclasses open a document once and read its page count and page
+    texts from that same handle.
+    """
+
+    name = ""
+
+    def open_document(self, source: PDFSource) -> ContextManager[Any]:
+        """Parsed document, closed when the ``with`` block exits."""
+        raise NotImplementedError
+
+    def document_page_count(self, document: Any) -> int:
+        raise NotImplementedError
+
+    def page_text(self, document: Any, index: int) -> str:
+        raise NotImplementedError
+
+    def document_pages(self, document: Any, start: int, stop: int) -> Iterator[str]:
+        """Text of pages [start, stop) of an open document, in order ("" for empty pages)."""
+        for i in range(start, min(stop, self.document_page_count(document))):
+            yield self.page_text(document, i)
+
+    def page_count(self, source: PDFSource) -> int:
+        with self.open_document(source) as document:
+            return self.document_page_count(document)
+
+    def iter_pages(self, source: PDFSource, start: int, stop: int) -> Iterator[str]:
+        """Text of pages [start, stop) in order ("" for empty pages), one page at a time."""
+        with self.open_document(source) as document:
+            yield from self.document_pages(document, start, stop)
+
+    def extract_pages(self, source: PDFSource, start: int, stop: int) -> List[str]:
+        """Extract text for pages [start, stop) in order ("" for empty pages)."""
+        return list(self.iter_pages(source, start, stop))
+
+
+class PyPDF2Backend(PDFBackend):
+    name = "pypdf2"
+
+    @contextmanager
+    def open_document(self, source: PDFSource) -> Iterator[Any]:
+        import PyPDF2
+
+        # The reader loads pages lazily, so the file stays open while it is used
+        with _open_binary(source) as f:
+            yield PyPDF2.PdfReader(f)
+
+    def document_page_count(self, document: Any) -> int:
+        return len(document.pages)
+
+    def page_text(self, document: Any, index: int) -> str:
+        return document.pages[index].extract_text() or ""
+
+
+class PyMuPDFBackend(PDFBackend):
+    """MuPDF-based extractor (``pip install pymupdf``), typically much faster."""
+
+    name = "pymupdf"
+
+    def open_document(self, source: PDFSource) -> ContextManager[Any]:
+        import fitz
+
+        if isinstance(source, bytes):
+            return fitz.open(stream=source, filetype="pdf")
+        return fitz.open(source)
+
+    def document_page_count(self, document: Any) -> int:
+        return document.page_count
+
+    def page_text(self, document: Any, index: int) -> str:
+        return document.load_page(index).get_text()
+
+
+class PdfPlumberBackend(PDFBackend):
+    """pdfminer-based extractor (``pip install pdfplumber``), better on layouts."""
+
+    name = "pdfplumber"
+
+    def open_document(self, source: PDFSource) -> ContextManager[Any]:
+        import pdfplumber
+
+        return pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+
+    def document_page_count(self, document: Any) -> int:
+        return len(document.pages)
+
+    def page_text(self, document: Any, index: int) -> str:
+        return document.pages[index].extract_text() or ""
+
+
+PDF_BACKENDS: Dict[str, Type[PDFBackend]] = {
+    PyPDF2Backend.name: PyPDF2Backend,
+    PyMuPDFBackend.name: PyMuPDFBackend,
+    PdfPlumberBackend.name: PdfPlumberBackend,
+}
+
+
+def get_pdf_backend(name: str = "pypdf2") -> PDFBackend:
+    """Instantiate a registered backend by name."""
+    try:
+        return PDF_BACKENDS[name.lower()]()
+    except KeyError:
+        raise ValueError(
+            f"Unsupported PDF backend: {name} (available: {', '.join(PDF_BACKENDS)})"
+        )
+
+
+def available_backends() -> List[str]:
+    """Names of registered backends whose library is installed."""
+    modules = {"pypdf2": "PyPDF2", "pymupdf": "fitz", "pdfplumber": "pdfplumber"}
+    available = []
+    for name in PDF_BACKENDS:
+        try:
+            __import__(modules.get(name, name))
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+# =========================
+# PAGE-PARALLEL EXTRACTION
+# =========================
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool shared across parses, created on first large document.
+
+    Callers hold ``_pool_lock`` until they have submitted their work, so
+    another thread cannot shut the pool down in between.
+    """
+    global _pool, _pool_workers
+
+    if _pool is None or _pool_workers != max_workers:
+        if _pool is not None:
+            # Extractions already submitted to the old pool still finish
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(max_workers=max_workers)
+        _pool_workers = max_workers
+
+    return _pool
+
+
+@atexit.register
+def _shutdown_pool() -> None:
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_page_range(backend_name: str, source: Union[str, bytes], start: int, stop: int) -> List[str]:
+    # Runs in a worker process, so the backend is rebuilt from its name
+    source = source if isinstance(source, bytes) else Path(source)
+    return get_pdf_backend(backend_name).extract_pages(source, start, stop)
+
+
+def extract_pdf_text(
+    source: PDFSource,
+    backend: PDFBackend,
+    parallel_page_threshold: int = 8,
+    max_workers: Optional[int] = None,
+) -> str:
+    """
+    Extract all text from a PDF.
+
+    Documents with at least ``parallel_page_threshold`` pages are split
+    into contiguous page ranges extracted across a process pool. Page
+    texts are assembled with a single join, so cost stays linear in the
+    document length.
+
+    Args:
+        source: PDF path, or its content (in-memory content is sent to
+            each worker process for parallel extraction)
+        backend: Extraction backend
+        parallel_page_threshold: Minimum page count for parallel extraction
+        max_workers: Pool size (capped at, and defaulting to, the CPU count)
+
+    Returns:
+        Concatenated page text
+    """
+    pages, _ = extract_pdf_pages(source, backend, parallel_page_threshold, max_workers)
+    return "".join(pages)
+
+
+def extract_pdf_pages(
+    source: PDFSource,
+    backend: PDFBackend,
+    parallel_page_threshold: int = 8,
+    max_workers: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> Tuple[List[str], int]:
+    """
+    Page texts of a PDF, stopping early at the given limits.
+
+    Only the first ``max_pages`` pages are read. Sequential extraction
+    stops once more than ``max_chars`` characters were extracted or the
+    ``deadline`` (a ``time.perf_counter()`` value) has passed; parallel
+    extraction keeps the pages finished by the deadline, in order.
+
+    Returns:
+        (page texts, total page count of the document)
+    """
+    # Count and (sequential) extraction share one parse of the document
+    with backend.open_document(source) as document:
+        total_pages = backend.document_page_count(document)
+        num_pages = min(total_pages, max_pages) if max_pages is not None else total_pages
+        # Extraction is CPU-bound, so more processes than cores never helps
+        cpus = os.cpu_count() or 1
+        pool_size = min(max_workers or cpus, cpus)
+        workers = min(pool_size, num_pages)
+
+        if workers <= 1 or num_pages < parallel_page_threshold:
+            pages, chars = [], 0
+            for page in backend.document_pages(document, 0, num_pages):
+                pages.append(page)
+                chars += len(page)
+                if (max_chars is not None and chars > max_chars) or _passed(deadline):
+                    break
+            return pages, total_pages
+
+    # Each worker process opens its own copy for its page range
+    chunk = -(-num_pages // workers)
+    ranges = [(start, min(start + chunk, num_pages)) for start in range(0, num_pages, chunk)]
+
+    with _pool_lock:
+        pool = _get_pool(pool_size)
+        futures = [
+            pool.submit(
+                _extract_page_range,
+                backend.name,
+                source if isinstance(source, bytes) else str(source),
+                start,
+                stop,
+            )
+            for start, stop in ranges
+        ]
+
+    pages = []
+    for future in futures:
+        timeout = None if deadline is None else max(deadline - time.perf_counter(), 0)
+        try:
+            pages.extend(future.result(timeout=timeout))
+        except FutureTimeoutError:
+            for pending in futures:
+                pending.cancel()
+            break
+    return pages, total_pages
+
+
+def _passed(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.perf_counter() >= deadline
@@ -2,19 +2,28 @@
 Resume parser for extracting candidate information.
 """
 
-import re
+import asyncio
+import io
+import json
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
 # from pdf2image import convert_from_path
 # import pytesseract
-import PyPDF2
-import docx
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
 
 from config.settings import settings
+from src.llm.client import get_llm
+from src.llm.resilience import call_deadline
+from src.parsers.document import ResumeDocument, ResumeSource, load_document
+from src.parsers.field_scanner import scan_fields
+from src.parsers.governor import ParseBudget, ParseGovernor
+from src.parsers.pdf_backends import extract_pdf_pages, get_pdf_backend
+from src.parsers.section_segmenter import build_context, segment_sections
+from src.parsers.skill_matcher import SkillMatcher
+from src.utils.cache import DiskCache, LRUCache, TieredCache, content_key
 from src.utils.logger import setup_logger
+from src.utils.tokens import log_prompt_tokens
+from src.utils.tracing import span
 
 
 logger = setup_logger(
@@ -23,252 +32,582 @@ logger = setup_logger(
 )
 
 
-class ResumeParser:
-    def __init__(self):
-        # Regex patterns
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        self.phone_pattern = r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        self.linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-
-        # -------- LLM INITIALIZATION (CONFIG-DRIVEN) --------
-        self.llm = ChatGroq(
-            api_key=settings.groq_api_key,
-            model=settings.get("llm.model"),
-            temperature=settings.get("llm.temperature", 0.7),
-            max_tokens=settings.get("llm.max_tokens", 2048),
-        )
+class NoExtractableTextError(ValueError):
+    """The document has no text to extract (e.g. a scanned, image-only PDF)."""
 
-    # =========================
-    # PUBLIC API
-    # =========================
 
-    def parse(self, file_path: str) -> Dict[str, any]:
-        file_path = Path(file_path)
+# Bump whenever extraction logic changes so cached profiles are invalidated
+PARSER_VERSION = "6"
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"Resume file not found: {file_path}")
+JOB_ROLE_PROMPT = """
+            You are an expert recruiter.
 
-        logger.info(f"Parsing resume: {file_path}")
+            From the following resume sections, identify the PRIMARY job role.
+            Return ONLY the job role as a short title.
 
-        if file_path.suffix.lower() == ".pdf":
-            text = self._extract_from_pdf(file_path)
-        elif file_path.suffix.lower() == ".docx":
-            text = self._extract_from_docx(file_path)
-        elif file_path.suffix.lower() == ".txt":
-            text = self._extract_from_txt(file_path)
-        else:
-            raise ValueError(f"Unsupported file format: {file_path.suffix}")
+            Text:
+            {summary}
+            """
 
-        summary_text = text[:1500]  # enough for role inference
+SKILLS_PROMPT = """
+            You are an expert interviewer.
 
-        job_role = self._extract_job_role(summary_text)
-        skills = self._extract_skills(text, job_role)
+            Candidate job role:
+            {job_role}
 
-        info = {
-            "raw_text": text,
-            "name": self._extract_name(text),
-            "email": self._extract_email(text),
-            "phone": self._extract_phone(text),
-            "linkedin_url": self._extract_linkedin(text),
-            "github_url": self._extract_github(text),
-            "portfolio_url": self._extract_portfolio(text),
-            "job_role": job_role,
-            "skills": skills,
-            "experience": self._estimate_experience(text),
-            "education": self._extract_education(text),
-        }
+            Extract ONLY skill keywords (technical and non-technical).
+            Do NOT include certifications, achievements, or tools descriptions.
+            Remove duplicates.
+            Return output as a simple comma-separated list.
 
-        logger.info(f"Resume parsed successfully for role: {job_role}")
-        return info
+            Resume text:
+            {text}
+            """
 
-    # =========================
-    # FILE EXTRACTION
-    # =========================
+SKILLS_HYBRID_PROMPT = """
+            You are an expert interviewer.
 
-    def _extract_from_pdf(self, file_path: Path) -> str:
-        text = ""
+            Candidate job role:
+            {job_role}
 
-        with open(file_path, "rb") as file:
-            reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted
+            These skills were already found in the resume:
+            {known_skills}
 
-        # ---------- OCR FALLBACK ----------
-        if not text.strip():
-            logger.warning("No extractable text found using PyPDF2")
-            text = self._extract_from_pdf_ocr(file_path)
+            Extract ONLY additional skill keywords (technical and non-technical)
+            that are NOT in the list above.
+            Do NOT include certifications, achievements, or tools descriptions.
+            Return output as a simple comma-separated list, or NONE if there are none.
 
-        return text
+            Resume text:
+            {text}
+            """
 
-    def _extract_from_docx(self, file_path: Path) -> str:
-        doc = docx.Document(file_path)
-        return "\n".join(p.text for p in doc.paragraphs)
+SKILL_MODES = ("dictionary", "hybrid", "llm")
 
-    def _extract_from_txt(self, file_path: Path) -> str:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+# Called with a resume's extracted text before the LLM calls; returns an
+# earlier profile to take the LLM fields from (e.g. of a near-duplicate), or None
+PriorProfile = Callable[[str], Optional[Dict[str, any]]]
 
-    # =========================
-    # BASIC EXTRACTION
-    # =========================
+# Job role used when the LLM call fails (same default the agent uses)
+FALLBACK_JOB_ROLE = "General Candidate"
 
-    def _extract_email(self, text: str) -> Optional[str]:
-        matches = re.findall(self.email_pattern, text)
-        return matches[0] if matches else None
+# Sections (in priority order) and token budget for each LLM call
+DEFAULT_PROMPT_BUDGETS = {
+    "job_role": {"sections": ["header", "summary", "experience"], "max_tokens": 375},
+    "skills": {
+        "sections": ["skills", "summary", "experience", "projects", "certifications"],
+        "max_tokens": 1000,
+    },
+}
 
-    def _extract_phone(self, text: str) -> Optional[str]:
-        match = re.search(self.phone_pattern, text)
-        return match.group() if match else None
 
-    def _extract_linkedin(self, text: str) -> Optional[str]:
-        match = re.search(self.linkedin_pattern, text, re.IGNORECASE)
-        if match:
-            return f"https://{match.group()}"
-        return None
+class ResumeParser:
+    def __init__(self):
+        # -------- LLM INITIALIZATION (CONFIG-DRIVEN, ON FIRST CALL) --------
+        self._llm = None
+
+        # -------- PDF EXTRACTION BACKEND --------
+        self.pdf_backend = get_pdf_backend(settings.get("resume.pdf.backend", "pypdf2"))
+        self.pdf_parallel_threshold = settings.get("resume.pdf.parallel_page_threshold", 8)
+        self.pdf_max_workers = settings.get("resume.pdf.max_workers")
+
+        # -------- SKILL EXTRACTION --------
+        self.skills_mode = settings.get("resume.skills.mode", "hybrid").lower()
+        if self.skills_mode not in SKILL_MODES:
+            raise ValueError(
+                f"Unsupported skills mode: {self.skills_mode} (available: {', '.join(SKILL_MODES)})"
+            )
+        self._skill_matcher = None
+
+        # -------- PROMPT BUDGETS --------
+        self.chars_per_token = settings.get("resume.prompt_budgets.chars_per_token", 4)
+        self.prompt_budgets = {
+            call: {**default, **(settings.get(f"resume.prompt_budgets.{call}") or {})}
+            for call, default in DEFAULT_PROMPT_BUDGETS.items()
+        }
 
-    def _extract_name(self, text: str) -> Optional[str]:
-        lines = [l.strip() for l in text.split("\n") if l.strip()]
-        return lines[0] if lines else None
+        # -------- RESOURCE LIMITS (size, pages, chars, time) --------
+        self.governor = ParseGovernor.from_settings()
+
+        self.cache = self._initialize_cache()
+
+    @property
+    def llm(self):
+        """Shared LLM client, created when the first LLM call is made."""
+        if self._llm is None:
+            self._llm = get_llm()
+        return self._llm
+
+    @llm.setter
+    def llm(self, llm) -> None:
+        self._llm = llm
+
+    @property
+    def skill_matcher(self) -> SkillMatcher:
+        """Skill taxonomy automaton, built on first use."""
+        if self._skill_matcher is None:
+            self._skill_matcher = SkillMatcher.from_yaml(
+                settings.get("resume.skills.taxonomy", "config/skills.yaml")
+            )
+        return self._skill_matcher
+
+    @property
+    def llm_calls_per_parse(self) -> int:
+        """LLM round-trips made by one uncached parse."""
+        return 1 if self.skills_mode == "dictionary" else 2
+
+    def _initialize_cache(self) -> Optional[TieredCache]:
+        """Build the parse cache from the `cache.parse` config section."""
+        if not settings.get("cache.parse.enabled", False):
+            return None
+
+        memory = LRUCache(settings.get("cache.parse.memory_entries", 128))
+
+        disk = None
+        cache_dir = settings.get("cache.parse.dir")
+        if cache_dir:
+            max_bytes = int(settings.get("cache.parse.max_disk_mb", 256) * 1024 * 1024)
+            disk = DiskCache(cache_dir, max_bytes)
+
+        return TieredCache(memory, disk)
+
+    def _cache_key(self, document: ResumeDocument) -> str:
+        """Key on file content plus everything that changes the parsed output."""
+        return content_key(
+            document.data,
+            f"parser={PARSER_VERSION}",
+            f"pdf_backend={self.pdf_backend.name}",
+            f"model={settings.get('llm.provider', 'groq')}:{settings.get('llm.model')}",
+            f"prompts={content_key((JOB_ROLE_PROMPT + SKILLS_PROMPT + SKILLS_HYBRID_PROMPT).encode('utf-8'))}",
+            f"skills={self.skills_mode}:{self.skill_matcher.version}",
+            f"budgets={json.dumps(self.prompt_budgets, sort_keys=True)}",
+            f"limits={self.governor.fingerprint()}",
+        )
 
     # =========================
-    # EXPERIENCE CALCULATION
+    # PUBLIC API
     # =========================
 
-    def _estimate_experience(self, text: str) -> str:
-        calculated = self._experience_from_dates(text)
-        mentioned = self._experience_from_mentions(text)
-
-        valid = [m for m in [calculated, mentioned] if m > 0]
-        if not valid:
-            return "0 years 0 months"
-
-        total_months = min(valid)
-        years, months = divmod(total_months, 12)
-        return f"{years} years {months} months"
-
-    def _experience_from_dates(self, text: str) -> int:
-        month_map = {
-            "jan": 1, "feb": 2, "mar": 3, "apr": 4,
-            "may": 5, "jun": 6, "jul": 7, "aug": 8,
-            "sep": 9, "oct": 10, "nov": 11, "dec": 12
-        }
-
-        pattern = re.compile(
-            r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+(\d{4})\s*[-–]\s*'
-            r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+(\d{4})',
-            re.IGNORECASE
+    def parse(self, source: ResumeSource, name: Optional[str] = None) -> Dict[str, any]:
+        return self.parse_cached(source, name)[0]
+
+    def extract_text(self, source: ResumeSource, name: Optional[str] = None) -> str:
+        """Resume text within the parse limits, without any LLM call."""
+        document = self._load(source, name)
+        return self._extract_text(document, self.governor.start(len(document)))
+
+    def parse_cached(
+        self,
+        source: ResumeSource,
+        name: Optional[str] = None,
+        prior_profile: Optional[PriorProfile] = None,
+    ) -> Tuple[Dict[str, any], bool]:
+        """
+        Parse a resume, serving repeated uploads from the parse cache.
+
+        Args:
+            source: File path, file content (bytes) or binary file-like
+                object; the format is detected from the content
+            name: Display name for in-memory content (e.g. the upload's file name)
+            prior_profile: On a cache miss, called with the extracted text;
+                a profile it returns supplies the job role and skills
+                instead of the LLM (profiles built this way are not cached)
+
+        Returns:
+            (candidate info, whether it was served from cache)
+
+        Raises:
+            ResumeTooLargeError: file over `resume.max_file_size_mb` (not read)
+            ValueError: format not in `resume.supported_formats`
+        """
+        document = self._load(source, name)
+
+        if self.cache is None:
+            return self._parse_document(document, prior_profile), False
+
+        key = self._cache_key(document)
+        info, tier = self.cache.get(key)
+        if info is not None:
+            logger.info(f"Parse cache hit ({tier}) for {document.name}")
+            return info, True
+
+        start = time.perf_counter()
+        info = self._parse_document(document, prior_profile)
+        if self._cacheable(info):
+            self.cache.set(key, info, compute_seconds=time.perf_counter() - start)
+        return info, False
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Cumulative parse cache statistics (empty when caching is disabled)."""
+        return self.cache.summary() if self.cache is not None else {}
+
+    async def aparse(self, source: ResumeSource, name: Optional[str] = None) -> Dict[str, any]:
+        return (await self.aparse_cached(source, name))[0]
+
+    async def aparse_cached(
+        self,
+        source: ResumeSource,
+        name: Optional[str] = None,
+        prior_profile: Optional[PriorProfile] = None,
+    ) -> Tuple[Dict[str, any], bool]:
+        """
+        Async variant of parse_cached.
+
+        File and cache I/O (and ``prior_profile``) run in worker threads;
+        the regex fields are computed while the LLM calls are in flight.
+        """
+        if isinstance(source, (str, Path)):
+            document = await asyncio.to_thread(self._load, source, name)
+        else:
+            document = self._load(source, name)
+
+        if self.cache is None:
+            return await self._aparse_document(document, prior_profile), False
+
+        key = await asyncio.to_thread(self._cache_key, document)
+        info, tier = await asyncio.to_thread(self.cache.get, key)
+        if info is not None:
+            logger.info(f"Parse cache hit ({tier}) for {document.name}")
+            return info, True
+
+        start = time.perf_counter()
+        info = await self._aparse_document(document, prior_profile)
+        if self._cacheable(info):
+            await asyncio.to_thread(
+                self.cache.set, key, info, time.perf_counter() - start
+            )
+        return info, False
+
+    def _load(self, source: ResumeSource, name: Optional[str]) -> ResumeDocument:
+        document = load_document(source, name, max_bytes=self.governor.max_file_bytes)
+        self.governor.check_format(document.format)
+        return document
+
+    @staticmethod
+    def _cacheable(info: Dict[str, any]) -> bool:
+        # Fallbacks, time-budget cuts and reused profiles depend on the moment, not the file
+        return (
+            not info["degraded"]
+            and "time" not in info["limits"]["truncated"]
+            and not info.get("near_duplicate")
         )
 
-        total = 0
-        for m1, y1, m2, y2 in pattern.findall(text):
-            start = datetime(int(y1), month_map[m1.lower()], 1)
-            end = datetime(int(y2), month_map[m2.lower()], 1)
-            diff = (end.year - start.year) * 12 + (end.month - start.month)
-            total += max(diff, 0)
+    def _parse_document(self, document: ResumeDocument, prior_profile: Optional[PriorProfile] = None) -> Dict[str, any]:
+        logger.info(f"Parsing resume: {document.name}")
 
-        return total
+        budget = self.governor.start(len(document))
+        text = self._extract_text(document, budget)
 
-    def _experience_from_mentions(self, text: str) -> int:
-        match = re.search(
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-            text,
-            re.IGNORECASE,
-        )
-        return int(match.group(1)) * 12 if match else 0
+        prior = prior_profile(text) if prior_profile is not None else None
+        if prior is not None:
+            return self._reuse_profile(text, prior, self._extract_fields(text), budget)
 
-    # =========================
-    # EDUCATION
-    # =========================
+        sections = self._segment(text)
+        degraded: List[str] = []
 
-    def _extract_education(self, text: str) -> List[str]:
-        keywords = [
-            "bachelor", "master", "phd", "mba", "b.tech", "m.tech",
-            "b.sc", "m.sc", "university", "college", "degree"
-        ]
+        # LLM calls (with their retries) share what is left of the time budget
+        with call_deadline(budget.remaining()):
+            job_role = self._extract_job_role(
+                self._prompt_context("job_role", sections, text), degraded
+            )
+            skills = self._extract_skills(
+                text, job_role, self._prompt_context("skills", sections, text), degraded
+            )
 
-        education = []
-        for line in text.split("\n"):
-            if any(k in line.lower() for k in keywords):
-                education.append(line.strip())
+        return self._build_info(text, job_role, skills, self._extract_fields(text), degraded, budget)
 
-        return education
+    async def _aparse_document(self, document: ResumeDocument, prior_profile: Optional[PriorProfile] = None) -> Dict[str, any]:
+        logger.info(f"Parsing resume: {document.name}")
 
-    # =========================
-    # LLM-BASED INTELLIGENCE
-    # =========================
+        budget = self.governor.start(len(document))
+        text = await asyncio.to_thread(self._extract_text, document, budget)
 
-    def _extract_job_role(self, summary_text: str) -> str:
-        prompt = ChatPromptTemplate.from_template(
-            """
-            You are an expert recruiter.
+        prior = await asyncio.to_thread(prior_profile, text) if prior_profile is not None else None
+        if prior is not None:
+            fields = await asyncio.to_thread(self._extract_fields, text)
+            return self._reuse_profile(text, prior, fields, budget)
 
-            From the following resume summary, identify the PRIMARY job role.
-            Return ONLY the job role as a short title.
+        sections = self._segment(text)
 
-            Text:
-            {summary}
-            """
+        # Deterministic fields overlap with the (sequential) LLM calls
+        fields_task = asyncio.create_task(
+            asyncio.to_thread(self._extract_fields, text)
         )
-
-        response = self.llm.invoke(
-            prompt.format_messages(summary=summary_text)
+        degraded: List[str] = []
+
+        try:
+            with call_deadline(budget.remaining()):
+                job_role = await self._aextract_job_role(
+                    self._prompt_context("job_role", sections, text), degraded
+                )
+                skills = await self._aextract_skills(
+                    text, job_role, self._prompt_context("skills", sections, text), degraded
+                )
+        except BaseException:
+            fields_task.cancel()
+            raise
+
+        return self._build_info(text, job_role, skills, await fields_task, degraded, budget)
+
+    def _extract_text(self, document: ResumeDocument, budget: Optional[ParseBudget] = None) -> str:
+        """Document text within the budget's page, character and time limits (none by default)."""
+        budget = budget or ParseGovernor().start(len(document))
+
+        with span("parse.extract_text", format=document.format) as s:
+            if document.format == "pdf":
+                text = self._extract_from_pdf(document, budget)
+            elif document.format == "docx":
+                text = self._extract_from_docx(document, budget)
+            elif document.format == "txt":
+                text = self._extract_from_txt(document, budget)
+            else:
+                raise ValueError(f"Unsupported file format: {document.format}")
+
+            text = budget.cap_text(text)
+            s.set(chars=len(text))
+            if budget.truncated:
+                s.set(truncated=",".join(budget.truncated))
+                logger.warning(f"Resume text truncated ({', '.join(budget.truncated)}): {document.name}")
+            return text
+
+    def _segment(self, text: str) -> Dict[str, str]:
+        with span("parse.sections"):
+            return segment_sections(text)
+
+    def _prompt_context(self, call: str, sections: Dict[str, str], text: str) -> str:
+        """Relevant sections for one LLM call, trimmed to its token budget."""
+        budget = self.prompt_budgets[call]
+        return build_context(
+            sections,
+            budget["sections"],
+            budget["max_tokens"],
+            chars_per_token=self.chars_per_token,
+            fallback=text,
         )
 
-        return response.content.strip()
+    def _extract_fields(self, text: str) -> Dict[str, any]:
+        """Deterministic (non-LLM) fields, from one pass of the field scanner."""
+        with span("parse.fields"):
+            return scan_fields(text)
+
+    def _build_info(
+        self,
+        text: str,
+        job_role: str,
+        skills: List[str],
+        fields: Dict[str, any],
+        degraded: List[str],
+        budget: ParseBudget,
+    ) -> Dict[str, any]:
+        info = {
+            "raw_text": text,
+            "name": fields["name"],
+            "email": fields["email"],
+            "phone": fields["phone"],
+            "linkedin_url": fields["linkedin_url"],
+            "github_url": fields["github_url"],
+            "portfolio_url": fields["portfolio_url"],
+            "job_role": job_role,
+            "skills": skills,
+            "experience": fields["experience"],
+            "education": fields["education"],
+            # LLM-derived fields that fell back to local results
+            "degraded": degraded,
+            # Resource limits applied and what they cut
+            "limits": budget.report(),
+        }
 
-    def _extract_skills(self, text: str, job_role: str) -> List[str]:
-        prompt = ChatPromptTemplate.from_template(
-            """
-            You are an expert interviewer.
+        if degraded:
+            logger.warning(f"Resume parsed with fallbacks for: {', '.join(degraded)}")
+        logger.info(f"Resume parsed successfully for role: {job_role}")
+        return info
 
-            Candidate job role:
-            {job_role}
+    def _reuse_profile(
+        self,
+        text: str,
+        prior: Dict[str, any],
+        fields: Dict[str, any],
+        budget: ParseBudget,
+    ) -> Dict[str, any]:
+        """Profile with the LLM fields of an earlier one and this resume's own regex fields."""
+        logger.info("Reusing job role and skills of an earlier profile (no LLM calls)")
+        info = self._build_info(
+            text,
+            prior.get("job_role") or FALLBACK_JOB_ROLE,
+            list(prior.get("skills") or []),
+            fields,
+            [],
+            budget,
+        )
+        info["near_duplicate"] = prior.get("near_duplicate") or {}
+        return info
 
-            Extract ONLY skill keywords (technical and non-technical).
-            Do NOT include certifications, achievements, or tools descriptions.
-            Remove duplicates.
-            Return output as a simple comma-separated list.
+    # =========================
+    # FILE EXTRACTION
+    # =========================
 
-            Resume text:
-            {text}
-            """
+    def _extract_from_pdf(self, document: ResumeDocument, budget: ParseBudget) -> str:
+        pages, total = extract_pdf_pages(
+            document.data,
+            self.pdf_backend,
+            parallel_page_threshold=self.pdf_parallel_threshold,
+            max_workers=self.pdf_max_workers,
+            max_pages=budget.max_pages,
+            max_chars=budget.max_chars,
+            deadline=budget.deadline,
         )
+        budget.pages, budget.pages_total = len(pages), total
+        allowed = min(total, budget.max_pages) if budget.max_pages is not None else total
+        if allowed < total:
+            budget.note("pages")
+        if len(pages) < allowed and budget.expired():
+            budget.note("time")
+        text = "".join(pages)
+
+        # OCR is not available (see _extract_from_pdf_ocr), so image-only PDFs fail here
+        if not text.strip():
+            logger.warning(f"No extractable text found using {self.pdf_backend.name}")
+            raise NoExtractableTextError(
+                f"No extractable text in {document.name} (scanned or image-only PDFs need OCR, "
+                f"which is not enabled)"
+            )
 
-        response = self.llm.invoke(
-            prompt.format_messages(job_role=job_role, text=text)
-        )
+        return text
 
-        # Normalize into Python list
-        skills = [
-            s.strip()
-            for s in response.content.split(",")
-            if s.strip()
-        ]
-        return list(set(skills))
+    def _extract_from_docx(self, document: ResumeDocument, budget: ParseBudget) -> str:
+        import docx
+
+        doc = docx.Document(document.stream())
+        paragraphs, chars = [], 0
+        for paragraph in doc.paragraphs:
+            if budget.chars_exceeded(chars):
+                break
+            if budget.expired():
+                budget.note("time")
+                break
+            paragraphs.append(paragraph.text)
+            chars += len(paragraph.text) + 1
+        return "\n".join(paragraphs)
+
+    def _extract_from_txt(self, document: ResumeDocument, budget: ParseBudget) -> str:
+        # Text mode over the buffer, for the same newline handling as open()
+        reader = io.TextIOWrapper(document.stream(), encoding="utf-8")
+        return reader.read(budget.max_chars + 1 if budget.max_chars is not None else -1)
 
     # =========================
-    # OPTIONAL LINKS
+    # LLM-BASED INTELLIGENCE
     # =========================
 
-    def _extract_github(self, text: str) -> Optional[str]:
-        pattern = r'(https?://)?(www\.)?github\.com/[A-Za-z0-9_-]+'
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            url = match.group()
-            return url if url.startswith("http") else f"https://{url}"
-        return None
+    def _extract_job_role(self, context: str, degraded: List[str]) -> str:
+        messages = self._job_role_messages(context)
+        try:
+            with span("llm.job_role") as s:
+                response = self.llm.invoke(messages)
+                s.set(**self._log_prompt_tokens("job_role", messages, response))
+        except Exception as e:
+            return self._job_role_fallback(e, degraded)
+        return response.content.strip()
 
-    def _extract_portfolio(self, text: str) -> Optional[str]:
-        urls = re.findall(r'(https?://[^\s]+)', text)
-        blacklist = ["linkedin.com", "github.com"]
+    async def _aextract_job_role(self, context: str, degraded: List[str]) -> str:
+        messages = self._job_role_messages(context)
+        try:
+            with span("llm.job_role") as s:
+                response = await self.llm.ainvoke(messages)
+                s.set(**self._log_prompt_tokens("job_role", messages, response))
+        except Exception as e:
+            return self._job_role_fallback(e, degraded)
+        return response.content.strip()
+
+    def _extract_skills(self, text: str, job_role: str, context: str, degraded: List[str]) -> List[str]:
+        # The taxonomy scan is local, so it always sees the full text
+        known = self._match_skills(text)
+        if self.skills_mode == "dictionary":
+            return known
+
+        messages = self._skills_messages(context, job_role, known)
+        try:
+            with span("llm.skills") as s:
+                response = self.llm.invoke(messages)
+                s.set(**self._log_prompt_tokens("skills", messages, response))
+        except Exception as e:
+            return self._skills_fallback(e, text, known, degraded)
+        return self._merge_skills(known, response.content)
+
+    async def _aextract_skills(self, text: str, job_role: str, context: str, degraded: List[str]) -> List[str]:
+        known = self._match_skills(text)
+        if self.skills_mode == "dictionary":
+            return known
+
+        messages = self._skills_messages(context, job_role, known)
+        try:
+            with span("llm.skills") as s:
+                response = await self.llm.ainvoke(messages)
+                s.set(**self._log_prompt_tokens("skills", messages, response))
+        except Exception as e:
+            return self._skills_fallback(e, text, known, degraded)
+        return self._merge_skills(known, response.content)
+
+    def _job_role_fallback(self, error: Exception, degraded: List[str]) -> str:
+        logger.error(f"Job role extraction failed, using '{FALLBACK_JOB_ROLE}': {error}")
+        degraded.append("job_role")
+        return FALLBACK_JOB_ROLE
+
+    def _skills_fallback(self, error: Exception, text: str, known: List[str], degraded: List[str]) -> List[str]:
+        """Taxonomy matches only (also in llm mode, which skips them otherwise)."""
+        logger.error(f"Skill extraction failed, using taxonomy matches: {error}")
+        degraded.append("skills")
+        if self.skills_mode == "llm":
+            return self.skill_matcher.find(text)
+        return known
+
+    def _log_prompt_tokens(self, call: str, messages, response) -> Dict[str, any]:
+        return log_prompt_tokens(logger, call, messages, response, self.chars_per_token)
+
+    def _match_skills(self, text: str) -> List[str]:
+        """Taxonomy skills found locally (none in llm-only mode)."""
+        if self.skills_mode == "llm":
+            return []
+
+        with span("parse.match_skills") as s:
+            skills = self.skill_matcher.find(text)
+            s.set(matched=len(skills))
+        logger.info(f"Skill taxonomy matched {len(skills)} skills")
+        return skills
+
+    def _job_role_messages(self, context: str):
+        from langchain_core.prompts import ChatPromptTemplate
+
+        prompt = ChatPromptTemplate.from_template(JOB_ROLE_PROMPT)
+        return prompt.format_messages(summary=context)
+
+    def _skills_messages(self, text: str, job_role: str, known: List[str]):
+        from langchain_core.prompts import ChatPromptTemplate
+
+        if self.skills_mode == "hybrid":
+            prompt = ChatPromptTemplate.from_template(SKILLS_HYBRID_PROMPT)
+            return prompt.format_messages(
+                job_role=job_role,
+                known_skills=", ".join(known) or "NONE",
+                text=text,
+            )
+
+        prompt = ChatPromptTemplate.from_template(SKILLS_PROMPT)
+        return prompt.format_messages(job_role=job_role, text=text)
+
+    def _merge_skills(self, known: List[str], content: str) -> List[str]:
+        return self.skill_matcher.canonicalize(known + self._parse_skills(content))
+
+    def _parse_skills(self, content: str) -> List[str]:
+        # Normalize into Python list
+        if content.strip().upper() == "NONE":
+            return []
 
-        for url in urls:
-            if not any(b in url.lower() for b in blacklist):
-                return url
+        return [
+            s.strip()
+            for s in content.split(",")
+            if s.strip()
+        ]
 
-        return None
     # def _extract_from_pdf_ocr(self, file_path: Path) -> str:
     #     """
     #     OCR fallback for image-based or design-heavy PDFs.
@@ -0,0 +1,126 @@
+"""
+Split resume text into sections and build token-budgeted prompt context.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from src.utils.tokens import trim_to_tokens
+
+
+SECTION_HEADINGS = {
+    "summary": [
+        "summary", "professional summary", "career summary", "profile",
+        "professional profile", "objective", "career objective", "about me",
+    ],
+    "experience": [
+        "experience", "experiences", "work experience", "professional experience",
+        "professional experiences", "employment history", "work history",
+        "employment", "career history",
+    ],
+    "skills": [
+        "skills", "technical skills", "key skills", "core skills",
+        "core competencies", "competencies", "skills and tools",
+        "tools and technologies", "technologies", "areas of expertise",
+    ],
+    "education": [
+        "education", "academic background", "academics", "qualifications",
+        "educational qualifications", "education and training",
+    ],
+    "projects": [
+        "projects", "project", "personal projects", "academic projects",
+        "key projects",
+    ],
+    "certifications": [
+        "certifications", "certification", "certificates",
+        "licenses and certifications", "licenses & certifications",
+    ],
+}
+
+# Text before the first recognized heading (name, contact line, title)
+HEADER = "header"
+
+_HEADINGS = {
+    alias: section
+    for section, aliases in SECTION_HEADINGS.items()
+    for alias in aliases
+}
+
+_MAX_HEADING_WORDS = max(len(alias.split()) for alias in _HEADINGS)
+_HEADING_LINE = re.compile(r"^\s*([A-Za-z&][A-Za-z&\s]*?)\s*(?::\s*(.*))?$")
+_SPACES = re.compile(r"\s+")
+
+
+def _heading_of(line: str) -> Optional[tuple]:
+    """(section, inline content) if the line is a section heading."""
+    match = _HEADING_LINE.match(line)
+    if not match:
+        return None
+
+    title = _SPACES.sub(" ", match.group(1)).lower()
+    if len(title.split()) > _MAX_HEADING_WORDS:
+        return None
+
+    section = _HEADINGS.get(title)
+    if section is None:
+        return None
+    return section, (match.group(2) or "").strip()
+
+
+def segment_sections(text: str) -> Dict[str, str]:
+    """
+    Split resume text into sections keyed by canonical name.
+
+    Headings are short lines matching a known title ("Technical Skills",
+    "PROFESSIONAL EXPERIENCE:", "Skills: Python, SQL"); repeated sections
+    are concatenated. Text before the first heading is kept as "header".
+
+    Args:
+        text: Raw resume text
+
+    Returns:
+        Section name -> section text, in document order
+    """
+    sections: Dict[str, List[str]] = {}
+    current = HEADER
+
+    for line in text.split("\n"):
+        heading = _heading_of(line)
+        if heading is not None:
+            current, inline = heading
+            sections.setdefault(current, [])
+            if inline:
+                sections[current].append(inline)
+            continue
+
+        sections.setdefault(current, []).append(line)
+
+    return {
+        name: "\n".join(lines).strip()
+        for name, lines in sections.items()
+        if any(line.strip() for line in lines)
+    }
+
+
+def build_context(
+    sections: Dict[str, str],
+    wanted: List[str],
+    max_tokens: int,
+    chars_per_token: float = 4.0,
+    fallback: str = "",
+) -> str:
+    """
+    Join the wanted sections (in priority order) under their headings,
+    trimmed to the token budget.
+
+    If none of the wanted sections were found, the fallback text (usually
+    the raw resume) is trimmed to the budget instead.
+    """
+    parts = [
+        f"{name.upper()}:\n{sections[name]}"
+        for name in wanted
+        if sections.get(name)
+    ]
+
+    context = "\n\n".join(parts) if parts else fallback
+    return trim_to_tokens(context, max_tokens, chars_per_token)
@@ -0,0 +1,158 @@
+"""
+Local skill extraction backed by a skill taxonomy and an Aho-Corasick automaton.
+"""
+
+import hashlib
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+_HYPHEN = re.compile(r"\s*-\s*")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_skill_text(text: str) -> str:
+    """Lowercase, treat hyphens as spaces and collapse whitespace."""
+    return _SPACES.sub(" ", _HYPHEN.sub(" ", text.lower()))
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher; one linear scan finds every occurrence."""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, str]]] = [[]]
+
+    def add(self, pattern: str, value: str) -> None:
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), value))
+
+    def build(self) -> None:
+        """Compute failure links (breadth-first) after all patterns are added."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, value) for every pattern occurrence."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+
+        for i, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            for length, value in out[node]:
+                yield i + 1 - length, i + 1, value
+
+
+class SkillMatcher:
+    """
+    Finds taxonomy skills in resume text and maps aliases to canonical names.
+
+    Only whole-word occurrences count, and overlapping hits resolve to the
+    leftmost-longest alias (e.g. "power bi" wins over "bi").
+    """
+
+    def __init__(self, taxonomy: Dict[str, dict], version: str = ""):
+        self.version = version
+        self._aliases: Dict[str, str] = {}
+        self._automaton = AhoCorasick()
+
+        for canonical, entry in taxonomy.items():
+            canonical = str(canonical)
+            if isinstance(entry, dict):
+                aliases = list(entry.get("aliases") or [])
+                if entry.get("match_name", True):
+                    aliases.append(canonical)
+            else:
+                aliases = list(entry or []) + [canonical]
+
+            # The canonical name always normalizes to itself
+            self._aliases.setdefault(normalize_skill_text(canonical), canonical)
+
+            for alias in aliases:
+                key = normalize_skill_text(str(alias)).strip()
+                if key:
+                    self._aliases[key] = canonical
+                    self._automaton.add(key, canonical)
+
+        self._automaton.build()
+
+    @classmethod
+    def from_yaml(cls, path: str) -> "SkillMatcher":
+        """Load a taxonomy file (see config/skills.yaml)."""
+        import yaml
+
+        data = Path(path).read_bytes()
+        config = yaml.safe_load(data) or {}
+        version = f"{config.get('version', 0)}:{hashlib.sha256(data).hexdigest()[:12]}"
+        return cls(config.get("skills") or {}, version=version)
+
+    def find(self, text: str) -> List[str]:
+        """Canonical skills mentioned in the text, in order of first mention."""
+        text = normalize_skill_text(text)
+
+        matches = sorted(
+            (start, -end, value)
+            for start, end, value in self._automaton.iter_matches(text)
+            if self._is_word(text, start, end)
+        )
+
+        skills, seen, last_end = [], set(), 0
+        for start, neg_end, value in matches:
+            if start < last_end:
+                continue
+            last_end = -neg_end
+            if value not in seen:
+                seen.add(value)
+                skills.append(value)
+
+        return skills
+
+    def canonicalize(self, skills: Iterable[str]) -> List[str]:
+        """Map aliases to canonical names and drop duplicates (order kept)."""
+        result, seen = [], set()
+
+        for skill in skills:
+            skill = skill.strip()
+            if not skill:
+                continue
+
+            key = normalize_skill_text(skill).strip()
+            canonical = self._aliases.get(key, skill)
+
+            dedupe_key = canonical.lower()
+            if dedupe_key not in seen:
+                seen.add(dedupe_key)
+                result.append(canonical)
+
+        return result
+
+    @staticmethod
+    def _is_word(text: str, start: int, end: int) -> bool:
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        return not before.isalnum() and not after.isalnum()
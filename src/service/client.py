@@ -0,0 +1,169 @@
+"""
+Client for the local job service (src/service/server.py).
+"""
+
+import json
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+from config.settings import settings
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(
+    name="job_client",
+    log_dir="logs/interview_agent",
+)
+
+
+class ServiceBusyError(RuntimeError):
+    """The service rejected a job because its queue is full."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ServiceUnavailableError(ConnectionError):
+    """The service could not be reached."""
+
+
+class JobServiceClient:
+    """Submit resumes to the job service and follow them to completion."""
+
+    def __init__(self, base_url: str, timeout: float = 10, poll_seconds: float = 0.5):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.poll_seconds = poll_seconds
+
+    # =========================
+    # ENDPOINTS
+    # =========================
+
+    def health(self) -> Dict:
+        return self._request("GET", "/health")
+
+    def submit_path(self, resume_path: str, job_id: Optional[str] = None) -> Dict:
+        """Queue a resume the service can read from the shared filesystem."""
+        body = json.dumps({"resume_path": str(resume_path), "job_id": job_id}).encode("utf-8")
+        return self._request("POST", "/jobs", body, "application/json")
+
+    def submit_bytes(self, data: bytes, filename: str, job_id: Optional[str] = None) -> Dict:
+        """Queue an uploaded resume; ``filename`` tells the service its format."""
+        query = {"filename": filename, **({"job_id": job_id} if job_id else {})}
+        return self._request("POST", f"/jobs?{urlencode(query)}", data, "application/octet-stream")
+
+    def status(self, job_id: str, since: int = 0) -> Dict:
+        return self._request("GET", f"/jobs/{quote(job_id)}?since={since}")
+
+    def result(self, job_id: str) -> Dict:
+        return self._request("GET", f"/jobs/{quote(job_id)}/result")
+
+    # =========================
+    # HELPERS
+    # =========================
+
+    def submit_with_backoff(self, submit: Callable[[], Dict], max_wait: Optional[float] = None) -> Dict:
+        """Call a submit function, waiting out ``429 queue full`` responses."""
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        while True:
+            try:
+                return submit()
+            except ServiceBusyError as e:
+                if deadline is not None and time.monotonic() + e.retry_after > deadline:
+                    raise
+                time.sleep(e.retry_after)
+
+    def wait(
+        self,
+        job_id: str,
+        on_update: Optional[Callable[[Dict], None]] = None,
+        poll_seconds: Optional[float] = None,
+    ) -> Dict:
+        """
+        Poll a job until it finishes and return the final job.
+
+        ``on_update`` gets every status response; their ``questions`` hold
+        only the questions that are new since the previous call.
+        """
+        seen = 0
+        while True:
+            job = self.status(job_id, since=seen)
+            seen += len(job["questions"])
+            if on_update is not None:
+                on_update(job)
+
+            if job["status"] in ("completed", "failed"):
+                return self.result(job_id)
+            time.sleep(poll_seconds or self.poll_seconds)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        content_type: Optional[str] = None,
+    ) -> Dict:
+        request = Request(self.base_url + path, data=body, method=method)
+        if content_type:
+            request.add_header("Content-Type", content_type)
+
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except HTTPError as e:
+            try:
+                detail = json.loads(e.read() or b"{}").get("error", e.reason)
+            except json.JSONDecodeError:
+                detail = e.reason
+            if e.code == 429:
+                raise ServiceBusyError(detail, float(e.headers.get("Retry-After") or 1))
+            if e.code == 404:
+                raise KeyError(detail)
+            raise RuntimeError(f"Job service returned {e.code}: {detail}")
+        except URLError as e:
+            raise ServiceUnavailableError(f"Job service unreachable at {self.base_url}: {e.reason}")
+
+
+# =========================
+# CONFIGURED CLIENT
+# =========================
+
+_local_service = None
+_local_lock = threading.Lock()
+
+
+def get_service_client(workers: Optional[int] = None) -> JobServiceClient:
+    """
+    Client for the service at `service.host`/`service.port`.
+
+    With `service.autostart`, a service is started in this process when
+    none is listening there (e.g. the Streamlit app run on its own), with
+    ``workers`` workers (default `service.workers`). A service that is
+    already running keeps its own worker count.
+    """
+    global _local_service
+
+    host = settings.get("service.host", "127.0.0.1")
+    port = settings.get("service.port", 8765)
+    client = JobServiceClient(
+        f"http://{host}:{port}", poll_seconds=settings.get("service.poll_seconds", 0.5)
+    )
+
+    try:
+        client.health()
+        return client
+    except ServiceUnavailableError:
+        if not settings.get("service.autostart", True):
+            raise
+
+    with _local_lock:
+        if _local_service is None:
+            from src.service.server import start_service
+            logger.info("No job service running; starting one in this process")
+            _local_service = start_service(host, port, workers=workers)
+    return client
@@ -0,0 +1,356 @@
+"""
+Persistent job queue and bounded worker pool in front of InterviewAgent.
+
+Jobs are stored in SQLite, so queued work survives a restart; jobs that
+were running when the process stopped are queued again. At most
+`service.workers` jobs run at once, and submissions are rejected once
+`service.max_queue_depth` jobs are waiting.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config.settings import settings
+from src.utils.logger import setup_logger
+from src.utils.tracing import metrics
+
+
+logger = setup_logger(
+    name="job_service",
+    log_dir="logs/interview_agent",
+)
+
+JOB_STATES = ("queued", "running", "completed", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id       TEXT PRIMARY KEY,
+    resume_path  TEXT NOT NULL,
+    resume_data  BLOB,
+    status       TEXT NOT NULL,
+    progress     TEXT,
+    error        TEXT,
+    result       TEXT,
+    created_at   TEXT,
+    started_at   TEXT,
+    finished_at  TEXT,
+    seq          INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, seq);
+"""
+
+# Everything but the uploaded content, which status queries never need
+_JOB_COLUMNS = "job_id, resume_path, status, progress, error, result, created_at, started_at, finished_at, seq"
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the queue already holds `max_queue_depth` waiting jobs."""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class JobQueue:
+    """
+    Bounded worker pool over a SQLite-backed FIFO of resume jobs.
+
+    Each job runs ``agent.stream`` with the job ID as run ID; its stage,
+    candidate profile and questions so far are kept in memory while it
+    runs and stored with the job when it finishes.
+    """
+
+    def __init__(
+        self,
+        agent,
+        path: str,
+        workers: int = 2,
+        max_queue_depth: int = 50,
+    ):
+        self.agent = agent
+        self.workers = max(1, workers)
+        self.max_queue_depth = max_queue_depth
+
+        db_path = Path(path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "resume_data" not in columns:
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN resume_data BLOB")
+
+        # Guards the connection and the live state; workers wait on it
+        self._cond = threading.Condition()
+        self._live: Dict[str, Dict] = {}
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+
+        requeued = self._conn.execute(
+            "UPDATE jobs SET status = 'queued', started_at = NULL WHERE status = 'running'"
+        ).rowcount
+        self._conn.commit()
+        if requeued:
+            logger.info(f"Re-queued {requeued} jobs interrupted by the last shutdown")
+
+    def start(self) -> "JobQueue":
+        with self._cond:
+            if not self._threads:
+                self._stopping = False
+                self._threads = [
+                    threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+                    for i in range(self.workers)
+                ]
+                for thread in self._threads:
+                    thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop taking jobs and wait for running ones (they finish normally)."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    # =========================
+    # SUBMIT & QUERY
+    # =========================
+
+    def submit(
+        self,
+        resume_path: Optional[str] = None,
+        data: Optional[bytes] = None,
+        filename: Optional[str] = None,
+        job_id: Optional[str] = None,
+    ) -> Dict:
+        """
+        Queue a resume, given as a local path or as uploaded bytes
+        (kept in the queue database until the job has run).
+
+        Submitting the ``job_id`` of a job that is still queued or running
+        returns that job; a finished one is queued again.
+
+        Raises:
+            QueueFullError: ``max_queue_depth`` jobs are already waiting
+        """
+        if (resume_path is None) == (data is None):
+            raise ValueError("Submit either resume_path or data")
+
+        job_id = job_id or uuid.uuid4().hex[:12]
+
+        with self._cond:
+            existing = self._row(job_id)
+            if existing is not None and existing["status"] in ("queued", "running"):
+                return self._to_job(existing)
+
+            depth = self._depth()
+            if self.max_queue_depth and depth >= self.max_queue_depth:
+                metrics.increment("jobs_submitted_total", outcome="rejected")
+                raise QueueFullError(f"Job queue is full ({depth} waiting)")
+
+            seq = self._conn.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM jobs").fetchone()[0]
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO jobs (job_id, resume_path, resume_data, status, progress, created_at, seq)
+                VALUES (?, ?, ?, 'queued', ?, ?, ?)
+                """,
+                (
+                    job_id,
+                    resume_path if data is None else (filename or "<upload>"),
+                    data,
+                    json.dumps({"stage": "queued"}),
+                    _now(),
+                    seq,
+                ),
+            )
+            self._conn.commit()
+            self._cond.notify()
+
+            metrics.increment("jobs_submitted_total", outcome="accepted")
+            return self._to_job(self._row(job_id))
+
+    def get(self, job_id: str, since: int = 0) -> Optional[Dict]:
+        """
+        Job status and progress.
+
+        While a job runs, ``questions`` holds the questions generated so
+        far (from position ``since`` on) and ``provisional_questions`` the
+        question bank set to show meanwhile (hybrid mode); finished jobs
+        carry the result.
+        """
+        with self._cond:
+            row = self._row(job_id)
+            if row is None:
+                return None
+
+            job = self._to_job(row)
+            if row["status"] == "queued":
+                job["position"] = self._conn.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND seq < ?", (row["seq"],)
+                ).fetchone()[0]
+
+            live = self._live.get(job_id)
+            result = dict(live) if live is not None else json.loads(row["result"] or "{}")
+
+        questions = result.get("questions") or []
+        job["candidate_info"] = result.get("candidate_info") or {}
+        job["questions"] = questions[since:]
+        job["provisional_questions"] = result.get("provisional_questions") or []
+        if job["status"] in ("completed", "failed"):
+            job["timings"] = result.get("timings", {})
+        return job
+
+    def stats(self) -> Dict:
+        with self._cond:
+            counts = dict(self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        return {
+            "workers": self.workers,
+            "max_queue_depth": self.max_queue_depth,
+            **{state: counts.get(state, 0) for state in JOB_STATES},
+        }
+
+    def _depth(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+
+    def _row(self, job_id: str) -> Optional[sqlite3.Row]:
+        return self._conn.execute(f"SELECT {_JOB_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Dict:
+        return {
+            "job_id": row["job_id"],
+            "status": row["status"],
+            "progress": json.loads(row["progress"] or "{}"),
+            "error": row["error"] or "",
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+        }
+
+    # =========================
+    # WORKERS
+    # =========================
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                row = self._claim()
+                while row is None and not self._stopping:
+                    self._cond.wait()
+                    row = self._claim()
+                if row is None:
+                    return
+
+            self._run(row)
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Mark the oldest queued job as running (caller holds the lock)."""
+        if self._stopping:
+            return None
+
+        row = self._conn.execute(
+            "SELECT * FROM jobs WHERE status = 'queued' ORDER BY seq LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+
+        progress = {"stage": "parsing"}
+        self._conn.execute(
+            "UPDATE jobs SET status = 'running', started_at = ?, progress = ? WHERE job_id = ?",
+            (_now(), json.dumps(progress), row["job_id"]),
+        )
+        self._conn.commit()
+        self._live[row["job_id"]] = {"candidate_info": {}, "questions": [], "provisional_questions": []}
+        return row
+
+    def _run(self, row: sqlite3.Row) -> None:
+        job_id, resume_path, data = row["job_id"], row["resume_path"], row["resume_data"]
+        waited = datetime.now(timezone.utc) - datetime.fromisoformat(row["created_at"])
+        metrics.observe("job_queue_wait_ms", waited.total_seconds() * 1e3)
+        logger.info(f"Job {job_id} started after {waited.total_seconds():.2f}s in queue")
+
+        live = self._live[job_id]
+        state: Dict = {"status": "failed", "error": "No result"}
+        start = time.perf_counter()
+
+        try:
+            resume = resume_path if data is None else data
+            for event, payload in self.agent.stream(resume, run_id=job_id, name=resume_path):
+                if event == "resume_parsed":
+                    live["candidate_info"] = self._public_profile(payload["candidate_info"])
+                    self._set_progress(job_id, {"stage": "generating", "questions": 0})
+                elif event == "provisional":
+                    live["provisional_questions"] = payload
+                elif event == "question":
+                    live["questions"].append(payload)
+                    self._set_progress(job_id, {"stage": "generating", "questions": len(live["questions"])})
+                elif event == "completed":
+                    state = payload
+        except Exception as e:
+            logger.error(f"Job {job_id} crashed: {e}")
+            state = {"status": "failed", "error": str(e)}
+
+        result = {
+            "candidate_info": self._public_profile(state.get("candidate_info") or live["candidate_info"]),
+            "questions": state.get("questions", live["questions"]),
+            "timings": state.get("timings", {}),
+        }
+        status = "completed" if state.get("status") == "completed" else "failed"
+
+        with self._cond:
+            self._conn.execute(
+                """
+                UPDATE jobs SET status = ?, error = ?, result = ?, progress = ?, finished_at = ?,
+                    resume_data = NULL
+                WHERE job_id = ?
+                """,
+                (
+                    status,
+                    state.get("error", ""),
+                    json.dumps(result),
+                    json.dumps({"stage": status, "questions": len(result["questions"])}),
+                    _now(),
+                    job_id,
+                ),
+            )
+            self._conn.commit()
+            del self._live[job_id]
+
+        metrics.increment("jobs_finished_total", status=status)
+        logger.info(f"Job {job_id} {status} in {time.perf_counter() - start:.2f}s")
+
+    def _set_progress(self, job_id: str, progress: Dict) -> None:
+        with self._cond:
+            self._conn.execute(
+                "UPDATE jobs SET progress = ? WHERE job_id = ?", (json.dumps(progress), job_id)
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _public_profile(candidate_info: Dict) -> Dict:
+        profile = dict(candidate_info)
+        profile.pop("raw_text", None)
+        return profile
+
+
+def build_job_queue(agent=None, workers: Optional[int] = None) -> JobQueue:
+    """JobQueue configured from the `service` config section (``workers`` overrides `service.workers`)."""
+    if agent is None:
+        from src.agent.interview_agent import InterviewAgent
+        agent = InterviewAgent()
+
+    return JobQueue(
+        agent,
+        path=settings.get("service.queue_path", "data/service/jobs.sqlite"),
+        workers=workers or settings.get("service.workers", 2),
+        max_queue_depth=settings.get("service.max_queue_depth", 50),
+    )
@@ -0,0 +1,158 @@
+"""
+Local HTTP service for question generation jobs.
+
+Endpoints:
+    POST /jobs                   submit a resume: JSON {"resume_path": ..., "job_id": ...}
+                                 or the raw file as body with ?filename=resume.pdf[&job_id=...]
+                                 -> 202 job, 429 when the queue is full
+    GET  /jobs/<id>[?since=N]    status, progress and questions generated so far
+    GET  /jobs/<id>/result       final result -> 409 while the job has not finished
+    GET  /health                 worker and queue counts
+
+Usage:
+    python -m src.service.server [--host 127.0.0.1] [--port 8765]
+"""
+
+import argparse
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from config.settings import settings
+from src.service.jobs import JobQueue, QueueFullError, build_job_queue
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(
+    name="job_server",
+    log_dir="logs/interview_agent",
+)
+
+
+def _make_handler(queue: JobQueue, max_upload_bytes: int):
+
+    class _JobHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            parts = [p for p in url.path.split("/") if p]
+            query = parse_qs(url.query)
+
+            if parts == ["health"]:
+                self._send(200, {"status": "ok", **queue.stats()})
+            elif len(parts) == 2 and parts[0] == "jobs":
+                since = query.get("since", ["0"])[0]
+                if not since.isdigit():
+                    self._send(400, {"error": f"Invalid since: {since}"})
+                    return
+                self._send_job(queue.get(parts[1], since=int(since)))
+            elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "result":
+                job = queue.get(parts[1])
+                if job is not None and job["status"] not in ("completed", "failed"):
+                    self._send(409, {"error": f"Job is {job['status']}", **job})
+                else:
+                    self._send_job(job)
+            else:
+                self._send(404, {"error": "Not found"})
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            if url.path.rstrip("/") != "/jobs":
+                self._send(404, {"error": "Not found"})
+                return
+
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > max_upload_bytes:
+                self._send(413, {"error": f"Upload larger than {max_upload_bytes} bytes"})
+                return
+            body = self.rfile.read(length)
+
+            try:
+                job = queue.submit(**self._submission(body, parse_qs(url.query)))
+            except QueueFullError as e:
+                self._send(429, {"error": str(e)}, headers={"Retry-After": "5"})
+            except ValueError as e:
+                self._send(400, {"error": str(e)})
+            else:
+                self._send(202, job)
+
+        def _submission(self, body: bytes, query: Dict) -> Dict:
+            if self.headers.get("Content-Type", "").startswith("application/json"):
+                try:
+                    request = json.loads(body or b"{}")
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON body: {e}")
+                return {"resume_path": request.get("resume_path"), "job_id": request.get("job_id")}
+
+            return {
+                "data": body,
+                "filename": query.get("filename", [""])[0],
+                "job_id": query.get("job_id", [None])[0],
+            }
+
+        def _send_job(self, job: Optional[Dict]) -> None:
+            if job is None:
+                self._send(404, {"error": "Unknown job"})
+            else:
+                self._send(200, job)
+
+        def _send(self, code: int, body: Dict, headers: Dict[str, str] = None) -> None:
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            logger.debug(f"{self.address_string()} {format % args}")
+
+    return _JobHandler
+
+
+def start_service(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    queue: Optional[JobQueue] = None,
+    workers: Optional[int] = None,
+) -> Tuple[ThreadingHTTPServer, JobQueue]:
+    """Start the worker pool and serve the API from a daemon thread."""
+    host = host or settings.get("service.host", "127.0.0.1")
+    port = settings.get("service.port", 8765) if port is None else port
+    queue = (queue or build_job_queue(workers=workers)).start()
+    queue.agent.warm_up()
+
+    max_upload_bytes = int(settings.get("resume.max_file_size_mb", 10) * 1024 * 1024)
+    server = ThreadingHTTPServer((host, port), _make_handler(queue, max_upload_bytes))
+    threading.Thread(target=server.serve_forever, name="job-service", daemon=True).start()
+
+    logger.info(f"Job service listening on http://{host}:{server.server_port} ({queue.workers} workers)")
+    return server, queue
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Serve question generation jobs over HTTP")
+    parser.add_argument("--host", help="Default: service.host")
+    parser.add_argument("--port", type=int, help="Default: service.port")
+    args = parser.parse_args(argv)
+
+    server, queue = start_service(args.host, args.port)
+    print(f"Serving on http://{server.server_address[0]}:{server.server_port} (Ctrl+C to stop)")
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        print("Stopping: waiting for running jobs to finish")
+    finally:
+        server.shutdown()
+        queue.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""
+Near-duplicate resume detection: MinHash signatures in an LSH index.
+
+Each indexed resume is reduced to a MinHash signature of its word
+shingles. Signatures are split into bands and every band is a hash
+bucket, so a lookup costs one dict probe per band plus a signature
+comparison for the few resumes sharing a bucket — independent of how
+many resumes are indexed. Signatures persist in SQLite; the buckets are
+rebuilt in memory when the index is opened.
+
+Usage:
+    python -m src.storage.duplicate_index query "test/Uday CSA Resume.pdf"
+"""
+
+import argparse
+import re
+import sqlite3
+import sys
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from config.settings import settings
+
+
+# Bump whenever shingling or hashing changes so stored signatures are rebuilt
+INDEX_VERSION = "1"
+
+# Mersenne prime for the (a * x + b) mod p hash family
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    doc_id      TEXT PRIMARY KEY,
+    signature   BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key         TEXT PRIMARY KEY,
+    value       TEXT
+);
+"""
+
+# Contact details and links change between versions of the same resume
+_VOLATILE = re.compile(r"\S+@\S+|https?://\S+|www\.\S+", re.IGNORECASE)
+# Letters only: dates, phone numbers and years of experience are left out too
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+def shingles(text: str, size: int = 5) -> Set[str]:
+    """Overlapping ``size``-word sequences of the normalized text."""
+    words = _WORD.findall(_VOLATILE.sub(" ", text.lower()))
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """MinHash signatures of ``num_perm`` values for shingle sets."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        import numpy as np
+
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        # a, b < 2^32 and shingle hashes < 2^32 keep a * x + b inside uint64
+        self._a = rng.integers(1, _MAX_HASH, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MAX_HASH, size=num_perm, dtype=np.uint64)
+
+    def fingerprint(self) -> str:
+        """Settings the signatures depend on (stored signatures must match)."""
+        return f"v={INDEX_VERSION}:perm={self.num_perm}:shingle={self.shingle_size}:seed={self.seed}"
+
+    def signature(self, text: str):
+        """uint32 signature of the text, or None when it has no words."""
+        import numpy as np
+
+        grams = shingles(text, self.shingle_size)
+        if not grams:
+            return None
+
+        hashes = np.fromiter(
+            (zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams)
+        )
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _PRIME
+        return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+
+class NearDuplicateIndex:
+    """
+    Persistent LSH index from resume text to the ID it was indexed under.
+
+    ``bands`` must divide ``num_perm``; more bands find less similar
+    candidates. Matches are confirmed against ``threshold`` using the
+    signatures' estimated Jaccard similarity.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        threshold: float = 0.9,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm, shingle_size)
+
+        self._signatures: Dict[str, "np.ndarray"] = {}
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._load()
+
+    def _load(self) -> None:
+        import numpy as np
+
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        if row is None or row[0] != self.hasher.fingerprint():
+            # Signatures from other settings are not comparable; the index refills as runs complete
+            with self._conn:
+                self._conn.execute("DELETE FROM signatures")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)",
+                    (self.hasher.fingerprint(),),
+                )
+            return
+
+        for doc_id, blob in self._conn.execute("SELECT doc_id, signature FROM signatures"):
+            self._insert(doc_id, np.frombuffer(blob, dtype=np.uint32))
+
+    # =========================
+    # INDEX
+    # =========================
+
+    def add(self, doc_id: str, text: str) -> bool:
+        """Index text under ``doc_id`` (replacing what it had). False if the text has no words."""
+        signature = self.hasher.signature(text)
+        if signature is None:
+            return False
+
+        with self._lock:
+            self._remove(doc_id)
+            self._insert(doc_id, signature)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO signatures (doc_id, signature) VALUES (?, ?)",
+                    (doc_id, signature.tobytes()),
+                )
+        return True
+
+    def remove(self, doc_id: str) -> None:
+        with self._lock:
+            self._remove(doc_id)
+            with self._conn:
+                self._conn.execute("DELETE FROM signatures WHERE doc_id = ?", (doc_id,))
+
+    def _insert(self, doc_id: str, signature) -> None:
+        self._signatures[doc_id] = signature
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(key, []).append(doc_id)
+
+    def _remove(self, doc_id: str) -> None:
+        signature = self._signatures.pop(doc_id, None)
+        if signature is None:
+            return
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            ids = bucket[key]
+            ids.remove(doc_id)
+            if not ids:
+                del bucket[key]
+
+    def _band_keys(self, signature) -> List[bytes]:
+        rows = self.rows
+        return [signature[i * rows:(i + 1) * rows].tobytes() for i in range(self.bands)]
+
+    # =========================
+    # LOOKUP
+    # =========================
+
+    def query(self, text: str, limit: int = 1) -> List[Tuple[str, float]]:
+        """
+        Indexed documents at or above the similarity threshold, most similar first.
+
+        Returns:
+            [(doc_id, estimated Jaccard similarity)]
+        """
+        signature = self.hasher.signature(text)
+        if signature is None:
+            return []
+        return self.query_signature(signature, limit)
+
+    def query_signature(self, signature, limit: int = 1) -> List[Tuple[str, float]]:
+        with self._lock:
+            candidates = set()
+            for bucket, key in zip(self._buckets, self._band_keys(signature)):
+                candidates.update(bucket.get(key, ()))
+
+            scored = []
+            for doc_id in candidates:
+                similarity = float((self._signatures[doc_id] == signature).mean())
+                if similarity >= self.threshold:
+                    scored.append((doc_id, similarity))
+
+        scored.sort(key=lambda match: match[1], reverse=True)
+        return scored[:limit]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# =========================
+# CONFIGURED INDEX
+# =========================
+
+_index: Optional[NearDuplicateIndex] = None
+_index_lock = threading.Lock()
+
+
+def build_index() -> NearDuplicateIndex:
+    """Index from the `cache.near_duplicates` config section."""
+    return NearDuplicateIndex(
+        settings.get("cache.near_duplicates.path", "data/cache/near_duplicates.sqlite"),
+        threshold=settings.get("cache.near_duplicates.threshold", 0.9),
+        num_perm=settings.get("cache.near_duplicates.num_perm", 128),
+        bands=settings.get("cache.near_duplicates.bands", 16),
+        shingle_size=settings.get("cache.near_duplicates.shingle_size", 5),
+    )
+
+
+def get_duplicate_index() -> Optional[NearDuplicateIndex]:
+    """
+    Shared index, or None when `cache.near_duplicates.enabled` is off.
+
+    Matches are reused from the results store, so the index is also off
+    when `output.save_interviews` is.
+    """
+    global _index
+
+    if not settings.get("cache.near_duplicates.enabled", False):
+        return None
+    if not settings.get("output.save_interviews", False):
+        return None
+
+    with _index_lock:
+        if _index is None:
+            _index = build_index()
+        return _index
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Find indexed resumes similar to a resume")
+    commands = parser.add_subparsers(dest="command", required=True)
+    query = commands.add_parser("query")
+    query.add_argument("resume", help="Resume file (PDF, DOCX or TXT)")
+    query.add_argument("--threshold", type=float, help="Default: cache.near_duplicates.threshold")
+    query.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    from src.parsers.resume_parser import ResumeParser
+
+    index = build_index()
+    if args.threshold is not None:
+        index.threshold = args.threshold
+
+    text = ResumeParser().extract_text(args.resume)
+    matches = index.query(text, limit=args.limit)
+    if not matches:
+        print(f"No indexed resume at or above similarity {index.threshold} ({len(index)} indexed)")
+        return 1
+
+    for doc_id, similarity in matches:
+        print(f"{similarity:.3f}  {doc_id}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
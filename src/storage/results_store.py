@@ -0,0 +1,331 @@
+"""
+Local results store: every run's candidate profile and questions in SQLite.
+
+Results are indexed by resume content hash, email and role so earlier
+results can be found without re-running the pipeline, and can be
+exported to JSONL or CSV without loading the whole history into memory.
+
+Usage:
+    python -m src.storage.results_store find --email jane@example.com
+    python -m src.storage.results_store export -o data/interviews/all.csv --format csv
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from config.settings import settings
+
+
+EXPORT_FORMATS = ("json", "csv")
+
+CSV_COLUMNS = [
+    "run_id", "saved_at", "status", "resume_name", "name", "email", "job_role",
+    "question_index", "question_type", "question", "evaluating",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interviews (
+    run_id          TEXT PRIMARY KEY,
+    resume_hash     TEXT,
+    resume_name     TEXT,
+    name            TEXT,
+    email           TEXT COLLATE NOCASE,
+    job_role        TEXT COLLATE NOCASE,
+    status          TEXT,
+    question_count  INTEGER,
+    created_at      TEXT,
+    saved_at        TEXT,
+    candidate_json  TEXT,
+    questions_json  TEXT,
+    llm_provider    TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_interviews_resume_hash ON interviews (resume_hash, saved_at);
+CREATE INDEX IF NOT EXISTS idx_interviews_email ON interviews (email, saved_at);
+CREATE INDEX IF NOT EXISTS idx_interviews_job_role ON interviews (job_role, saved_at);
+"""
+
+# Rows are read in batches of this size when iterating or exporting
+FETCH_SIZE = 500
+
+
+def file_hash(path: str) -> str:
+    """SHA-256 of a resume file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResultsStore:
+    """SQLite table of interview results (one row per run, upserted on change)."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = self._connect()
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(interviews)")}
+        if "llm_provider" not in columns:
+            self._conn.execute("ALTER TABLE interviews ADD COLUMN llm_provider TEXT")
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    # =========================
+    # WRITE
+    # =========================
+
+    def save(self, state: Dict, resume_hash: Optional[str] = None) -> None:
+        """Insert or update the row for ``state['run_id']``."""
+        candidate = dict(state.get("candidate_info") or {})
+        candidate.pop("raw_text", None)
+        questions = state.get("questions") or []
+        now = datetime.now(timezone.utc).isoformat()
+
+        row = {
+            "run_id": state["run_id"],
+            "resume_hash": resume_hash,
+            "resume_name": Path(state.get("resume_path") or "").name,
+            "name": candidate.get("name"),
+            "email": candidate.get("email"),
+            "job_role": candidate.get("job_role"),
+            "status": state.get("status"),
+            "question_count": len(questions),
+            "created_at": now,
+            "saved_at": now,
+            "candidate_json": json.dumps(candidate),
+            "questions_json": json.dumps(questions),
+            # Provider that generated the questions (the question bank only indexes real ones)
+            "llm_provider": state.get("llm_provider"),
+        }
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"""
+                INSERT INTO interviews ({', '.join(row)}) VALUES ({', '.join(':' + k for k in row)})
+                ON CONFLICT (run_id) DO UPDATE SET
+                    resume_hash = COALESCE(excluded.resume_hash, resume_hash),
+                    name = excluded.name,
+                    email = excluded.email,
+                    job_role = excluded.job_role,
+                    status = excluded.status,
+                    question_count = excluded.question_count,
+                    saved_at = excluded.saved_at,
+                    candidate_json = excluded.candidate_json,
+                    questions_json = excluded.questions_json,
+                    llm_provider = excluded.llm_provider
+                """,
+                row,
+            )
+
+    # =========================
+    # LOOKUP
+    # =========================
+
+    def get(self, run_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM interviews WHERE run_id = ?", (run_id,)).fetchone()
+        return self._to_result(row) if row else None
+
+    def latest_for_resume(self, resume_hash: str, status: str = "completed") -> Optional[Dict]:
+        """Most recent result for a resume with this content hash."""
+        results = self.find(resume_hash=resume_hash, status=status, limit=1)
+        return results[0] if results else None
+
+    def find(
+        self,
+        resume_hash: Optional[str] = None,
+        email: Optional[str] = None,
+        job_role: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict]:
+        """Newest matching results (email and role match case-insensitively)."""
+        where, params = self._filters(resume_hash=resume_hash, email=email, job_role=job_role, status=status)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM interviews {where} ORDER BY saved_at DESC, rowid DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [self._to_result(row) for row in rows]
+
+    def iter_results(self, **filters) -> Iterator[Dict]:
+        """
+        Every matching result, oldest first, read in batches.
+
+        Uses its own connection so a long export does not block writers.
+        """
+        where, params = self._filters(**filters)
+        conn = self._connect()
+        try:
+            cursor = conn.execute(f"SELECT * FROM interviews {where} ORDER BY saved_at, rowid", params)
+            while True:
+                rows = cursor.fetchmany(FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._to_result(row)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _filters(**filters) -> tuple:
+        columns = {"resume_hash": "resume_hash", "email": "email", "job_role": "job_role", "status": "status"}
+        clauses, params = [], []
+        for key, value in filters.items():
+            if value is not None:
+                clauses.append(f"{columns[key]} = ?")
+                params.append(value)
+        return ("WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @staticmethod
+    def _to_result(row: sqlite3.Row) -> Dict:
+        return {
+            "run_id": row["run_id"],
+            "resume_hash": row["resume_hash"],
+            "resume_name": row["resume_name"],
+            "status": row["status"],
+            "created_at": row["created_at"],
+            "saved_at": row["saved_at"],
+            "candidate_info": json.loads(row["candidate_json"] or "{}"),
+            "questions": json.loads(row["questions_json"] or "[]"),
+            "llm_provider": row["llm_provider"],
+        }
+
+    # =========================
+    # EXPORT
+    # =========================
+
+    def export(self, path: str, fmt: str = "json", **filters) -> int:
+        """
+        Stream matching results to a JSONL (json) or CSV file.
+
+        CSV has one row per question. Returns the number of results written.
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt} (available: {', '.join(EXPORT_FORMATS)})")
+
+        out_path = Path(path)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+
+        count = 0
+        with open(out_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS) if fmt == "csv" else None
+            if writer:
+                writer.writeheader()
+
+            for result in self.iter_results(**filters):
+                if writer:
+                    writer.writerows(self._csv_rows(result))
+                else:
+                    f.write(json.dumps(result) + "\n")
+                count += 1
+
+        return count
+
+    @staticmethod
+    def _csv_rows(result: Dict) -> Iterator[Dict]:
+        candidate = result["candidate_info"]
+        base = {
+            "run_id": result["run_id"],
+            "saved_at": result["saved_at"],
+            "status": result["status"],
+            "resume_name": result["resume_name"],
+            "name": candidate.get("name"),
+            "email": candidate.get("email"),
+            "job_role": candidate.get("job_role"),
+        }
+        for i, question in enumerate(result["questions"], 1):
+            yield {
+                **base,
+                "question_index": i,
+                "question_type": question.get("type"),
+                "question": question.get("question"),
+                "evaluating": question.get("evaluating"),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# =========================
+# CONFIGURED STORE
+# =========================
+
+_store: Optional[ResultsStore] = None
+_store_lock = threading.Lock()
+
+
+def get_results_store() -> Optional[ResultsStore]:
+    """Store under `output.output_dir`, or None when `output.save_interviews` is off."""
+    global _store
+
+    if not settings.get("output.save_interviews", False):
+        return None
+
+    with _store_lock:
+        if _store is None:
+            output_dir = settings.get("output.output_dir", "data/interviews")
+            _store = ResultsStore(str(Path(output_dir) / "results.sqlite"))
+        return _store
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Look up and export saved interview results")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name in ("find", "export"):
+        command = commands.add_parser(name)
+        command.add_argument("--resume", help="Resume file (matched by content hash)")
+        command.add_argument("--email")
+        command.add_argument("--role", help="Job role")
+        command.add_argument("--status")
+
+    commands.choices["find"].add_argument("--limit", type=int, default=20)
+    export = commands.choices["export"]
+    export.add_argument("-o", "--output", required=True)
+    export.add_argument("--format", choices=EXPORT_FORMATS, help="Default: output.format")
+    args = parser.parse_args(argv)
+
+    output_dir = settings.get("output.output_dir", "data/interviews")
+    store = ResultsStore(str(Path(output_dir) / "results.sqlite"))
+    filters = {
+        "resume_hash": file_hash(args.resume) if args.resume else None,
+        "email": args.email,
+        "job_role": args.role,
+        "status": args.status,
+    }
+
+    if args.command == "find":
+        for result in store.find(**filters, limit=args.limit):
+            candidate = result["candidate_info"]
+            print(
+                f"{result['saved_at']}  {result['run_id']}  {result['status']:<9} "
+                f"{candidate.get('name')!s:<30} {candidate.get('job_role')!s:<30} "
+                f"{len(result['questions'])} questions"
+            )
+        return 0
+
+    fmt = args.format or settings.get("output.format", "json")
+    count = store.export(args.output, fmt, **filters)
+    print(f"Exported {count} results to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+Two-tier caching utilities (in-memory LRU in front of an on-disk store).
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+def content_key(data: bytes, *parts: str) -> str:
+    """
+    Build a content-addressed cache key.
+
+    Args:
+        data: Raw content (e.g. resume file bytes)
+        parts: Version strings mixed into the key (parser, prompt, model)
+
+    Returns:
+        Hex digest identifying the content under the given versions
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    return hashlib.sha256("|".join((digest, *parts)).encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe in-memory LRU cache bounded by entry count.
+
+    Entries optionally expire ``ttl_seconds`` after they were stored.
+    Values are deep-copied in and out, so callers that annotate a cached
+    profile or question list cannot change what later hits receive.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                return None
+
+            value, expires_at = self._data[key]
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+
+        value = copy.deepcopy(value)
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """
+    JSON-file cache in a directory, bounded by total size on disk.
+
+    Entries are evicted least-recently-used first (by file mtime, which
+    is refreshed on every read) once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._total_bytes = sum(p.stat().st_size for p in self.cache_dir.glob("*.json"))
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        payload = json.dumps(value).encode("utf-8")
+        if len(payload) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+        with self._lock:
+            previous = path.stat().st_size if path.exists() else 0
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            self._total_bytes += len(payload) - previous
+            self._evict()
+
+    def _evict(self) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        entries = []
+        for p in self.cache_dir.glob("*.json"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+
+        entries.sort()
+        self._total_bytes = sum(size for _, size, _ in entries)
+
+        for _, size, p in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+                self._total_bytes -= size
+            except FileNotFoundError:
+                pass
+
+
+class TieredCache:
+    """
+    Memory LRU tier in front of an optional disk tier.
+
+    Tracks hits per tier, misses, and the time spent computing missed
+    entries so callers can estimate what the cache saves.
+    """
+
+    def __init__(self, memory: LRUCache, disk: Optional[DiskCache] = None):
+        self.memory = memory
+        self.disk = disk
+        self._lock = threading.Lock()
+        self.stats: Dict[str, float] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "miss_seconds": 0.0,
+        }
+
+    def get(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a key in each tier.
+
+        Returns:
+            (value, tier) where tier is "memory", "disk" or None on a miss
+        """
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("memory_hits")
+            return value, "memory"
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+                self._count("disk_hits")
+                return value, "disk"
+
+        self._count("misses")
+        return None, None
+
+    def set(self, key: str, value: Any, compute_seconds: float = 0.0) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+        with self._lock:
+            self.stats["miss_seconds"] += compute_seconds
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def summary(self) -> Dict[str, float]:
+        """Cumulative hit/miss counts with an estimate of time saved."""
+        with self._lock:
+            stats = dict(self.stats)
+
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        avg_miss = stats["miss_seconds"] / stats["misses"] if stats["misses"] else 0.0
+
+        return {
+            "hits": hits,
+            "memory_hits": stats["memory_hits"],
+            "disk_hits": stats["disk_hits"],
+            "misses": stats["misses"],
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "seconds_saved": round(hits * avg_miss, 3),
+        }
@@ -2,12 +2,22 @@
 Logging configuration and utilities.
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from typing import Dict, List, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from config.settings import settings
+from src.utils.tracing import current_run_id, current_stage
+
+
+LOG_FORMATS = ("text", "json")
 
 
 def setup_logger(
@@ -16,6 +26,9 @@ def setup_logger(
 ) -> logging.Logger:
     """
     Create a component-specific logger using config.yaml settings.
+
+    Handlers (and the log directory) are created on the first record the
+    logger emits, so importing a module that calls this does no I/O.
     """
     logger = logging.getLogger(name)
 
@@ -23,11 +36,55 @@ def setup_logger(
     if logger.handlers:
         return logger
 
+    # Let records through until the configured level is known
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(_DeferredHandler(logger, log_dir))
+
+    return logger
+
+
+class _DeferredHandler(logging.Handler):
+    """Placeholder that installs the real handlers when first used."""
+
+    def __init__(self, logger: logging.Logger, log_dir: str | None):
+        super().__init__()
+        self._logger = logger
+        self._log_dir = log_dir
+        self._lock_init = threading.Lock()
+        self._installed = False
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        with self._lock_init:
+            if not self._installed:
+                # Rebinding (not mutating) the list keeps the logging loop
+                # that is currently iterating over it intact
+                self._logger.handlers = _configure_logger(self._logger, self._log_dir)
+                self._installed = True
+
+        # Replay this record through the real handlers
+        if record.levelno >= self._logger.level:
+            for handler in self._logger.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+def _configure_logger(logger: logging.Logger, log_dir: str | None) -> List[logging.Handler]:
     # -------- Load logging config --------
     log_level = settings.get("logging.level", "INFO")
     log_file = settings.get("logging.log_file", "logs/app.log")
     max_bytes = settings.get("logging.max_bytes", 10 * 1024 * 1024)
     backup_count = settings.get("logging.backup_count", 5)
+    log_format = settings.get("logging.format", "text")
+    use_queue = settings.get("logging.queue", True)
+
+    if log_format not in LOG_FORMATS:
+        raise ValueError(
+            f"Unsupported log format: {log_format} (available: {', '.join(LOG_FORMATS)})"
+        )
 
     logger.setLevel(getattr(logging, log_level))
 
@@ -51,15 +108,135 @@ def setup_logger(
     # -------- Console handler --------
     console_handler = logging.StreamHandler(sys.stdout)
 
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if log_format == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
+    handlers = [file_handler, console_handler]
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    if not use_queue:
+        for handler in handlers:
+            handler.addFilter(_context_filter)
+        return handlers
 
-    return logger
+    # -------- Queue handler --------
+    # The calling thread only tags and enqueues the record; the listener
+    # thread formats it and does the file and console I/O
+    _router.add(logger.name, handlers)
+    queue_handler = _ContextQueueHandler(_log_queue())
+    queue_handler.addFilter(_context_filter)
+    return [queue_handler]
+
+
+# =========================
+# RUN CONTEXT
+# =========================
+
+class _ContextFilter(logging.Filter):
+    """Tag records with the run ID and stage of the code that logged them."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Runs in the thread that logged; the listener thread has no run context
+        if not hasattr(record, "run_id"):
+            record.run_id = current_run_id()
+            record.stage = current_stage()
+        return True
+
+
+_context_filter = _ContextFilter()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including the run ID and stage."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "run_id": getattr(record, "run_id", None),
+            "stage": getattr(record, "stage", None),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+# =========================
+# BACKGROUND LISTENER
+# =========================
+
+class _ContextQueueHandler(QueueHandler):
+    """Enqueue the record as-is; formatting happens on the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _Router(logging.Handler):
+    """Dispatch dequeued records to the handlers of the logger that made them."""
+
+    def __init__(self):
+        super().__init__()
+        self._routes: Dict[str, List[logging.Handler]] = {}
+
+    def add(self, name: str, handlers: List[logging.Handler]) -> None:
+        with self.lock:
+            self._routes[name] = handlers
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self._routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+_router = _Router()
+_queue: Optional[queue.SimpleQueue] = None
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _log_queue() -> queue.SimpleQueue:
+    """The shared log queue, starting its listener thread on first use."""
+    global _queue, _listener
+
+    with _listener_lock:
+        if _listener is None:
+            _queue = queue.SimpleQueue()
+            _listener = QueueListener(_queue, _router)
+            _listener.start()
+            atexit.register(stop_logging)
+        return _queue
+
+
+def stop_logging() -> None:
+    """
+    Write out queued records and stop the listener thread.
+
+    Loggers keep working afterwards, writing synchronously.
+    """
+    global _queue, _listener
+
+    with _listener_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        _listener, _queue = None, None
+
+        with _router.lock:
+            routes = dict(_router._routes)
+        for name, handlers in routes.items():
+            for handler in handlers:
+                handler.addFilter(_context_filter)
+            logging.getLogger(name).handlers = handlers
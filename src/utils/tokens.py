@@ -0,0 +1,61 @@
+"""
+Approximate token accounting for LLM prompts.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Sequence
+
+
+def estimate_tokens(text: str, chars_per_token: float = 4.0) -> int:
+    """Approximate token count (no tokenizer dependency)."""
+    return int(-(-len(text) // chars_per_token)) if text else 0
+
+
+def trim_to_tokens(text: str, max_tokens: int, chars_per_token: float = 4.0) -> str:
+    """Trim text to roughly max_tokens, cutting at a line break where possible."""
+    limit = int(max_tokens * chars_per_token)
+    if len(text) <= limit:
+        return text
+
+    cut = text.rfind("\n", 0, limit)
+    # Fall back to a hard cut when the last line break is far from the limit
+    return text[:cut if cut > limit // 2 else limit].rstrip()
+
+
+def log_prompt_tokens(
+    logger: logging.Logger,
+    call: str,
+    messages: Sequence[Any],
+    response: Optional[Any] = None,
+    chars_per_token: float = 4.0,
+) -> Dict[str, Any]:
+    """
+    Log the estimated prompt size of an LLM call, plus the provider's
+    reported input tokens when the response carries usage metadata.
+
+    Returns:
+        prompt_tokens / completion_tokens (reported when available,
+        otherwise estimated) and whether they were estimated
+    """
+    estimate = sum(
+        estimate_tokens(str(getattr(m, "content", m)), chars_per_token)
+        for m in messages
+    )
+
+    usage = getattr(response, "usage_metadata", None) or {}
+    actual = usage.get("input_tokens")
+
+    logger.info(
+        f"Prompt tokens [{call}]: ~{estimate} estimated"
+        + (f", {actual} reported" if actual is not None else "")
+    )
+
+    completion = usage.get("output_tokens")
+    if completion is None and response is not None:
+        completion = estimate_tokens(str(getattr(response, "content", "")), chars_per_token)
+
+    return {
+        "prompt_tokens": actual if actual is not None else estimate,
+        "completion_tokens": completion or 0,
+        "tokens_estimated": actual is None,
+    }
@@ -0,0 +1,363 @@
+"""
+Span-style tracing and in-process metrics for agent runs.
+
+A run is opened with ``start_run()``; every ``span()`` entered while it is
+active (in the same thread, an asyncio task or ``asyncio.to_thread``) is
+recorded in that run's trace, tagged with its run ID, and folded into the
+process-wide latency histograms and counters.
+"""
+
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config.settings import settings
+
+
+# Upper bounds (ms) of the latency histogram buckets
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000]
+
+# Numeric span attributes that are also summed into counters
+COUNTED_ATTRIBUTES = ("prompt_tokens", "completion_tokens", "retries", "timeouts", "hedged")
+
+
+class Span:
+    """One timed operation; attributes can be added while it is open."""
+
+    def __init__(self, name: str, run_id: Optional[str], parent: Optional[str], attributes: Dict):
+        self.name = name
+        self.run_id = run_id
+        self.parent = parent
+        self.attributes = dict(attributes)
+        self.status = "ok"
+        self.start = time.perf_counter()
+        self.duration_ms = 0.0
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "name": self.name,
+            "parent": self.parent,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            **self.attributes,
+        }
+
+
+class Trace:
+    """All spans recorded for one run."""
+
+    def __init__(self, run_id: Optional[str] = None):
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.status = "completed"
+        self.start = time.perf_counter()
+        self.duration_ms = 0.0
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def breakdown(self) -> Dict[str, Any]:
+        """Timing summary returned in the agent state."""
+        with self._lock:
+            spans = list(self.spans)
+
+        stages: Dict[str, float] = {}
+        for span in spans:
+            stages[span.name] = round(stages.get(span.name, 0.0) + span.duration_ms, 3)
+
+        total = self.duration_ms or (time.perf_counter() - self.start) * 1e3
+        return {
+            "run_id": self.run_id,
+            "total_ms": round(total, 3),
+            "stages": stages,
+            "spans": [span.to_dict() for span in spans],
+        }
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_run_id() -> Optional[str]:
+    trace = _current_trace.get()
+    return trace.run_id if trace else None
+
+
+def current_span() -> Optional[Span]:
+    """Innermost open span, if any."""
+    return _current_span.get()
+
+
+def current_stage() -> Optional[str]:
+    """Name of the innermost open span, if any."""
+    current = _current_span.get()
+    return current.name if current else None
+
+
+@contextmanager
+def start_run(run_id: Optional[str] = None) -> Iterator[Trace]:
+    """
+    Open a run: spans inside are collected into the yielded trace.
+
+    On exit the run is recorded in the metrics and exported.
+    """
+    trace = Trace(run_id)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    except BaseException:
+        trace.status = "failed"
+        raise
+    finally:
+        _reset(_current_trace, token)
+        trace.duration_ms = (time.perf_counter() - trace.start) * 1e3
+        metrics.observe("run_duration_ms", trace.duration_ms, status=trace.status)
+        metrics.increment("runs_total", status=trace.status)
+        export_run(trace)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Span]:
+    """Time a block as a span of the current run (if any)."""
+    trace = _current_trace.get()
+    parent = _current_span.get()
+    current = Span(name, trace.run_id if trace else None, parent.name if parent else None, attributes)
+    token = _current_span.set(current)
+
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.set(error=type(e).__name__)
+        raise
+    finally:
+        _reset(_current_span, token)
+        current.duration_ms = (time.perf_counter() - current.start) * 1e3
+        if trace is not None:
+            trace.add(current)
+        _record_span(current)
+
+
+def _reset(var: ContextVar, token) -> None:
+    try:
+        var.reset(token)
+    except ValueError:
+        # A generator holding the run was closed from another context
+        var.set(None)
+
+
+def record_span(name: str, duration_ms: float, status: str = "ok", **attributes) -> Span:
+    """
+    Record an already-timed operation as a span of the current run.
+
+    For work that cannot sit inside a ``with`` block, such as a stream
+    consumed across generator yields.
+    """
+    trace = _current_trace.get()
+    parent = _current_span.get()
+    recorded = Span(name, trace.run_id if trace else None, parent.name if parent else None, attributes)
+    recorded.duration_ms = duration_ms
+    recorded.status = status
+
+    if trace is not None:
+        trace.add(recorded)
+    _record_span(recorded)
+    return recorded
+
+
+def _record_span(span: Span) -> None:
+    metrics.observe("span_duration_ms", span.duration_ms, span=span.name)
+    metrics.increment("spans_total", span=span.name, status=span.status)
+
+    for key in COUNTED_ATTRIBUTES:
+        value = span.attributes.get(key)
+        if isinstance(value, (int, float)) and value:
+            metrics.increment(f"{key}_total", value, span=span.name)
+
+    cache = span.attributes.get("cache")
+    if cache:
+        metrics.increment("cache_lookups_total", span=span.name, outcome=str(cache))
+
+
+# =========================
+# METRICS
+# =========================
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class MetricsRegistry:
+    """Thread-safe counters and fixed-bucket histograms with labels."""
+
+    def __init__(self, buckets: List[float] = None):
+        self.buckets = list(buckets or LATENCY_BUCKETS_MS)
+        self._counters: Dict[LabelKey, float] = {}
+        self._histograms: Dict[LabelKey, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> LabelKey:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+                self._histograms[key] = hist
+
+            index = next((i for i, b in enumerate(self.buckets) if value <= b), len(self.buckets))
+            hist["counts"][index] += 1
+            hist["sum"] += value
+            hist["count"] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-friendly view: counters and histograms with p50/p95 estimates."""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {k: {**v, "counts": list(v["counts"])} for k, v in self._histograms.items()}
+
+        return {
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(counters.items())
+            ],
+            "histograms": [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": hist["count"],
+                    "sum": round(hist["sum"], 3),
+                    "p50": self._quantile(hist, 0.5),
+                    "p95": self._quantile(hist, 0.95),
+                    "buckets": dict(zip([*map(str, self.buckets), "+Inf"], hist["counts"])),
+                }
+                for (name, labels), hist in sorted(histograms.items())
+            ],
+        }
+
+    def _quantile(self, hist: Dict[str, Any], q: float) -> Optional[float]:
+        """Bucket upper bound containing the q-quantile."""
+        if not hist["count"]:
+            return None
+
+        target, seen = q * hist["count"], 0
+        for bound, count in zip(self.buckets, hist["counts"]):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format."""
+        def fmt(labels, extra=()):
+            pairs = [*labels, *extra]
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}" if pairs else ""
+
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+
+        lines = []
+        for (name, labels), value in counters:
+            lines.append(f"{name}{fmt(labels)} {value}")
+
+        for (name, labels), hist in histograms:
+            cumulative = 0
+            for bound, count in zip([*map(str, self.buckets), "+Inf"], hist["counts"]):
+                cumulative += count
+                lines.append(f"{name}_bucket{fmt(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{name}_sum{fmt(labels)} {round(hist['sum'], 3)}")
+            lines.append(f"{name}_count{fmt(labels)} {hist['count']}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+# =========================
+# EXPORTERS
+# =========================
+
+_export_lock = threading.Lock()
+
+
+def export_run(trace: Trace) -> None:
+    """Append the run's spans and rewrite the metrics snapshot, if configured."""
+    spans_file = settings.get("tracing.spans_file")
+    metrics_file = settings.get("tracing.metrics_file")
+    if not spans_file and not metrics_file:
+        return
+
+    with _export_lock:
+        if spans_file:
+            path = Path(spans_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                for s in trace.breakdown()["spans"]:
+                    f.write(json.dumps(s) + "\n")
+
+        if metrics_file:
+            path = Path(metrics_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(metrics.snapshot(), indent=2), encoding="utf-8")
+            tmp_path.replace(path)
+
+
+_server = None
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1"):
+    """Serve /metrics (Prometheus text) and /metrics.json from a daemon thread."""
+    global _server
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = metrics.to_prometheus(), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body, content_type = json.dumps(metrics.snapshot()), "application/json"
+            else:
+                self.send_error(404)
+                return
+
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    with _export_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+        return _server
@@ -0,0 +1,63 @@
+"""
+Shared fixtures: every test runs offline on the fake LLM provider, with
+the persistent stores off and the config restored afterwards.
+"""
+
+import copy
+from pathlib import Path
+
+import pytest
+
+from config.settings import settings
+
+
+RESUME_DIR = Path(__file__).resolve().parent.parent / "test"
+
+SAMPLE_RESUME = """Jane Doe
+jane.doe@example.com | +1 415 555 0134 | linkedin.com/in/janedoe | github.com/janedoe
+
+SUMMARY
+Backend software engineer with 6 years of experience building Python services.
+
+EXPERIENCE
+Senior Software Engineer, Acme Corp    Jan 2020 - Present
+- Built REST APIs in Python and FastAPI backed by PostgreSQL
+- Moved deployments to Docker and Kubernetes on AWS
+
+Software Engineer, Initech    Jun 2018 - Dec 2019
+- Maintained Django services and Redis caches
+
+SKILLS
+Python, Django, FastAPI, PostgreSQL, Docker, Kubernetes, AWS, Git
+
+EDUCATION
+B.S. Computer Science, State University, 2018
+"""
+
+
+@pytest.fixture(autouse=True)
+def offline_settings(monkeypatch):
+    from benchmarks.stages import use_offline_llm
+    from src.generators import question_bank
+    from src.storage import duplicate_index, results_store
+
+    saved = copy.deepcopy(settings.config)
+    use_offline_llm()
+    # Shared stores are rebuilt from the test's settings on first use
+    monkeypatch.setattr(results_store, "_store", None)
+    monkeypatch.setattr(duplicate_index, "_index", None)
+    monkeypatch.setattr(question_bank, "_bank", None)
+
+    yield settings
+
+    settings._config = saved
+
+
+@pytest.fixture
+def resume_dir() -> Path:
+    return RESUME_DIR
+
+
+@pytest.fixture
+def sample_resume() -> bytes:
+    return SAMPLE_RESUME.encode("utf-8")
@@ -0,0 +1,47 @@
+import asyncio
+
+from src.agent.interview_agent import InterviewAgent
+from src.parsers.resume_parser import NoExtractableTextError, ResumeParser
+
+
+def test_aparse_matches_parse(sample_resume):
+    parser = ResumeParser()
+
+    expected = parser.parse(sample_resume, "resume.txt")
+    result = asyncio.run(parser.aparse(sample_resume, "resume.txt"))
+
+    # ``limits`` records the parse time, which differs between runs
+    result.pop("limits")
+    expected.pop("limits")
+    assert result == expected
+    assert result["email"] == "jane.doe@example.com"
+
+
+def test_concurrent_aruns_complete(sample_resume):
+    agent = InterviewAgent()
+
+    async def main():
+        return await asyncio.gather(
+            *(agent.arun(sample_resume, name=f"resume-{i}.txt") for i in range(3))
+        )
+
+    results = asyncio.run(main())
+
+    assert [r["status"] for r in results] == ["completed"] * 3
+    assert all(r["questions"] for r in results)
+    assert len({r["run_id"] for r in results}) == 3
+
+
+def test_image_only_pdf_fails_without_questions(resume_dir):
+    agent = InterviewAgent()
+    resume = str(resume_dir / "hospitality-resume-example.pdf")
+
+    result = asyncio.run(agent.arun(resume))
+
+    assert result["status"] == "failed"
+    assert "No extractable text" in result["error"]
+    assert result["questions"] == []
+
+
+def test_no_extractable_text_is_a_value_error():
+    assert issubclass(NoExtractableTextError, ValueError)
@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+import batch
+
+
+class StubClient:
+    """Job service client that completes every job at once."""
+
+    def __init__(self, workers=2):
+        self.workers = workers
+        self.submitted = []
+
+    def health(self):
+        return {"status": "ok", "workers": self.workers}
+
+    def submit_with_backoff(self, submit):
+        return submit()
+
+    def submit_path(self, resume_path, job_id=None):
+        self.submitted.append((resume_path, job_id))
+        return {"job_id": job_id}
+
+    def wait(self, job_id):
+        return {
+            "job_id": job_id,
+            "status": "completed",
+            "candidate_info": {"name": "Jane Doe", "raw_text": "..."},
+            "questions": [{"type": "technical", "question": "Why?"}],
+        }
+
+
+def test_discover_resumes_keeps_supported_formats(tmp_path):
+    (tmp_path / "nested").mkdir()
+    for name in ("a.pdf", "nested/b.txt", "notes.md"):
+        (tmp_path / name).write_text("x")
+
+    found = batch.discover_resumes(str(tmp_path))
+
+    assert [p.name for p in found] == ["a.pdf", "b.txt"]
+
+
+def test_load_completed_skips_partial_lines_and_failures(tmp_path):
+    output = tmp_path / "results.jsonl"
+    output.write_text(
+        json.dumps({"resume_path": "/a.pdf", "status": "completed"}) + "\n"
+        + json.dumps({"resume_path": "/b.pdf", "status": "failed"}) + "\n"
+        + '{"resume_path": "/c.p'
+    )
+
+    assert batch.load_completed(output, retry_failed=False) == {"/a.pdf", "/b.pdf"}
+    assert batch.load_completed(output, retry_failed=True) == {"/a.pdf"}
+
+
+def test_batch_run_id_is_stable_per_output_and_resume(tmp_path):
+    resume = tmp_path / "a.pdf"
+    first = batch.batch_run_id(tmp_path / "out.jsonl", resume)
+
+    assert first == batch.batch_run_id(tmp_path / "out.jsonl", resume)
+    assert first != batch.batch_run_id(tmp_path / "other.jsonl", resume)
+    assert first.startswith("batch-")
+
+
+def test_the_service_worker_pool_caps_the_concurrency(capsys):
+    assert batch.effective_workers(StubClient(workers=8), 4) == 4
+    assert capsys.readouterr().out == ""
+
+    assert batch.effective_workers(StubClient(workers=2), 4) == 2
+    assert "runs 2 jobs at once" in capsys.readouterr().out
+
+
+def test_run_batch_appends_after_a_truncated_line(tmp_path):
+    output = tmp_path / "results.jsonl"
+    output.write_text('{"resume_path": "/old.p')
+    resumes = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+    client = StubClient()
+
+    records = asyncio.run(batch.run_batch(client, resumes, output, workers=2))
+
+    assert sorted(r["status"] for r in records) == ["completed", "completed"]
+    assert "raw_text" not in records[0]["candidate_info"]
+    assert {job_id for _, job_id in client.submitted} == {
+        batch.batch_run_id(output, p) for p in resumes
+    }
+
+    lines = output.read_text().splitlines()
+    assert len(lines) == 3
+    assert batch.load_completed(output, retry_failed=False) == {str(p) for p in resumes}
@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+
+from benchmarks.stages import DEFAULT_BASELINE, compare, machine_scale, run_stages, time_stage
+
+
+def stage(min_ms, calibration_ms=10.0):
+    return {"min_ms": min_ms, "calibration_ms": calibration_ms}
+
+
+def test_offline_runs_disable_reuse_and_persistence(offline_settings):
+    assert offline_settings.get("llm.provider") == "fake"
+    assert offline_settings.get("cache.parse.enabled") is False
+    assert offline_settings.get("cache.questions.enabled") is False
+    assert offline_settings.get("cache.near_duplicates.enabled") is False
+    assert offline_settings.get("output.save_interviews") is False
+    assert offline_settings.get("checkpoint.enabled") is False
+    assert offline_settings.get("question_bank.include_generated") is False
+
+
+def test_time_stage_reports_order_statistics():
+    stats = time_stage(lambda: None, repeat=5)
+
+    assert stats["repeat"] == 5
+    assert 0 <= stats["min_ms"] <= stats["median_ms"] <= stats["p95_ms"]
+
+
+def test_machine_scale_uses_the_calibration_ratio():
+    assert machine_scale(stage(1, 20.0), stage(1, 10.0)) == 2.0
+    assert machine_scale({"min_ms": 1}, stage(1)) == 1.0
+
+
+def test_compare_needs_both_relative_and_absolute_slowdown():
+    baseline = {"stages": {"fast": stage(1.0), "slow": stage(100.0), "scaled": stage(100.0, 5.0)}}
+    current = {"stages": {
+        # +100% but only 1 ms slower
+        "fast": stage(2.0),
+        # +50% and 50 ms slower
+        "slow": stage(150.0),
+        # As slow as the calibration says this machine is
+        "scaled": stage(190.0),
+        "new_stage": stage(5.0),
+    }}
+
+    regressions = compare(current, baseline, threshold=0.25, min_delta_ms=2.0)
+
+    assert regressions == ["slow: 100.000 ms -> 150.000 ms (+50%)"]
+
+
+def test_baseline_covers_every_stage(resume_dir):
+    baseline = json.loads(Path(DEFAULT_BASELINE).read_text(encoding="utf-8"))
+
+    current = run_stages(resume_dir, repeat=1, agent_repeat=1)
+
+    assert set(current["stages"]) == set(baseline["stages"])
+    assert current["meta"]["resumes"] == baseline["meta"]["resumes"]
@@ -0,0 +1,85 @@
+import time
+
+from src.parsers.resume_parser import ResumeParser
+from src.utils.cache import DiskCache, LRUCache, TieredCache, content_key
+
+
+def test_content_key_depends_on_content_and_versions():
+    key = content_key(b"resume", "parser=1")
+
+    assert key == content_key(b"resume", "parser=1")
+    assert key != content_key(b"resume", "parser=2")
+    assert key != content_key(b"other", "parser=1")
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_lru_entries_expire():
+    cache = LRUCache(max_entries=2, ttl_seconds=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_values_are_copied_in_and_out():
+    cache = LRUCache(max_entries=2)
+    value = {"skills": ["Python"]}
+    cache.set("a", value)
+    value["skills"].append("changed before get")
+
+    hit = cache.get("a")
+    hit["skills"].append("changed after get")
+
+    assert cache.get("a") == {"skills": ["Python"]}
+
+
+def test_disk_cache_evicts_down_to_max_bytes(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=250)
+    for key in ("a", "b", "c"):
+        cache.set(key, {"text": key * 100})
+        time.sleep(0.01)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == {"text": "c" * 100}
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.json")) <= 250
+
+
+def test_tiered_cache_promotes_disk_hits_and_counts(tmp_path):
+    disk = DiskCache(str(tmp_path), max_bytes=1 << 20)
+    disk.set("k", {"name": "Jane"})
+    cache = TieredCache(LRUCache(4), disk)
+
+    assert cache.get("k") == ({"name": "Jane"}, "disk")
+    assert cache.get("k") == ({"name": "Jane"}, "memory")
+    assert cache.get("missing") == (None, None)
+
+    summary = cache.summary()
+    assert (summary["disk_hits"], summary["memory_hits"], summary["misses"]) == (1, 1, 1)
+
+
+def test_parse_cache_serves_repeated_uploads(offline_settings, tmp_path, sample_resume):
+    offline_settings.config["cache"]["parse"] = {
+        "enabled": True, "memory_entries": 8, "dir": str(tmp_path), "max_disk_mb": 1,
+    }
+    parser = ResumeParser()
+
+    first, first_hit = parser.parse_cached(sample_resume, "resume.txt")
+    first["skills"].append("annotation added by a caller")
+    second, second_hit = parser.parse_cached(sample_resume, "resume.txt")
+
+    assert (first_hit, second_hit) == (False, True)
+    assert "annotation added by a caller" not in second["skills"]
+    # A new parser (e.g. after a restart) is served from the disk tier
+    assert ResumeParser().parse_cached(sample_resume, "resume.txt")[1] is True
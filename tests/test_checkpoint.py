@@ -0,0 +1,114 @@
+import pytest
+
+from src.agent.checkpoint import build_checkpointer
+from src.agent.interview_agent import InterviewAgent
+
+
+class Crash(BaseException):
+    """Stands in for the process dying mid-run (not caught by the nodes)."""
+
+
+@pytest.fixture
+def agent(offline_settings):
+    offline_settings.config["checkpoint"] = {"enabled": True, "backend": "memory"}
+    return InterviewAgent()
+
+
+@pytest.fixture
+def completed(agent, sample_resume):
+    return agent.run(sample_resume, run_id="run-1", name="resume.txt")
+
+
+def test_unknown_backend_is_rejected(offline_settings):
+    offline_settings.config["checkpoint"] = {"enabled": True, "backend": "redis"}
+
+    with pytest.raises(ValueError, match="Unsupported checkpoint backend: redis"):
+        build_checkpointer()
+
+
+def test_interrupted_run_resumes_without_parsing_again(agent, sample_resume, monkeypatch):
+    generator = agent.question_generator
+    generate = generator.generate_questions_cached
+
+    def crash(*args, **kwargs):
+        raise Crash()
+
+    monkeypatch.setattr(generator, "generate_questions_cached", crash)
+    with pytest.raises(Crash):
+        agent.run(sample_resume, run_id="run-2", name="resume.txt")
+    monkeypatch.setattr(generator, "generate_questions_cached", generate)
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("resume parsed again")
+
+    monkeypatch.setattr(agent.resume_parser, "parse_cached", no_parse)
+    result = agent.run(sample_resume, run_id="run-2", name="resume.txt")
+
+    assert result["status"] == "completed"
+    assert result["candidate_info"]["email"] == "jane.doe@example.com"
+    assert len(result["questions"]) == 15
+
+
+def test_a_new_agent_streams_on_from_a_sqlite_checkpoint(offline_settings, tmp_path, sample_resume, monkeypatch):
+    offline_settings.config["checkpoint"] = {
+        "enabled": True,
+        "backend": "sqlite",
+        "path": str(tmp_path / "agent.sqlite"),
+    }
+    crashed = InterviewAgent()
+
+    def crash(*args, **kwargs):
+        raise Crash()
+
+    monkeypatch.setattr(crashed.question_generator, "generate_questions_cached", crash)
+    with pytest.raises(Crash):
+        crashed.run(sample_resume, run_id="run-3", name="resume.txt")
+
+    # A restarted process: nothing is shared with the crashed agent but the database
+    resumed = InterviewAgent()
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("resume parsed again")
+
+    monkeypatch.setattr(resumed.resume_parser, "parse_cached", no_parse)
+    events = list(resumed.stream(sample_resume, run_id="run-3", name="resume.txt"))
+
+    final = events[-1][1]
+    assert final["status"] == "completed"
+    assert final["candidate_info"]["email"] == "jane.doe@example.com"
+    assert len([e for e, _ in events if e == "question"]) == 15
+
+
+def test_regenerate_one_question(agent, completed):
+    before = completed["questions"]
+
+    after = agent.regenerate("run-1", index=2)["questions"]
+
+    assert len(after) == len(before)
+    assert after[:2] == before[:2] and after[3:] == before[3:]
+    assert after[2]["type"] == before[2]["type"]
+
+
+def test_regenerate_one_type_keeps_its_place(agent, completed):
+    types = [q["type"] for q in completed["questions"]]
+
+    result = agent.regenerate("run-1", question_type="behavioral", num_questions=2)
+
+    expected = [t for t in types if t != "behavioral"]
+    first = types.index("behavioral")
+    expected[first:first] = ["behavioral", "behavioral"]
+    assert [q["type"] for q in result["questions"]] == expected
+    # The regenerated set is checkpointed
+    state = agent.graph.get_state(agent._thread_config("run-1")).values
+    assert state["questions"] == result["questions"]
+
+
+def test_regenerate_errors(agent, completed, offline_settings):
+    with pytest.raises(KeyError, match="No parsed profile"):
+        agent.regenerate("never-ran")
+    with pytest.raises(IndexError, match="out of range"):
+        agent.regenerate("run-1", index=99)
+
+    offline_settings.config["checkpoint"] = {"enabled": False}
+    with pytest.raises(RuntimeError, match="needs checkpointing"):
+        InterviewAgent().regenerate("run-1")
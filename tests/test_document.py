@@ -0,0 +1,89 @@
+import io
+import zipfile
+
+import pytest
+
+from src.parsers.document import ResumeDocument, detect_format, load_document
+from src.parsers.governor import ResumeTooLargeError
+from src.parsers.resume_parser import ResumeParser
+
+
+@pytest.fixture
+def docx_bytes(tmp_path):
+    import docx
+
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    document.add_paragraph("jane.doe@example.com")
+    path = tmp_path / "resume.docx"
+    document.save(path)
+    return path.read_bytes()
+
+
+def zip_bytes(member):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(member, "x")
+    return buffer.getvalue()
+
+
+def test_format_comes_from_the_content_not_the_name(resume_dir, docx_bytes):
+    pdf = (resume_dir / "Uday CSA Resume.pdf").read_bytes()
+
+    assert detect_format(pdf, "resume.txt") == "pdf"
+    assert detect_format(docx_bytes, "resume.pdf") == "docx"
+    assert detect_format("Résumé — Jane".encode("utf-8"), "resume.docx") == "txt"
+
+
+@pytest.mark.parametrize("data, message", [
+    (zip_bytes("notes.txt"), "ZIP archive but not a DOCX"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 8, "legacy Word"),
+    (b"\x89PNG\r\n\x1a\n\x00\x00", "not a PDF, DOCX or UTF-8 text"),
+])
+def test_unsupported_content_is_rejected(data, message):
+    with pytest.raises(ValueError, match=message):
+        detect_format(data, "upload.bin")
+
+
+def test_a_multibyte_character_cut_by_the_sniff_window_is_still_text():
+    data = b"a" * 4095 + "é".encode("utf-8")
+
+    assert detect_format(data) == "txt"
+
+
+def test_paths_bytes_and_file_objects_load_the_same(tmp_path, sample_resume):
+    path = tmp_path / "resume.txt"
+    path.write_bytes(sample_resume)
+
+    from_path = load_document(path)
+    from_bytes = load_document(bytearray(sample_resume), name="resume.txt")
+    with open(path, "rb") as f:
+        from_file = load_document(f)
+
+    assert from_path.data == from_bytes.data == from_file.data
+    assert from_file.name == str(path)
+    assert from_path.sha256 == from_bytes.sha256
+    assert load_document(from_path) is from_path
+
+
+def test_size_limit_applies_before_reading(tmp_path):
+    path = tmp_path / "big.txt"
+    path.write_bytes(b"x" * 100)
+
+    with pytest.raises(ResumeTooLargeError, match="too large"):
+        load_document(path, max_bytes=50)
+    with pytest.raises(ResumeTooLargeError):
+        load_document(io.BytesIO(b"x" * 100), max_bytes=50)
+    with pytest.raises(FileNotFoundError):
+        load_document(tmp_path / "missing.pdf")
+
+
+def test_parser_accepts_every_source_type(docx_bytes, resume_dir):
+    parser = ResumeParser()
+
+    from_docx = parser.parse(io.BytesIO(docx_bytes), "upload")
+    from_pdf = parser.parse((resume_dir / "Uday CSA Resume.pdf").read_bytes())
+
+    assert from_docx["email"] == "jane.doe@example.com"
+    assert from_pdf["raw_text"] == parser.parse(str(resume_dir / "Uday CSA Resume.pdf"))["raw_text"]
+    assert isinstance(load_document(docx_bytes), ResumeDocument)
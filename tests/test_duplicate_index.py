@@ -0,0 +1,120 @@
+import pytest
+
+from src.agent.interview_agent import InterviewAgent
+from src.storage.duplicate_index import NearDuplicateIndex, shingles
+
+
+OTHER_RESUME = """John Smith
+john.smith@example.org
+
+SUMMARY
+Registered nurse with ten years of intensive care experience in regional hospitals.
+
+EXPERIENCE
+Charge Nurse, City Hospital    Mar 2015 - Present
+- Led a team of twelve nurses across night shifts in the cardiac unit
+- Trained new staff on patient monitoring and medication safety
+
+SKILLS
+Patient care, Triage, Electronic health records, Team leadership
+
+EDUCATION
+B.S. Nursing, Coastal College, 2013
+"""
+
+
+@pytest.fixture
+def jane(sample_resume):
+    return sample_resume.decode("utf-8")
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = NearDuplicateIndex(str(tmp_path / "index.sqlite"))
+    yield index
+    index.close()
+
+
+def test_shingles_ignore_contacts_and_numbers():
+    text = "Jane Doe jane@example.com https://github.com/jane 415 555 0134 Python in 2020"
+
+    assert shingles(text, size=2) == {"jane doe", "doe python", "python in"}
+    assert shingles("Python", size=5) == {"python"}
+    assert shingles("2020 - 2024") == set()
+
+
+def test_edited_resume_matches_and_a_different_one_does_not(index, jane):
+    index.add("jane", jane)
+    index.add("john", OTHER_RESUME)
+
+    new_contacts = jane.replace("+1 415 555 0134", "+1 650 555 0199").replace("jane.doe@", "jdoe@")
+    assert index.query(new_contacts) == [("jane", 1.0)]
+
+    [(doc_id, similarity)] = index.query(jane + "Certified Kubernetes Administrator\n")
+    assert doc_id == "jane" and 0.9 <= similarity < 1.0
+
+    rewritten = jane.replace("Built REST APIs in Python and FastAPI", "Designed GraphQL gateways in Go")
+    assert index.query(rewritten) == []
+    assert index.query("") == []
+
+
+def test_threshold_decides_what_counts_as_a_match(tmp_path, jane):
+    loose = NearDuplicateIndex(str(tmp_path / "loose.sqlite"), threshold=0.5, bands=32)
+    loose.add("jane", jane)
+    rewritten = jane.replace("Built REST APIs in Python and FastAPI", "Designed GraphQL gateways in Go")
+
+    [(doc_id, similarity)] = loose.query(rewritten)
+
+    assert doc_id == "jane" and 0.5 <= similarity < 0.9
+    loose.close()
+
+
+def test_add_replaces_and_remove_forgets(index, jane):
+    assert not index.add("empty", "2020 - 2024")
+    index.add("doc", OTHER_RESUME)
+    index.add("doc", jane)
+
+    assert len(index) == 1
+    assert index.query(OTHER_RESUME) == []
+
+    index.remove("doc")
+    index.remove("never-added")
+    assert index.query(jane) == []
+
+
+def test_signatures_survive_a_reopen_with_the_same_settings(tmp_path, jane):
+    path = str(tmp_path / "index.sqlite")
+    first = NearDuplicateIndex(path)
+    first.add("jane", jane)
+    first.close()
+
+    same = NearDuplicateIndex(path)
+    assert same.query(jane) == [("jane", 1.0)]
+    same.close()
+
+    # Signatures from another shingle size are not comparable and are dropped
+    changed = NearDuplicateIndex(path, shingle_size=3)
+    assert len(changed) == 0
+    changed.close()
+
+
+def test_bands_must_divide_the_signature():
+    with pytest.raises(ValueError, match="multiple of bands"):
+        NearDuplicateIndex(":memory:", num_perm=128, bands=10)
+
+
+def test_agent_reuses_a_near_duplicate_run(offline_settings, tmp_path, jane):
+    offline_settings.config["output"] = {"save_interviews": True, "output_dir": str(tmp_path)}
+    offline_settings.config["cache"]["near_duplicates"] = {
+        "enabled": True, "path": str(tmp_path / "near_duplicates.sqlite"),
+    }
+    agent = InterviewAgent()
+    first = agent.run(jane.encode("utf-8"), run_id="first", name="resume.txt")
+
+    edited = jane.replace("+1 415 555 0134", "+1 650 555 0199")
+    second = agent.run(edited.encode("utf-8"), run_id="second", name="resume.txt")
+
+    assert second["status"] == "completed"
+    assert second["questions"] == first["questions"]
+    assert second["candidate_info"]["near_duplicate"] == {"run_id": "first", "similarity": 1.0}
+    assert second["candidate_info"]["phone"] != first["candidate_info"]["phone"]
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from src.generators.question_generator import QuestionGenerator
+
+
+PROFILE = {"job_role": "Backend Engineer", "skills": ["Python", "Docker"], "experience": "6 years 0 months"}
+TYPES = ["technical", "behavioral", "situational", "experience_based"]
+
+
+@pytest.fixture
+def per_type(offline_settings):
+    offline_settings.config["interview"]["generation_mode"] = "per_type"
+    offline_settings.config["interview"]["question_types"] = TYPES
+    return offline_settings
+
+
+def types_of(questions):
+    return [q["type"] for q in questions]
+
+
+def test_counts_are_spread_over_the_types(per_type):
+    generator = QuestionGenerator()
+
+    assert generator._type_counts(15) == list(zip(TYPES, [4, 4, 4, 3]))
+    assert generator._type_counts(3) == list(zip(TYPES[:3], [1, 1, 1]))
+
+
+def test_per_type_results_are_merged_in_type_order(per_type):
+    questions = QuestionGenerator().generate_questions(PROFILE, PROFILE["job_role"], 10)
+
+    assert types_of(questions) == ["technical"] * 3 + ["behavioral"] * 3 + ["situational"] * 2 + ["experience_based"] * 2
+    assert not any(q.get("source") for q in questions)
+
+
+def test_streamed_and_async_sets_match_the_sync_set(per_type):
+    # With latency the parts overlap; the order yielded must not depend on which ends first
+    per_type.config["llm"]["fake"]["latency_seconds"] = 0.02
+    generator = QuestionGenerator()
+
+    async def astream():
+        return [q async for q in generator.astream_questions(PROFILE, PROFILE["job_role"], 10)]
+
+    expected = generator.generate_questions(PROFILE, PROFILE["job_role"], 10)
+    assert list(generator.stream_questions(PROFILE, PROFILE["job_role"], 10)) == expected
+    assert asyncio.run(astream()) == expected
+    assert asyncio.run(generator.agenerate_questions(PROFILE, PROFILE["job_role"], 10)) == expected
+
+
+def test_a_failed_type_is_filled_from_the_fallback(per_type):
+    per_type.config["llm"]["fake"]["responses"] = [
+        {"match": "Question Types to Generate:\nbehavioral", "response": "Sorry, I cannot help."}
+    ]
+    per_type.config["interview"]["top_up"]["max_rounds"] = 0
+
+    questions = QuestionGenerator().generate_questions(PROFILE, PROFILE["job_role"], 8)
+
+    assert types_of(questions)[:2] == ["technical"] * 2
+    behavioral = [q for q in questions if q["type"] == "behavioral"]
+    assert behavioral and all(q.get("source") for q in behavioral)
+    assert not any(q.get("source") for q in questions if q["type"] != "behavioral")
+
+
+def test_unknown_generation_mode_is_rejected(offline_settings):
+    offline_settings.config["interview"]["generation_mode"] = "parallel"
+
+    with pytest.raises(ValueError, match="Unsupported generation mode: parallel"):
+        QuestionGenerator()
@@ -0,0 +1,45 @@
+from benchmarks.field_scanner import legacy_fields, load_texts
+from src.parsers.field_scanner import format_experience, scan_fields
+
+
+def test_scans_contact_details_and_links():
+    fields = scan_fields(
+        "Jane Doe\n"
+        "Contact: jane.doe+jobs@mail.example.com, (415) 555-0134\n"
+        "www.linkedin.com/in/jane-doe https://github.com/janedoe https://janedoe.dev\n"
+    )
+
+    assert fields["name"] == "Jane Doe"
+    assert fields["email"] == "jane.doe+jobs@mail.example.com"
+    assert fields["phone"] == "(415) 555-0134"
+    assert fields["linkedin_url"] == "https://linkedin.com/in/jane-doe"
+    assert fields["github_url"] == "https://github.com/janedoe"
+    assert fields["portfolio_url"] == "https://janedoe.dev"
+
+
+def test_experience_takes_the_smaller_estimate():
+    text = "Over 10 years of experience\nAcme  Jan 2020 - Mar 2022\nInitech  Jun 2018 - Dec 2019\n"
+
+    assert scan_fields(text)["experience"] == "3 years 8 months"
+    assert format_experience(0, 0) == "0 years 0 months"
+    assert format_experience(0, 30) == "2 years 6 months"
+
+
+def test_education_lines_are_reported_once():
+    fields = scan_fields("B.Tech, XYZ University\nMBA\nSkills: Python\n")
+
+    assert fields["education"] == ["B.Tech, XYZ University", "MBA"]
+
+
+def test_glued_phone_and_experience_mention_are_both_found():
+    fields = scan_fields("Phone 9876543210 5 years of experience")
+
+    assert fields["phone"] == "9876543210"
+    assert fields["experience"] == "5 years 0 months"
+
+
+def test_matches_the_per_field_regexes(resume_dir, sample_resume):
+    texts = [sample_resume.decode("utf-8"), *load_texts(resume_dir).values()]
+
+    for text in texts:
+        assert scan_fields(text) == legacy_fields(text)
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+
+from src.parsers.document import load_document
+from src.parsers.governor import ParseGovernor, ResumeTooLargeError
+from src.parsers.resume_parser import ResumeParser
+
+
+def limits(offline_settings, **resume_limits):
+    offline_settings.config["resume"]["limits"] = {
+        "max_pages": None, "max_chars": None, "time_budget_seconds": None, **resume_limits,
+    }
+
+
+def test_text_is_cut_at_a_nearby_boundary():
+    budget = ParseGovernor(max_chars=12).start(0)
+
+    assert budget.cap_text("Python SQL Docker AWS") == "Python SQL"
+    assert budget.report()["truncated"] == ["chars"]
+    assert budget.report()["chars"] == 10
+
+
+def test_text_without_a_nearby_boundary_is_cut_hard():
+    budget = ParseGovernor(max_chars=300).start(0)
+
+    assert budget.cap_text("a " + "x" * 400) == "a " + "x" * 298
+
+
+def test_text_within_the_cap_is_untouched():
+    budget = ParseGovernor(max_chars=100).start(0)
+
+    assert budget.cap_text("short") == "short"
+    assert budget.truncated == []
+
+
+def test_time_budget_runs_out():
+    budget = ParseGovernor(time_budget_seconds=0.01).start(0)
+    assert not budget.expired()
+
+    time.sleep(0.02)
+
+    assert budget.expired()
+    assert budget.remaining() == 0.0
+    assert ParseGovernor().start(0).remaining() is None
+
+
+def test_unsupported_format_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported file format: docx"):
+        ParseGovernor(supported_formats=["PDF", "txt"]).check_format("docx")
+
+
+def test_parse_truncates_long_text(offline_settings, sample_resume):
+    limits(offline_settings, max_chars=200)
+
+    profile = ResumeParser().parse(sample_resume, "resume.txt")
+
+    assert len(profile["raw_text"]) <= 200
+    assert profile["limits"]["truncated"] == ["chars"]
+    assert profile["limits"]["max_chars"] == 200
+
+
+def test_parse_reads_only_the_allowed_pages(offline_settings, resume_dir):
+    limits(offline_settings, max_pages=1)
+    resume = str(resume_dir / "Uday CSA Resume.pdf")
+
+    profile = ResumeParser().parse(resume)
+
+    assert (profile["limits"]["pages"], profile["limits"]["pages_total"]) == (1, 2)
+    assert profile["limits"]["truncated"] == ["pages"]
+    assert len(profile["raw_text"]) < len(ResumeParser()._extract_text(load_document(resume)))
+
+
+def test_oversize_files_are_rejected_before_parsing(offline_settings, tmp_path):
+    offline_settings.config["resume"]["max_file_size_mb"] = 0.0001
+    path = tmp_path / "resume.txt"
+    path.write_text("x" * 1000)
+
+    with pytest.raises(ResumeTooLargeError):
+        ResumeParser().parse(str(path))
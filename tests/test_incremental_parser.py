@@ -0,0 +1,76 @@
+from src.agent.interview_agent import InterviewAgent
+from src.generators.question_generator import IncrementalQuestionParser, QuestionGenerator
+
+
+COMPLETION = """1. [Technical]
+Question: How would you design a rate limiter for a REST API?
+Evaluating: System design
+
+2. [Behavioral]
+Q: Tell me about a time you disagreed with a teammate.
+Evaluating: Collaboration
+
+3. [Situational]
+What would you do if production went down during a release?
+Evaluating: Incident response
+"""
+
+
+def parse_whole(text):
+    parser = IncrementalQuestionParser()
+    return parser.feed(text) + parser.close()
+
+
+def test_parses_all_question_formats():
+    questions = parse_whole(COMPLETION)
+
+    assert [q["type"] for q in questions] == ["technical", "behavioral", "situational"]
+    assert questions[1]["question"] == "Tell me about a time you disagreed with a teammate."
+    assert questions[2]["evaluating"] == "Incident response"
+
+
+def test_chunked_feed_matches_whole_parse():
+    parser = IncrementalQuestionParser()
+    chunked = []
+    for i in range(0, len(COMPLETION), 7):
+        chunked += parser.feed(COMPLETION[i:i + 7])
+    chunked += parser.close()
+
+    assert chunked == parse_whole(COMPLETION)
+    assert (parser.valid, parser.invalid) == (3, 0)
+
+
+def test_question_is_emitted_once_its_evaluating_line_ends():
+    parser = IncrementalQuestionParser()
+
+    assert parser.feed("1. [Technical]\nQuestion: Why Python?\nEvaluating: Langu") == []
+    assert parser.feed("age choice\n") == [
+        {"type": "technical", "question": "Why Python?", "evaluating": "Language choice"}
+    ]
+
+
+def test_block_without_question_counts_as_invalid():
+    parser = IncrementalQuestionParser()
+    parser.feed("1. [Technical]\nEvaluating: nothing asked\n")
+    parser.close()
+
+    assert (parser.valid, parser.invalid) == (0, 1)
+
+
+def test_stream_questions_yields_the_generated_set(sample_resume):
+    profile = InterviewAgent().resume_parser.parse(sample_resume, "resume.txt")
+    generator = QuestionGenerator()
+
+    streamed = list(generator.stream_questions(profile, profile["job_role"]))
+
+    assert streamed == generator.generate_questions(profile, profile["job_role"])
+
+
+def test_agent_stream_events(sample_resume):
+    events = list(InterviewAgent().stream(sample_resume, name="resume.txt"))
+    names = [event for event, _ in events]
+
+    assert names[0] == "resume_parsed"
+    assert names[-1] == "completed"
+    streamed = [payload for event, payload in events if event == "question"]
+    assert streamed == events[-1][1]["questions"]
@@ -0,0 +1,134 @@
+import threading
+import time
+
+import pytest
+
+from src.agent.interview_agent import InterviewAgent
+from src.service.client import JobServiceClient, ServiceBusyError
+from src.service.jobs import JobQueue, QueueFullError, build_job_queue
+from src.service.server import start_service
+
+
+class BlockingAgent:
+    """Agent stand-in whose runs wait until ``release`` is set."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def warm_up(self):
+        pass
+
+    def stream(self, resume, run_id=None, name=None):
+        yield "resume_parsed", {"candidate_info": {"name": name, "raw_text": "..."}}
+        self.release.wait(10)
+        question = {"type": "technical", "question": f"About {name}?", "evaluating": "x"}
+        yield "question", question
+        yield "completed", {"status": "completed", "candidate_info": {"name": name}, "questions": [question]}
+
+
+def wait_for(queue, job_id, *states, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in states:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} never reached {states}")
+
+
+@pytest.fixture
+def make_queue(tmp_path):
+    queues = []
+
+    def make(agent=None, **kwargs):
+        queue = JobQueue(agent or BlockingAgent(), str(tmp_path / "jobs.sqlite"), **kwargs)
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        if isinstance(queue.agent, BlockingAgent):
+            queue.agent.release.set()
+        queue.stop(timeout=5)
+
+
+def test_submit_rejects_once_the_queue_is_full(make_queue):
+    queue = make_queue(max_queue_depth=2)
+    queue.submit(resume_path="a.pdf", job_id="a")
+    queue.submit(data=b"resume", filename="b.txt", job_id="b")
+
+    # A job still waiting is returned, not queued twice
+    assert queue.submit(resume_path="a.pdf", job_id="a")["status"] == "queued"
+    with pytest.raises(QueueFullError, match="2 waiting"):
+        queue.submit(resume_path="c.pdf")
+    with pytest.raises(ValueError, match="either resume_path or data"):
+        queue.submit()
+
+    assert queue.get("b")["position"] == 1
+    assert queue.stats()["queued"] == 2
+
+
+def test_running_jobs_are_requeued_after_a_restart(make_queue):
+    queue = make_queue()
+    queue.submit(resume_path="a.pdf", job_id="a")
+    with queue._cond:
+        queue._claim()
+    assert queue.get("a")["status"] == "running"
+
+    assert make_queue().get("a")["status"] == "queued"
+
+
+def test_requested_workers_override_the_configured_pool(offline_settings, tmp_path):
+    offline_settings.config["service"] = {"workers": 2, "queue_path": str(tmp_path / "jobs.sqlite")}
+
+    assert build_job_queue(BlockingAgent()).workers == 2
+    assert build_job_queue(BlockingAgent(), workers=6).workers == 6
+
+
+def test_workers_run_jobs_and_report_progress(make_queue):
+    queue = make_queue(workers=1).start()
+    queue.submit(data=b"resume", filename="jane.txt", job_id="j1")
+
+    running = wait_for(queue, "j1", "running")
+    queue.agent.release.set()
+    done = wait_for(queue, "j1", "completed")
+
+    assert running["progress"]["stage"] in ("parsing", "generating")
+    assert done["progress"] == {"stage": "completed", "questions": 1}
+    assert done["questions"][0]["question"] == "About jane.txt?"
+    assert "raw_text" not in done["candidate_info"]
+    assert queue._conn.execute("SELECT resume_data FROM jobs").fetchone()[0] is None
+
+
+def test_real_agent_job_completes(make_queue, sample_resume):
+    queue = make_queue(agent=InterviewAgent(), workers=1).start()
+    queue.submit(data=sample_resume, filename="resume.txt", job_id="real")
+
+    job = wait_for(queue, "real", "completed", "failed")
+
+    assert job["status"] == "completed"
+    assert len(job["questions"]) == 15
+
+
+def test_http_api_answers_429_when_full(make_queue, sample_resume):
+    queue = make_queue(workers=1, max_queue_depth=1)
+    server, _ = start_service(host="127.0.0.1", port=0, queue=queue)
+    client = JobServiceClient(f"http://127.0.0.1:{server.server_port}", poll_seconds=0.01)
+
+    try:
+        client.submit_bytes(sample_resume, "running.txt", job_id="running")
+        wait_for(queue, "running", "running")
+        client.submit_bytes(sample_resume, "waiting.txt", job_id="waiting")
+
+        with pytest.raises(ServiceBusyError) as busy:
+            client.submit_bytes(sample_resume, "rejected.txt")
+        assert busy.value.retry_after == 5
+        with pytest.raises(KeyError):
+            client.status("unknown")
+
+        queue.agent.release.set()
+        result = client.wait("waiting")
+        assert result["status"] == "completed"
+        assert client.health()["completed"] >= 1
+    finally:
+        server.shutdown()
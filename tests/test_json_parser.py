@@ -0,0 +1,134 @@
+import json
+
+import pytest
+
+from src.generators import question_generator
+from src.generators.question_generator import IncrementalQuestionParser, JSONQuestionParser, QuestionGenerator
+from src.utils.tracing import MetricsRegistry
+
+
+PROFILE = {"job_role": "Backend Engineer", "skills": ["Python", "Docker"], "experience": "6 years 0 months"}
+
+QUESTIONS = [
+    {"type": "Technical", "question": 'How would you design a "{rate limiter}"?', "evaluating": "System design"},
+    {"type": "behavioral", "question": "Tell me about a C:\\ drive outage.", "evaluating": "Ownership"},
+]
+RESPONSE = json.dumps({"questions": QUESTIONS})
+
+
+def parse(text, chunk_size=None):
+    parser = JSONQuestionParser()
+    chunks = [text] if chunk_size is None else [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    questions = [q for chunk in chunks for q in parser.feed(chunk)]
+    return questions + parser.close(), parser
+
+
+def counter(registry, name, **labels):
+    return sum(
+        c["value"] for c in registry.snapshot()["counters"]
+        if c["name"] == name and labels.items() <= c["labels"].items()
+    )
+
+
+def test_objects_are_emitted_as_soon_as_they_close():
+    parser = JSONQuestionParser()
+    first_end = RESPONSE.index('"System design"}') + len('"System design"}')
+
+    assert parser.feed(RESPONSE[:first_end - 1]) == []
+    assert [q["type"] for q in parser.feed(RESPONSE[first_end - 1:first_end + 5])] == ["technical"]
+    assert [q["type"] for q in parser.feed(RESPONSE[first_end + 5:])] == ["behavioral"]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, None])
+def test_chunking_does_not_change_the_result(chunk_size):
+    questions, parser = parse(RESPONSE, chunk_size)
+
+    assert questions == [
+        {"type": "technical", "question": 'How would you design a "{rate limiter}"?', "evaluating": "System design"},
+        {"type": "behavioral", "question": "Tell me about a C:\\ drive outage.", "evaluating": "Ownership"},
+    ]
+    assert (parser.valid, parser.invalid, parser.fell_back) == (2, 0, False)
+
+
+def test_fences_and_prose_around_the_json_are_ignored():
+    text = f'Here are your "questions":\n```json\n{RESPONSE}\n```\nGood luck!'
+
+    questions, parser = parse(text, 5)
+
+    assert len(questions) == 2
+    assert not parser.fell_back
+
+
+def test_objects_outside_the_schema_are_counted_invalid():
+    items = [
+        {"type": "technical", "question": "Why FastAPI?"},
+        {"type": "technical", "question": "   "},
+        {"type": 3, "question": "Why Docker?"},
+        {"question": "No type?"},
+        {"type": "behavioral", "question": "Describe a failure.", "evaluating": ["list"]},
+    ]
+
+    questions, parser = parse(json.dumps({"questions": items}))
+
+    assert questions == [{"type": "technical", "question": "Why FastAPI?", "evaluating": ""}]
+    assert (parser.valid, parser.invalid) == (1, 4)
+
+
+def test_a_truncated_last_object_is_counted_invalid():
+    questions, parser = parse(RESPONSE[:RESPONSE.rindex('"evaluating"')], 3)
+
+    assert [q["type"] for q in questions] == ["technical"]
+    assert (parser.valid, parser.invalid) == (1, 1)
+
+
+def test_a_response_without_valid_json_falls_back_to_text():
+    text = "1. [Technical]\n   Question: Why FastAPI?\n   Evaluating: Framework choice\n"
+
+    questions, parser = parse(text, 4)
+
+    text_parser = IncrementalQuestionParser()
+    assert questions == text_parser.feed(text) + text_parser.close()
+    assert parser.fell_back and parser.valid == 1
+
+
+def test_a_blank_response_does_not_fall_back():
+    questions, parser = parse("   ")
+
+    assert questions == []
+    assert not parser.fell_back
+
+
+def test_generator_requests_and_parses_json(offline_settings):
+    offline_settings.config["interview"]["output_format"] = "json"
+
+    generator = QuestionGenerator()
+    questions = generator.generate_questions(PROFILE, PROFILE["job_role"], 6)
+
+    assert generator._llm_kwargs == {"response_format": {"type": "json_object"}}
+    assert len(questions) == 6
+    assert list(generator.stream_questions(PROFILE, PROFILE["job_role"], 6)) == questions
+
+
+def test_parse_outcomes_are_counted(offline_settings, monkeypatch):
+    registry = MetricsRegistry()
+    monkeypatch.setattr(question_generator, "metrics", registry)
+    offline_settings.config["interview"].update(output_format="json", generation_mode="single")
+    offline_settings.config["interview"]["top_up"]["max_rounds"] = 0
+    offline_settings.config["llm"]["fake"]["responses"] = [{
+        "match": "Generate EXACTLY",
+        "response": "1. [Technical]\n   Question: Why FastAPI?\n   Evaluating: Framework choice\n",
+    }]
+
+    questions = QuestionGenerator().generate_questions(PROFILE, PROFILE["job_role"], 5)
+
+    assert [q["question"] for q in questions] == ["Why FastAPI?"]
+    assert counter(registry, "question_responses_total", format="json", outcome="fallback") == 1
+    assert counter(registry, "question_blocks_total", format="json", outcome="valid") == 1
+
+
+def test_unknown_output_format_is_rejected(offline_settings):
+    offline_settings.config["interview"]["output_format"] = "yaml"
+
+    with pytest.raises(ValueError, match="Unsupported output format: yaml"):
+        QuestionGenerator()
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from src.llm.client import build_llm, get_llm
+from src.llm.fake import FakeChatModel
+
+
+PROMPT = [HumanMessage(content="Generate EXACTLY 2 questions for the role of **Data Engineer**")]
+
+
+def test_same_config_shares_one_client():
+    assert get_llm() is get_llm()
+    assert get_llm(temperature=0.1) is not get_llm()
+
+
+def test_unsupported_provider_lists_the_registered_ones():
+    with pytest.raises(ValueError, match="Unsupported LLM provider: nope .*fake"):
+        build_llm({"provider": "nope"})
+
+
+def test_fake_record_provider_must_be_real():
+    with pytest.raises(ValueError, match="must be a real provider"):
+        build_llm({"provider": "fake", "fake": {"mode": "record", "record_provider": "fake"}})
+
+
+def test_canned_rules_take_precedence_over_built_in_responses():
+    llm = FakeChatModel(responses=[{"match": "data engineer", "response": "ruled"}])
+
+    assert llm.invoke(PROMPT).content == "ruled"
+    assert FakeChatModel().invoke([HumanMessage(content="hello")]).content == "OK"
+
+
+def test_canned_questions_follow_the_prompt():
+    text = FakeChatModel().invoke(PROMPT).content
+
+    assert "2. [Technical]" in text
+    assert "for a Data Engineer?" in text
+
+
+def test_stream_and_astream_reassemble_the_response():
+    llm = FakeChatModel()
+    full = llm.invoke(PROMPT).content
+
+    async def astream():
+        return "".join([chunk.content async for chunk in llm.astream(PROMPT)])
+
+    assert "".join(chunk.content for chunk in llm.stream(PROMPT)) == full
+    assert asyncio.run(astream()) == full
+
+
+def test_record_then_replay(tmp_path):
+    recording = str(tmp_path / "recording.jsonl")
+    upstream = FakeChatModel(responses=[{"match": "", "response": "recorded answer"}])
+
+    recorder = FakeChatModel(mode="record", recording_path=recording, upstream=upstream)
+    assert recorder.invoke(PROMPT).content == "recorded answer"
+
+    replay = FakeChatModel(mode="replay", recording_path=recording)
+    assert replay.invoke(PROMPT).content == "recorded answer"
+    with pytest.raises(KeyError, match="No recorded response"):
+        replay.invoke([HumanMessage(content="never recorded")])
+
+
+def test_usage_metadata_is_reported():
+    message = FakeChatModel().invoke(PROMPT)
+
+    assert message.usage_metadata["input_tokens"] > 0
+    assert message.usage_metadata["output_tokens"] > 0
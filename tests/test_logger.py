@@ -0,0 +1,90 @@
+import json
+import logging
+import threading
+import time
+import uuid
+
+import pytest
+
+from src.utils.logger import setup_logger
+from src.utils.tracing import span, start_run
+
+
+def read_log(path, lines=1, timeout=5.0):
+    """Log file lines once at least ``lines`` were written (the listener thread writes them)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists():
+            content = path.read_text(encoding="utf-8").splitlines()
+            if len(content) >= lines:
+                return content
+        time.sleep(0.01)
+    raise AssertionError(f"{path} has fewer than {lines} lines")
+
+
+@pytest.fixture
+def new_logger(tmp_path):
+    def make(**logging_config):
+        from config.settings import settings
+
+        settings.config["logging"] = {**settings.config.get("logging", {}), **logging_config}
+        return setup_logger(name=f"test-{uuid.uuid4().hex[:8]}", log_dir=str(tmp_path))
+
+    return make
+
+
+def test_no_log_directory_until_the_first_record(tmp_path):
+    log_dir = tmp_path / "app"
+    logger = setup_logger(name=f"test-{uuid.uuid4().hex[:8]}", log_dir=str(log_dir))
+    assert not log_dir.exists()
+
+    logger.info("first")
+
+    assert read_log(log_dir / "app.log")[0].endswith("INFO - first")
+
+
+def test_json_lines_carry_run_id_and_stage(new_logger, tmp_path):
+    logger = new_logger(format="json")
+
+    with start_run("run-42"):
+        with span("node.parse_resume"):
+            logger.warning("parsed")
+    logger.info("outside")
+
+    first, second = (json.loads(line) for line in read_log(tmp_path / "app.log", lines=2))
+    assert first == {**first, "level": "WARNING", "message": "parsed", "run_id": "run-42", "stage": "node.parse_resume"}
+    assert (second["run_id"], second["stage"]) == (None, None)
+
+
+def test_records_from_many_threads_are_all_written(new_logger, tmp_path):
+    logger = new_logger(format="text", queue=True)
+
+    def log(i):
+        for j in range(50):
+            logger.info(f"thread {i} record {j}")
+
+    threads = [threading.Thread(target=log, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(read_log(tmp_path / "app.log", lines=200)) == 200
+
+
+def test_level_from_config_applies_after_the_first_record(new_logger, tmp_path):
+    logger = new_logger(level="WARNING", format="text", queue=False)
+
+    logger.info("dropped")
+    logger.warning("kept")
+
+    assert logger.level == logging.WARNING
+    lines = read_log(tmp_path / "app.log")
+    assert len(lines) == 1 and lines[0].endswith("WARNING - kept")
+
+
+def test_unknown_format_is_rejected(new_logger):
+    logger = new_logger(format="xml")
+
+    with pytest.raises(ValueError, match="Unsupported log format: xml"):
+        logger.info("boom")
@@ -0,0 +1,86 @@
+import threading
+
+import pytest
+
+from src.parsers import pdf_backends
+from src.parsers.pdf_backends import (
+    PyPDF2Backend,
+    available_backends,
+    extract_pdf_pages,
+    extract_pdf_text,
+    get_pdf_backend,
+)
+
+
+@pytest.fixture
+def two_page_pdf(resume_dir):
+    return resume_dir / "Uday CSA Resume.pdf"
+
+
+def test_unknown_backend_lists_the_available_ones():
+    with pytest.raises(ValueError, match="Unsupported PDF backend: nope .*pypdf2"):
+        get_pdf_backend("nope")
+
+
+def test_pypdf2_is_available():
+    assert "pypdf2" in available_backends()
+
+
+def test_max_pages_reads_only_the_first_pages(two_page_pdf):
+    backend = get_pdf_backend("pypdf2")
+
+    pages, total = extract_pdf_pages(two_page_pdf, backend, max_pages=1)
+
+    assert total == 2
+    assert len(pages) == 1
+
+
+class CountingBackend(PyPDF2Backend):
+    """PyPDF2 backend that counts how often a document is parsed."""
+
+    def __init__(self):
+        self.opened = 0
+
+    def open_document(self, source):
+        self.opened += 1
+        return super().open_document(source)
+
+
+def test_sequential_extraction_parses_the_document_once(two_page_pdf):
+    backend = CountingBackend()
+
+    pages, total = extract_pdf_pages(two_page_pdf, backend)
+
+    assert (len(pages), total) == (2, 2)
+    assert backend.opened == 1
+
+
+def test_bytes_and_path_sources_extract_the_same_text(two_page_pdf):
+    backend = get_pdf_backend("pypdf2")
+
+    assert extract_pdf_text(two_page_pdf.read_bytes(), backend) == extract_pdf_text(two_page_pdf, backend)
+
+
+def test_parallel_extraction_matches_sequential(monkeypatch, two_page_pdf):
+    backend = get_pdf_backend("pypdf2")
+    sequential = extract_pdf_text(two_page_pdf, backend)
+    monkeypatch.setattr(pdf_backends.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(pdf_backends, "_pool", None)
+
+    errors = []
+
+    def extract():
+        try:
+            assert extract_pdf_text(two_page_pdf, backend, parallel_page_threshold=2) == sequential
+        except Exception as e:
+            errors.append(e)
+
+    # Concurrent parses share one pool
+    threads = [threading.Thread(target=extract) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    pdf_backends._shutdown_pool()
+    assert errors == []
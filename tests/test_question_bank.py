@@ -0,0 +1,152 @@
+import pytest
+
+from src.agent.interview_agent import InterviewAgent
+from src.generators.question_bank import QuestionBank, add_result, experience_years, get_question_bank
+from src.generators.question_generator import QuestionGenerator
+
+
+PROFILE = {"job_role": "Data Scientist", "skills": ["Python", "Pandas"], "experience": "3 years 6 months"}
+
+
+@pytest.fixture
+def bank():
+    bank = QuestionBank()
+    bank.add("technical", "How do you tune a gradient boosting model?", roles=["Data Scientist"], skills=["XGBoost"])
+    bank.add("technical", "How do you reshape a Pandas DataFrame?", roles=["Data Analyst"], skills=["Pandas", "Python"])
+    bank.add("technical", "How do you design a REST API?", roles=["Backend Engineer"], skills=["FastAPI"])
+    bank.add("behavioral", "Tell me about a conflict with a teammate.")
+    return bank
+
+
+def questions_of(selected):
+    return [q["question"] for q in selected]
+
+
+def test_questions_are_ranked_by_the_profile(bank):
+    selected = bank.select("Data Scientist", ["Pandas", "Python"], [("technical", 2)])
+
+    assert questions_of(selected) == [
+        "How do you reshape a Pandas DataFrame?",
+        "How do you tune a gradient boosting model?",
+    ]
+    assert all(q["source"] == "bank" for q in selected)
+
+
+def test_unmatched_types_get_generic_questions(bank):
+    selected = bank.select("Nurse", ["Triage"], [("behavioral", 2), ("situational", 1)])
+
+    assert questions_of(selected) == ["Tell me about a conflict with a teammate."]
+
+
+def test_excluded_questions_are_skipped(bank):
+    selected = bank.select(
+        "Data Scientist", ["Pandas"], [("technical", 1)], exclude=["how do you RESHAPE a pandas dataframe"]
+    )
+
+    assert questions_of(selected) == ["How do you tune a gradient boosting model?"]
+
+
+def test_difficulty_tags_boost_or_demote(bank):
+    bank.add("technical", "How do you lead a Pandas migration?", roles=["Data Scientist"], difficulty=["Lead"])
+    quotas = [("technical", 1)]
+
+    assert questions_of(bank.select("Data Scientist", ["Pandas"], quotas, "lead")) == [
+        "How do you lead a Pandas migration?"
+    ]
+    assert questions_of(bank.select("Data Scientist", ["Pandas"], quotas, "junior")) != [
+        "How do you lead a Pandas migration?"
+    ]
+
+
+def test_the_same_question_text_is_added_once(bank):
+    assert not bank.add("technical", "How do you design a REST API")
+    assert not bank.add("technical", "the and of")
+    assert len(bank) == 4
+
+
+@pytest.mark.parametrize("candidate_info, years", [
+    ({"experience_years": 4}, 4.0),
+    ({"experience": "3 years 6 months"}, 3.5),
+    ({"experience": "0 years 0 months"}, None),
+    ({}, None),
+])
+def test_experience_years(candidate_info, years):
+    assert experience_years(candidate_info) == years
+
+
+@pytest.mark.parametrize("candidate_info, line", [
+    ({"experience": "3 years 6 months"}, "Experience Level: 3.5 years"),
+    ({"experience_years": 4}, "Experience Level: 4 years"),
+    ({"experience": "0 years 0 months"}, "Experience Level: 0 years 0 months"),
+    ({}, "Experience Level: unknown"),
+])
+def test_prompt_states_the_derived_experience(candidate_info, line):
+    prompt = QuestionGenerator()._create_question_prompt(candidate_info, "Data Scientist", "mid", 5)
+
+    assert f"- {line}\n" in prompt
+
+
+def test_only_real_llm_questions_are_added():
+    bank = QuestionBank()
+    questions = [
+        {"type": "technical", "question": "How do you validate a forecast?"},
+        {"type": "behavioral", "question": "Describe a failure.", "source": "fallback"},
+    ]
+
+    assert add_result(bank, PROFILE, questions, "fake") == 0
+    assert add_result(bank, PROFILE, questions, None) == 0
+    assert add_result(bank, {**PROFILE, "degraded": True}, questions, "groq") == 0
+    assert add_result(bank, PROFILE, questions, "groq") == 1
+    assert bank.select("Data Scientist", [], [("technical", 1)], "mid")[0]["question"] == "How do you validate a forecast?"
+
+
+def test_vetted_bank_is_loaded_from_config(offline_settings):
+    assert len(get_question_bank()) >= 50
+
+    offline_settings.config["question_bank"]["enabled"] = False
+    assert QuestionGenerator().question_bank is None
+
+
+def test_instant_mode_never_calls_the_llm(offline_settings):
+    offline_settings.config["question_bank"]["mode"] = "instant"
+    generator = QuestionGenerator()
+    generator.llm = None
+
+    questions, outcome = generator.generate_questions_cached(PROFILE, PROFILE["job_role"], 8)
+
+    assert outcome == {"hit": True, "match": "bank"}
+    assert len(questions) == 8
+    assert {q["source"] for q in questions} <= {"bank", "fallback"}
+    assert list(generator.stream_questions(PROFILE, PROFILE["job_role"], 8)) == questions
+
+
+def test_fallback_mode_serves_the_bank_when_the_llm_fails(offline_settings):
+    offline_settings.config["interview"]["generation_mode"] = "single"
+    offline_settings.config["interview"]["top_up"]["max_rounds"] = 0
+    offline_settings.config["llm"]["fake"]["responses"] = [
+        {"match": "Generate EXACTLY", "response": "Sorry, I cannot help."}
+    ]
+
+    questions = QuestionGenerator().generate_questions(PROFILE, PROFILE["job_role"], 8)
+
+    assert len(questions) == 8
+    assert "source" in questions[0] and any(q["source"] == "bank" for q in questions)
+
+
+def test_hybrid_mode_streams_a_provisional_set_first(offline_settings, sample_resume):
+    offline_settings.config["question_bank"]["mode"] = "hybrid"
+
+    events = list(InterviewAgent().stream(sample_resume, name="resume.txt"))
+
+    names = [name for name, _ in events]
+    assert names[:2] == ["resume_parsed", "provisional"]
+    assert all(q["source"] in ("bank", "fallback") for q in events[1][1])
+    assert names.count("question") == 15
+    assert not any(q.get("source") for q in events[-1][1]["questions"])
+
+
+def test_unknown_bank_mode_is_rejected(offline_settings):
+    offline_settings.config["question_bank"]["mode"] = "offline"
+
+    with pytest.raises(ValueError, match="Unsupported question bank mode: offline"):
+        QuestionGenerator()
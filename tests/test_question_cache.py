@@ -0,0 +1,69 @@
+from src.generators.question_cache import QuestionCache, jaccard, normalize_term
+from src.generators.question_generator import QuestionGenerator
+
+
+QUESTIONS = [{"type": "technical", "question": "Explain Python generators.", "evaluating": "Python"}]
+TYPES = ["technical", "behavioral"]
+
+
+def fingerprint(cache, skills, role="Backend Engineer"):
+    return cache.fingerprint(role, "senior", skills, TYPES, 10)
+
+
+def test_normalized_profiles_share_a_fingerprint():
+    cache = QuestionCache()
+
+    assert fingerprint(cache, ["Python", "Docker"]) == fingerprint(cache, [" docker.", "PYTHON"], role="backend  engineer")
+    assert normalize_term("  C++ / Node.js! ") == "c++ / node.js"
+    assert jaccard(frozenset({"a", "b"}), frozenset({"b", "c"})) == 1 / 3
+
+
+def test_exact_match_by_default():
+    cache = QuestionCache()
+    cache.set(*fingerprint(cache, ["python", "docker", "aws", "sql"]), QUESTIONS)
+
+    exact, outcome = cache.get(*fingerprint(cache, ["sql", "aws", "docker", "python"]))
+    near, _ = cache.get(*fingerprint(cache, ["python", "docker", "aws", "sql", "git"]))
+
+    assert (exact, outcome["match"]) == (QUESTIONS, "exact")
+    assert near is None
+    assert cache.stats == {"exact_hits": 1, "similar_hits": 0, "misses": 1}
+
+
+def test_near_match_at_or_above_threshold():
+    cache = QuestionCache(similarity_threshold=0.8)
+    cache.set(*fingerprint(cache, ["python", "docker", "aws", "sql"]), QUESTIONS)
+
+    near, outcome = cache.get(*fingerprint(cache, ["python", "docker", "aws", "sql", "git"]))
+    far, _ = cache.get(*fingerprint(cache, ["python", "docker", "git"]))
+    other_role, _ = cache.get(*fingerprint(cache, ["python", "docker", "aws", "sql"], role="Data Scientist"))
+
+    assert near == QUESTIONS
+    assert outcome == {"hit": True, "match": "similar", "similarity": 0.8}
+    assert far is None
+    assert other_role is None
+
+
+def test_cached_sets_are_copies():
+    cache = QuestionCache()
+    key = fingerprint(cache, ["python"])
+    questions = [dict(q) for q in QUESTIONS]
+    cache.set(*key, questions)
+    questions[0]["question"] = "changed"
+
+    hit, _ = cache.get(*key)
+    hit[0]["question"] = "changed too"
+
+    assert cache.get(*key)[0] == QUESTIONS
+
+
+def test_generator_serves_repeated_profiles_from_the_cache(offline_settings):
+    offline_settings.config["cache"]["questions"] = {"enabled": True, "max_entries": 8}
+    generator = QuestionGenerator()
+    profile = {"job_role": "Backend Engineer", "skills": ["Python", "Docker"], "experience": "6 years 0 months"}
+
+    first, first_outcome = generator.generate_questions_cached(profile, profile["job_role"])
+    second, second_outcome = generator.generate_questions_cached(dict(profile), profile["job_role"])
+
+    assert (first_outcome["hit"], second_outcome["match"]) == (False, "exact")
+    assert second == first
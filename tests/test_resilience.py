@@ -0,0 +1,213 @@
+import asyncio
+import time
+
+import pytest
+
+from src.llm.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LLMDeadlineError,
+    LLMTimeoutError,
+    ResilientLLM,
+    call_deadline,
+    is_retryable,
+    pop_call_stats,
+)
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class ScriptedLLM:
+    """Chat model stand-in: each call takes the next outcome from ``script``."""
+
+    def __init__(self, *script, delay=0.0):
+        self.script = list(script)
+        self.delay = delay
+        self.calls = 0
+
+    def _next(self):
+        self.calls += 1
+        outcome = self.script.pop(0) if self.script else "ok"
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def invoke(self, input, **kwargs):
+        time.sleep(self.delay)
+        return self._next()
+
+    async def ainvoke(self, input, **kwargs):
+        await asyncio.sleep(self.delay)
+        return self._next()
+
+    def stream(self, input, **kwargs):
+        yield from self._next().split()
+
+
+def resilient(llm, **config):
+    config = {"backoff_base_seconds": 0, "timeout_seconds": 1, **config}
+    return ResilientLLM(llm, config)
+
+
+def open_breaker(breaker):
+    while breaker.state != "open":
+        breaker.before_call()
+        breaker.record_failure()
+
+
+# =========================
+# CIRCUIT BREAKER
+# =========================
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+    open_breaker(breaker)
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError, match="retry in"):
+        breaker.before_call()
+
+
+def test_half_open_admits_one_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+    open_breaker(breaker)
+
+    assert breaker.before_call() is True
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError, match="trial call in progress"):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.before_call() is False
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker(failure_threshold=5, reset_seconds=0)
+    open_breaker(breaker)
+    breaker.before_call()
+
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+
+
+def test_cancelled_trial_is_released():
+    llm = resilient(ScriptedLLM(delay=5), circuit_breaker={"failure_threshold": 1, "reset_seconds": 0})
+    open_breaker(llm.breaker)
+
+    async def cancel_trial():
+        task = asyncio.create_task(llm.ainvoke("hi"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_trial())
+    llm.llm.delay = 0
+
+    assert llm.breaker.state == "half_open"
+    assert llm.invoke("hi") == "ok"
+    assert llm.breaker.state == "closed"
+
+
+def test_bad_requests_do_not_count_against_the_breaker():
+    model = ScriptedLLM(HTTPError(400), HTTPError(400), ValueError("bad prompt"))
+    llm = resilient(model, circuit_breaker={"failure_threshold": 1, "reset_seconds": 0})
+
+    for _ in range(2):
+        with pytest.raises(HTTPError):
+            llm.invoke("hi")
+    assert llm.breaker.state == "closed"
+
+    # A rejected half-open trial is released rather than reopening the circuit
+    open_breaker(llm.breaker)
+    with pytest.raises(ValueError):
+        llm.invoke("hi")
+    assert llm.breaker.state == "half_open"
+    assert llm.invoke("hi") == "ok"
+    assert llm.breaker.state == "closed"
+
+
+def test_open_circuit_fails_fast_without_calling_the_model():
+    model = ScriptedLLM(HTTPError(503))
+    llm = resilient(model, max_attempts=1, circuit_breaker={"failure_threshold": 1, "reset_seconds": 60})
+
+    with pytest.raises(HTTPError):
+        llm.invoke("hi")
+    with pytest.raises(CircuitOpenError):
+        llm.invoke("hi")
+
+    assert model.calls == 1
+
+
+# =========================
+# RETRIES & TIMEOUTS
+# =========================
+
+def test_retryable_errors():
+    assert is_retryable(HTTPError(429))
+    assert is_retryable(HTTPError(503))
+    assert is_retryable(ConnectionError())
+    assert not is_retryable(HTTPError(400))
+    assert not is_retryable(ValueError())
+    assert not is_retryable(CircuitOpenError())
+
+
+def test_transient_failures_are_retried():
+    model = ScriptedLLM(HTTPError(503), ConnectionError(), "answer")
+    llm = resilient(model, max_attempts=3)
+
+    assert llm.invoke("hi") == "answer"
+    assert pop_call_stats() == {"attempts": 3, "retries": 2, "timeouts": 0, "hedged": 0}
+
+
+def test_bad_requests_are_not_retried():
+    model = ScriptedLLM(HTTPError(400))
+    llm = resilient(model, max_attempts=3)
+
+    with pytest.raises(HTTPError):
+        llm.invoke("hi")
+    assert model.calls == 1
+
+
+def test_slow_attempts_time_out():
+    llm = resilient(ScriptedLLM(delay=1), timeout_seconds=0.05, max_attempts=2)
+
+    with pytest.raises(LLMTimeoutError, match="timed out after 0.05s"):
+        llm.invoke("hi")
+    assert pop_call_stats()["timeouts"] == 2
+
+
+def test_async_calls_retry_too():
+    llm = resilient(ScriptedLLM(HTTPError(429), "answer"), max_attempts=2)
+
+    assert asyncio.run(llm.ainvoke("hi")) == "answer"
+
+
+def test_passed_deadline_makes_no_attempt():
+    model = ScriptedLLM()
+    llm = resilient(model)
+
+    with call_deadline(0):
+        with pytest.raises(LLMDeadlineError):
+            llm.invoke("hi")
+    assert model.calls == 0
+
+
+def test_stream_retries_until_the_first_chunk():
+    model = ScriptedLLM(HTTPError(503), "streamed answer")
+    llm = resilient(model, max_attempts=2)
+
+    assert list(llm.stream("hi")) == ["streamed", "answer"]
+    assert llm.breaker.state == "closed"
@@ -0,0 +1,109 @@
+import csv
+import json
+import sqlite3
+
+import pytest
+
+from src.agent.interview_agent import InterviewAgent
+from src.storage.results_store import ResultsStore, get_results_store
+
+
+QUESTIONS = [
+    {"type": "technical", "question": "Why Python?", "evaluating": "Language choice"},
+    {"type": "behavioral", "question": "Describe a conflict.", "evaluating": "Collaboration"},
+]
+
+
+def state(run_id, email="jane@example.com", role="Backend Engineer", status="completed", **extra):
+    return {
+        "run_id": run_id,
+        "resume_path": f"/resumes/{run_id}.pdf",
+        "status": status,
+        "candidate_info": {"name": "Jane", "email": email, "job_role": role, "raw_text": "..."},
+        "questions": QUESTIONS,
+        "llm_provider": "groq",
+        **extra,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.sqlite"))
+    yield store
+    store.close()
+
+
+def test_save_upserts_one_row_per_run(store):
+    store.save(state("r1", status="running"), resume_hash="abc")
+    first = store.get("r1")
+    store.save(state("r1"))
+
+    result = store.get("r1")
+    assert result["status"] == "completed"
+    assert result["created_at"] == first["created_at"]
+    # A later save without a hash keeps the stored one
+    assert result["resume_hash"] == "abc"
+    assert result["resume_name"] == "r1.pdf"
+    assert result["llm_provider"] == "groq"
+    assert "raw_text" not in result["candidate_info"]
+
+
+def test_find_filters_case_insensitively(store):
+    store.save(state("r1", email="Jane@Example.com"), resume_hash="h1")
+    store.save(state("r2", role="Data Scientist"), resume_hash="h1")
+    store.save(state("r3", status="failed"), resume_hash="h1")
+
+    assert [r["run_id"] for r in store.find(email="jane@example.com")] == ["r3", "r2", "r1"]
+    assert [r["run_id"] for r in store.find(job_role="data scientist")] == ["r2"]
+    assert store.latest_for_resume("h1")["run_id"] == "r2"
+    assert store.get("missing") is None
+
+
+def test_export_streams_jsonl_and_csv(store, tmp_path):
+    store.save(state("r1"))
+    store.save(state("r2", status="failed"))
+
+    assert store.export(str(tmp_path / "all.jsonl")) == 2
+    lines = (tmp_path / "all.jsonl").read_text().splitlines()
+    assert [json.loads(line)["run_id"] for line in lines] == ["r1", "r2"]
+
+    assert store.export(str(tmp_path / "done.csv"), fmt="csv", status="completed") == 1
+    with open(tmp_path / "done.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [(r["run_id"], r["question_index"], r["question_type"]) for r in rows] == [
+        ("r1", "1", "technical"), ("r1", "2", "behavioral"),
+    ]
+
+    with pytest.raises(ValueError, match="Unsupported export format: xml"):
+        store.export(str(tmp_path / "all.xml"), fmt="xml")
+
+
+def test_older_databases_gain_the_provider_column(tmp_path):
+    path = tmp_path / "results.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE interviews (run_id TEXT PRIMARY KEY, resume_hash TEXT, resume_name TEXT, "
+        "name TEXT, email TEXT, job_role TEXT, status TEXT, question_count INTEGER, created_at TEXT, "
+        "saved_at TEXT, candidate_json TEXT, questions_json TEXT)"
+    )
+    conn.execute("INSERT INTO interviews (run_id, status) VALUES ('old', 'completed')")
+    conn.commit()
+    conn.close()
+
+    store = ResultsStore(str(path))
+    store.save(state("new"))
+
+    assert store.get("old")["llm_provider"] is None
+    assert store.get("new")["llm_provider"] == "groq"
+    store.close()
+
+
+def test_agent_runs_are_saved(offline_settings, tmp_path, sample_resume):
+    offline_settings.config["output"] = {"save_interviews": True, "output_dir": str(tmp_path)}
+
+    result = InterviewAgent().run(sample_resume, run_id="saved-run", name="resume.txt")
+
+    saved = get_results_store().get("saved-run")
+    assert saved["status"] == "completed"
+    assert saved["questions"] == result["questions"]
+    assert saved["llm_provider"] == "fake"
@@ -0,0 +1,50 @@
+from src.parsers.section_segmenter import HEADER, build_context, segment_sections
+from src.utils.tokens import estimate_tokens, trim_to_tokens
+
+
+RESUME = """Jane Doe
+jane@example.com
+
+PROFESSIONAL EXPERIENCE:
+Senior Engineer, Acme
+
+Technical Skills: Python, SQL
+Docker
+
+Experience
+Engineer, Initech
+"""
+
+
+def test_segments_on_known_headings():
+    sections = segment_sections(RESUME)
+
+    assert list(sections) == [HEADER, "experience", "skills"]
+    assert sections[HEADER] == "Jane Doe\njane@example.com"
+    assert sections["skills"] == "Python, SQL\nDocker"
+    # Repeated sections are concatenated
+    assert sections["experience"] == "Senior Engineer, Acme\n\nEngineer, Initech"
+
+
+def test_long_lines_are_not_headings():
+    sections = segment_sections("Skills gained from years of experience in retail\nPython")
+
+    assert list(sections) == [HEADER]
+
+
+def test_context_follows_priority_and_budget():
+    sections = {"experience": "Engineer, Acme\n" * 20, "skills": "Python, SQL"}
+
+    context = build_context(sections, ["skills", "experience", "projects"], max_tokens=20)
+
+    assert context.startswith("SKILLS:\nPython, SQL\n\nEXPERIENCE:\n")
+    assert estimate_tokens(context) <= 20
+
+
+def test_context_falls_back_to_the_raw_text():
+    assert build_context({}, ["skills"], max_tokens=2, fallback="Python\nSQL") == "Python"
+
+
+def test_trim_cuts_at_a_line_break_near_the_limit():
+    assert trim_to_tokens("abcde\nfghij", max_tokens=2) == "abcde"
+    assert trim_to_tokens("a\nbcdefghijkl", max_tokens=2) == "a\nbcdefg"
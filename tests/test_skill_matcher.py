@@ -0,0 +1,68 @@
+import pytest
+
+from src.parsers.resume_parser import ResumeParser
+from src.parsers.skill_matcher import AhoCorasick, SkillMatcher
+
+
+TAXONOMY = {
+    "Python": ["python3", "py"],
+    "Java": [],
+    "JavaScript": ["js"],
+    "Power BI": ["powerbi"],
+    "BI": ["business intelligence"],
+    "Go": {"aliases": ["golang"], "match_name": False},
+    "Machine Learning": ["ml"],
+}
+
+
+@pytest.fixture
+def matcher():
+    return SkillMatcher(TAXONOMY)
+
+
+def test_automaton_finds_overlapping_patterns():
+    automaton = AhoCorasick()
+    for pattern in ("he", "she", "hers"):
+        automaton.add(pattern, pattern)
+    automaton.build()
+
+    assert sorted(automaton.iter_matches("ushers")) == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_finds_whole_words_in_order_of_first_mention(matcher):
+    text = "Built dashboards in Power-BI; JavaScript and Python3 services, more python"
+
+    assert matcher.find(text) == ["Power BI", "JavaScript", "Python"]
+
+
+def test_ambiguous_names_match_only_through_aliases(matcher):
+    assert matcher.find("Go to market plans") == []
+    assert matcher.find("Services in Golang") == ["Go"]
+
+
+def test_canonicalize_maps_aliases_and_drops_duplicates(matcher):
+    skills = ["py", "Python", " ML ", "machine learning", "Terraform", ""]
+
+    assert matcher.canonicalize(skills) == ["Python", "Machine Learning", "Terraform"]
+
+
+def test_taxonomy_file_is_versioned():
+    matcher = SkillMatcher.from_yaml("config/skills.yaml")
+
+    assert matcher.version.startswith("1:")
+    assert "Python" in matcher.find("Experienced with python and SQL")
+
+
+def test_dictionary_mode_extracts_taxonomy_skills(offline_settings, sample_resume):
+    offline_settings.config["resume"]["skills"]["mode"] = "dictionary"
+
+    profile = ResumeParser().parse(sample_resume, "resume.txt")
+
+    assert {"Python", "Django", "Docker", "Kubernetes", "AWS"} <= set(profile["skills"])
+
+
+def test_unknown_skills_mode_is_rejected(offline_settings):
+    offline_settings.config["resume"]["skills"]["mode"] = "regex"
+
+    with pytest.raises(ValueError, match="Unsupported skills mode: regex"):
+        ResumeParser()
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+
+from src.agent.interview_agent import InterviewAgent
+
+
+HEAVY_MODULES = ["langgraph", "langchain_core", "langchain_groq", "docx", "yaml", "http.server"]
+
+CHILD = """
+import json, sys
+import src.agent.interview_agent
+from config.settings import settings
+print(json.dumps({
+    "loaded": [m for m in %r if m in sys.modules],
+    "config_loaded": settings._config is not None,
+}))
+""" % (HEAVY_MODULES,)
+
+
+def test_importing_the_agent_defers_heavy_work(tmp_path):
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": os.getcwd()},
+    )
+
+    assert json.loads(proc.stdout) == {"loaded": [], "config_loaded": False}
+    # No log directory is created until something is logged
+    assert not (tmp_path / "logs").exists()
+
+
+def test_graph_and_clients_are_built_on_first_use(sample_resume):
+    agent = InterviewAgent()
+    assert agent._graph is None
+
+    agent.warm_up().join()
+
+    assert agent._graph is not None
+    assert agent.run(sample_resume, name="resume.txt")["status"] == "completed"
@@ -0,0 +1,139 @@
+import pytest
+
+from src.generators.question_generator import QuestionGenerator
+
+
+PROFILE = {"job_role": "Backend Engineer", "skills": ["Python", "Docker"], "experience": "6 years 0 months"}
+TOP_UP = "DO NOT REPEAT OR REPHRASE THESE EXISTING QUESTIONS:"
+
+
+def blocks(*questions):
+    """Text-format response for (type, question) pairs."""
+    return "\n".join(
+        f"{i}. [{q_type}]\n   Question: {question}\n   Evaluating: Something {i}\n"
+        for i, (q_type, question) in enumerate(questions, 1)
+    )
+
+
+@pytest.fixture
+def two_types(offline_settings):
+    interview = offline_settings.config["interview"]
+    interview.update(question_types=["technical", "behavioral"], generation_mode="single", min_questions=1)
+    return offline_settings
+
+
+def respond(settings, *rules):
+    settings.config["llm"]["fake"]["responses"] = [{"match": match, "response": response} for match, response in rules]
+
+
+def summary(questions):
+    return [(q["type"], q["question"]) for q in questions]
+
+
+def test_a_short_response_is_topped_up_with_only_the_missing_questions(two_types):
+    respond(
+        two_types,
+        # The follow-up lists the accepted questions and asks for the missing type only
+        ("Question Types to Generate:\nbehavioral\n", blocks(
+            ("Behavioral", "Tell me about a conflict."), ("Behavioral", "Describe a failure."),
+        )),
+        ("Generate EXACTLY 4", blocks(("Technical", "Why FastAPI?"), ("Technical", "How do you scale Postgres?"))),
+    )
+
+    questions = QuestionGenerator().generate_questions(PROFILE, PROFILE["job_role"], 4)
+
+    assert summary(questions) == [
+        ("technical", "Why FastAPI?"),
+        ("technical", "How do you scale Postgres?"),
+        ("behavioral", "Tell me about a conflict."),
+        ("behavioral", "Describe a failure."),
+    ]
+
+
+def test_the_follow_up_excludes_the_accepted_questions(two_types):
+    respond(
+        two_types,
+        (f"{TOP_UP}\n- Why FastAPI?\n- How do you scale Postgres?", blocks(
+            ("Behavioral", "Tell me about a conflict."), ("Behavioral", "Describe a failure."),
+        )),
+        ("Generate EXACTLY 4", blocks(("Technical", "Why FastAPI?"), ("Technical", "How do you scale Postgres?"))),
+    )
+
+    questions = QuestionGenerator().generate_questions(PROFILE, PROFILE["job_role"], 4)
+
+    assert len(questions) == 4
+
+
+def test_repeated_questions_are_dropped_and_replaced(two_types):
+    respond(
+        two_types,
+        (TOP_UP, blocks(("Technical", "How do you profile a slow endpoint?"))),
+        ("Generate EXACTLY 4", blocks(
+            ("Technical", "Why FastAPI?"),
+            ("Technical", "Why FastAPI!"),
+            ("Behavioral", "Tell me about a conflict."),
+            ("Behavioral", "Describe a failure."),
+        )),
+    )
+
+    questions = QuestionGenerator().generate_questions(PROFILE, PROFILE["job_role"], 4)
+
+    assert summary(questions) == [
+        ("technical", "Why FastAPI?"),
+        ("behavioral", "Tell me about a conflict."),
+        ("behavioral", "Describe a failure."),
+        ("technical", "How do you profile a slow endpoint?"),
+    ]
+
+
+def test_extra_questions_are_capped_at_the_requested_count(two_types):
+    respond(two_types, ("Generate EXACTLY 2", blocks(
+        ("Technical", "Why FastAPI?"), ("Behavioral", "Describe a failure."), ("Behavioral", "Describe a win."),
+    )))
+
+    questions = QuestionGenerator().generate_questions(PROFILE, PROFILE["job_role"], 2)
+
+    assert summary(questions) == [("technical", "Why FastAPI?"), ("behavioral", "Describe a failure.")]
+
+
+def test_no_rounds_keeps_the_short_set(two_types):
+    two_types.config["interview"]["top_up"]["max_rounds"] = 0
+    respond(
+        two_types,
+        (TOP_UP, blocks(("Behavioral", "Tell me about a conflict."))),
+        ("Generate EXACTLY 4", blocks(("Technical", "Why FastAPI?"))),
+    )
+
+    questions = QuestionGenerator().generate_questions(PROFILE, PROFILE["job_role"], 4)
+
+    assert summary(questions) == [("technical", "Why FastAPI?")]
+
+
+def test_a_follow_up_of_repeats_leaves_the_set_short_and_uncached(two_types):
+    two_types.config["cache"]["questions"] = {"enabled": True}
+    respond(
+        two_types,
+        (TOP_UP, blocks(("Technical", "Why FastAPI?"), ("Technical", "Why FastAPI?!"))),
+        ("Generate EXACTLY 4", blocks(("Technical", "Why FastAPI?"))),
+    )
+    generator = QuestionGenerator()
+
+    questions, _ = generator.generate_questions_cached(PROFILE, PROFILE["job_role"], 4)
+    _, outcome = generator.generate_questions_cached(PROFILE, PROFILE["job_role"], 4)
+
+    assert summary(questions) == [("technical", "Why FastAPI?")]
+    assert not outcome["hit"]
+
+
+def test_streamed_questions_are_topped_up_too(two_types):
+    respond(
+        two_types,
+        (TOP_UP, blocks(("Behavioral", "Tell me about a conflict."), ("Behavioral", "Describe a failure."))),
+        ("Generate EXACTLY 4", blocks(("Technical", "Why FastAPI?"), ("Technical", "How do you scale Postgres?"))),
+    )
+    generator = QuestionGenerator()
+
+    streamed = list(generator.stream_questions(PROFILE, PROFILE["job_role"], 4))
+
+    assert streamed == generator.generate_questions(PROFILE, PROFILE["job_role"], 4)
+    assert [q["type"] for q in streamed] == ["technical", "technical", "behavioral", "behavioral"]
@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+import pytest
+
+from src.agent.interview_agent import InterviewAgent
+from src.utils.tracing import (
+    MetricsRegistry,
+    current_run_id,
+    current_stage,
+    record_span,
+    span,
+    start_run,
+)
+
+
+def test_spans_nest_and_land_in_the_run():
+    with start_run("run-1") as trace:
+        with span("outer"):
+            with span("inner", prompt_tokens=12) as inner:
+                assert current_stage() == "inner"
+                inner.set(cache="hit")
+        record_span("measured", 3.0)
+
+    spans = trace.breakdown()["spans"]
+    assert [s["name"] for s in spans] == ["inner", "outer", "measured"]
+    assert spans[0] == {**spans[0], "run_id": "run-1", "parent": "outer", "prompt_tokens": 12, "cache": "hit"}
+    assert current_run_id() is None
+
+
+def test_failures_mark_the_span_and_the_run():
+    with pytest.raises(KeyError):
+        with start_run() as trace:
+            with span("broken"):
+                raise KeyError("x")
+
+    assert trace.status == "failed"
+    assert trace.spans[0].status == "error"
+    assert trace.spans[0].attributes["error"] == "KeyError"
+
+
+def test_run_id_follows_asyncio_tasks_and_threads():
+    async def main():
+        async def child():
+            await asyncio.sleep(0)
+            return current_run_id()
+
+        with start_run("async-run"):
+            return await asyncio.gather(child(), asyncio.to_thread(current_run_id))
+
+    assert asyncio.run(main()) == ["async-run", "async-run"]
+
+
+def test_metrics_histogram_quantiles_and_prometheus_text():
+    registry = MetricsRegistry(buckets=[10, 100])
+    for value in (1, 2, 50, 500):
+        registry.observe("latency_ms", value, stage="parse")
+    registry.increment("runs_total", status="completed")
+
+    histogram = registry.snapshot()["histograms"][0]
+    assert (histogram["count"], histogram["p50"], histogram["p95"]) == (4, 10, float("inf"))
+    assert histogram["buckets"] == {"10": 2, "100": 1, "+Inf": 1}
+
+    text = registry.to_prometheus()
+    assert 'runs_total{status="completed"} 1' in text
+    assert 'latency_ms_bucket{stage="parse",le="100"} 3' in text
+
+
+def test_agent_run_returns_timings_and_exports_spans(offline_settings, tmp_path, sample_resume):
+    offline_settings.config["tracing"] = {
+        "spans_file": str(tmp_path / "spans.jsonl"),
+        "metrics_file": str(tmp_path / "metrics.json"),
+    }
+
+    result = InterviewAgent().run(sample_resume, run_id="traced", name="resume.txt")
+
+    assert result["timings"]["run_id"] == "traced"
+    assert {"node.parse_resume", "node.generate_questions"} <= set(result["timings"]["stages"])
+    spans = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+    assert {s["run_id"] for s in spans} == {"traced"}
+    assert json.loads((tmp_path / "metrics.json").read_text())["counters"]